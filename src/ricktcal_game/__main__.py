@@ -1,8 +1,31 @@
+import argparse
+
 from .game import Game
 
 
-def main():
-    game = Game()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="선새임 몰래 춤추기")
+    parser.add_argument(
+        "--replay", metavar="FILE", help="기록된 판을 다시 재생 (.rtrp 파일)"
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="종료 시 프레임 구간별 시간을 저장 (.csv 또는 .json)",
+    )
+    args = parser.parse_args(argv)
+
+    recording = None
+    if args.replay:
+        from .core.replay import InputRecording
+
+        try:
+            recording = InputRecording.load(args.replay)
+        except (OSError, ValueError) as e:
+            print(f"리플레이 불러오기 실패: {e}")
+            return
+
+    game = Game(replay=recording, profile_path=args.profile)
     game.run()
 
 
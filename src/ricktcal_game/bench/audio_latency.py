@@ -0,0 +1,100 @@
+"""
+입력 이벤트 -> 믹서 재생 지연 측정 (버퍼 크기별 지연과 CPU 사용량 비교)
+
+실행: python -m ricktcal_game.bench.audio_latency [--trials N] [--buffers 128,256,...]
+더미 오디오 드라이버에서도 믹서 콜백은 버퍼 주기마다 실행되므로 버퍼 크기에 따른 지연을 측정할 수 있음
+측정 방법: KEYDOWN 이벤트를 넣은 시각부터, 이벤트 처리 후 게임과 같은 방식(채널 그룹)으로
+재생한 아주 짧은 소리의 재생 종료 이벤트가 도착할 때까지의 시간
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from ..core.config import AUDIO_FREQUENCY
+from ..core.sound_bank import ChannelGroup
+
+DEFAULT_BUFFERS = [128, 256, 512, 1024, 2048, 4096]
+SOUND_END = pygame.USEREVENT + 1
+
+
+def measure_latency(group, blip, trials):
+    """이벤트 -> 재생 완료 지연 목록 (초)"""
+    group.channels[0].set_endevent(SOUND_END)
+    latencies = []
+    for _ in range(trials):
+        pygame.event.clear()
+        posted = time.perf_counter()
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+
+        done = False
+        while not done:
+            for event in pygame.event.get():
+                if event.type == pygame.KEYDOWN:
+                    # EventHandler -> SoundManager.play_sfx()와 같은 경로
+                    group.play(blip)
+                elif event.type == SOUND_END:
+                    latencies.append(time.perf_counter() - posted)
+                    done = True
+            time.sleep(0.0002)
+    return latencies
+
+
+def measure_cpu(seconds):
+    """소리를 계속 재생하는 동안의 CPU 사용률 (믹서 콜백 비용)"""
+    tone = pygame.mixer.Sound(buffer=b"\x00\x10" * 2 * AUDIO_FREQUENCY)
+    tone.play(-1)
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    time.sleep(seconds)
+    usage = (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+    tone.stop()
+    return usage
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="입력 -> 소리 지연 측정")
+    parser.add_argument("--trials", type=int, default=50)
+    parser.add_argument("--cpu-seconds", type=float, default=1.0)
+    parser.add_argument(
+        "--buffers",
+        default=",".join(map(str, DEFAULT_BUFFERS)),
+        help="측정할 버퍼 크기 목록 (쉼표로 구분)",
+    )
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    print(f"오디오 드라이버: {os.environ['SDL_AUDIODRIVER']}, {AUDIO_FREQUENCY}Hz")
+    print(
+        f"{'버퍼':>6}{'버퍼 주기(ms)':>14}{'중앙값(ms)':>12}"
+        f"{'p95(ms)':>10}{'최대(ms)':>10}{'CPU(%)':>9}"
+    )
+    for buffer in [int(value) for value in args.buffers.split(",")]:
+        pygame.mixer.pre_init(AUDIO_FREQUENCY, -16, 2, buffer)
+        pygame.mixer.init()
+        group = ChannelGroup("bench", [0])
+        group.set_volume(1.0)
+        blip = pygame.mixer.Sound(buffer=b"\x00\x00" * 2 * 16)  # 16 샘플
+
+        latencies = sorted(measure_latency(group, blip, args.trials))
+        cpu = measure_cpu(args.cpu_seconds)
+        pygame.mixer.quit()
+
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(
+            f"{buffer:>6}{buffer / AUDIO_FREQUENCY * 1000:>14.1f}"
+            f"{statistics.median(latencies) * 1000:>12.2f}"
+            f"{p95 * 1000:>10.2f}{latencies[-1] * 1000:>10.2f}{cpu * 100:>9.2f}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
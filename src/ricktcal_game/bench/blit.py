@@ -0,0 +1,99 @@
+"""
+스프라이트 blit 마이크로벤치마크 (화면 형식 변환 전/후 비교)
+
+실행: python -m ricktcal_game.bench.blit [--iterations N] [--gif 리소스 이름]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from ..core.config import (
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    STUDENT_DEFAULT_HEIGHT,
+    STUDENT_DEFAULT_WIDTH,
+)
+from ..core.frame_cache import FrameCache
+from ..core.surface_format import classify_alpha, optimize_surface
+
+
+def _as_loaded(surface):
+    """로더와 같은 방식(RGBA 버퍼 -> frombuffer)으로 만든 변환 전 Surface 반환"""
+    return pygame.image.frombuffer(
+        pygame.image.tobytes(surface, "RGBA"), surface.get_size(), "RGBA"
+    )
+
+
+def make_samples(gif_name=None):
+    """벤치마크용 샘플 Surface 목록 (이름, Surface)"""
+    size = (STUDENT_DEFAULT_WIDTH, STUDENT_DEFAULT_HEIGHT)
+    center = (size[0] // 2, size[1] // 2)
+
+    # GIF 프레임처럼 완전 투명/완전 불투명 픽셀만 있는 스프라이트
+    sprite = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (240, 180, 60, 255), center, size[0] // 3)
+
+    # 반투명 픽셀이 있는 스프라이트
+    blended = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(blended, (60, 120, 240, 128), center, size[0] // 3)
+
+    # 타이틀/게임 오버 배경처럼 불투명한 전체 화면 이미지
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    background.fill((50, 70, 100, 255))
+
+    samples = [
+        ("sprite", _as_loaded(sprite)),
+        ("blended", _as_loaded(blended)),
+        ("background", _as_loaded(background)),
+    ]
+
+    if gif_name:
+        animation = FrameCache().load_frames(gif_name, size)
+        samples.append((gif_name.rsplit("/", 1)[-1], animation.pool[0]))
+
+    return samples
+
+
+def time_blits(screen, surface, iterations):
+    """Surface 하나를 반복해서 blit한 평균 시간 (초)"""
+    screen.blit(surface, (0, 0))  # RLE 인코딩 등 첫 blit 비용 제외
+    start = time.perf_counter()
+    for _ in range(iterations):
+        screen.blit(surface, (0, 0))
+    return (time.perf_counter() - start) / iterations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스프라이트 blit 마이크로벤치마크")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument(
+        "--gif",
+        help="실제 GIF 리소스로도 측정 (예: animations/erpin_skill.gif, 첫 프레임 사용)",
+    )
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    print(
+        f"{'샘플':<20}{'투명도':<10}{'변환 전(us)':>12}{'변환 후(us)':>12}{'배율':>8}"
+    )
+    for name, surface in make_samples(args.gif):
+        alpha = classify_alpha(surface)
+        before = time_blits(screen, surface, args.iterations)
+        after = time_blits(screen, optimize_surface(surface), args.iterations)
+        print(
+            f"{name:<20}{alpha:<10}{before * 1e6:>12.1f}{after * 1e6:>12.1f}"
+            f"{before / after:>7.1f}x"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
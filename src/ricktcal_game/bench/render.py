@@ -0,0 +1,77 @@
+"""
+게임 화면 렌더링 방식 비교 (전체 다시 그리기 vs 더티 렉트)
+
+실행: python -m ricktcal_game.bench.render [--frames N]
+같은 입력(춤추기 시작/중지)으로 게임 화면을 렌더링하면서
+프레임당 화면으로 보낸 픽셀 수와 렌더링 시간을 측정
+SCALED 모드(기본값)에서는 두 방식 모두 창 전체를 표시하므로 픽셀 수 절감은
+DISPLAY_SCALED = False일 때만 나타남 (렌더링 시간 차이는 그대로 측정됨)
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from ..core.config import FPS, RENDER_DIRTY, RENDER_FULL
+from ..core.display import scaled_active
+
+
+def run_frames(game, render_mode, frames):
+    """지정한 방식으로 frames 프레임을 렌더링하고 (프레임당 픽셀 수, 렌더링 시간) 반환"""
+    game.renderer.set_render_mode(render_mode)
+    game.initialize_game_elements()
+
+    pixels = []
+    times = []
+    for index in range(frames):
+        # 화면의 절반 동안은 춤추기 (에르핀 애니메이션 상태 전환 포함)
+        game.erpin.dancing = frames // 4 <= index < frames * 3 // 4
+        game.update()
+
+        start = time.perf_counter()
+        game.animation_clock.tick()
+        game.renderer.render()
+        times.append(time.perf_counter() - start)
+        pixels.append(game.renderer.pixels_pushed)
+        game.clock.tick(FPS)
+    return pixels, times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="렌더링 방식별 전송 픽셀 수 비교")
+    parser.add_argument("--frames", type=int, default=240)
+    args = parser.parse_args(argv)
+
+    from ..game import Game
+
+    game = Game()
+    game.loader.finished.wait()
+    screen_pixels = game.screen.get_width() * game.screen.get_height()
+
+    print(
+        f"{'방식':<8}{'평균 픽셀/프레임':>18}{'화면 대비(%)':>14}"
+        f"{'평균 렌더링(ms)':>16}{'중앙값(ms)':>12}"
+    )
+    for render_mode in (RENDER_FULL, RENDER_DIRTY):
+        pixels, times = run_frames(game, render_mode, args.frames)
+        average = statistics.mean(pixels)
+        print(
+            f"{render_mode:<8}{average:>18,.0f}{average / screen_pixels * 100:>14.1f}"
+            f"{statistics.mean(times) * 1000:>16.2f}"
+            f"{statistics.median(times) * 1000:>12.2f}"
+        )
+
+    if scaled_active():
+        print("SCALED 모드: 창 전체를 표시하므로 두 방식의 전송 픽셀 수가 같음")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
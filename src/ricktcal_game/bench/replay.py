@@ -0,0 +1,136 @@
+"""
+리플레이 재생 성능 측정 (기록된 판을 반복 가능한 작업량으로 사용)
+
+실행: python -m ricktcal_game.bench.replay [리플레이 파일] [--repeat N] [--no-render]
+리플레이의 시드와 입력으로 같은 판을 스텝마다 업데이트 + 렌더링하며 시간을 측정하고,
+매 반복의 결과가 기록된 결과와 같은지 확인 (파일을 지정하지 않으면 합성 리플레이 사용)
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from ..core.config import SIM_RATE
+from ..core.replay import (
+    EVENT_KEYDOWN,
+    EVENT_KEYUP,
+    InputRecording,
+    ReplayPlayer,
+)
+
+
+def synthetic_recording(seed=1, seconds=30.0, dance_seconds=1.0, rest_seconds=1.5):
+    """춤추기와 쉬기를 번갈아 반복하고 정해진 시각에 스킬을 두 번 쓰는 합성 리플레이"""
+    events = []
+    step = SIM_RATE  # 1초 뒤부터 시작
+    total_steps = int(seconds * SIM_RATE)
+    while step < total_steps:
+        events.append((step, EVENT_KEYDOWN, pygame.K_SPACE))
+        step += int(dance_seconds * SIM_RATE)
+        events.append((step, EVENT_KEYUP, pygame.K_SPACE))
+        step += int(rest_seconds * SIM_RATE)
+    events += [
+        (total_steps // 3, EVENT_KEYDOWN, pygame.K_z),
+        (total_steps * 2 // 3, EVENT_KEYDOWN, pygame.K_z),
+    ]
+    events.sort(key=lambda event: event[0])
+    return InputRecording(seed, SIM_RATE, 0, events)
+
+
+def run_replay(game, recording, render=True, max_steps=None):
+    """
+    리플레이를 한 번 재생하고 (스텝별 업데이트 시간, 렌더링 시간, 결과) 반환
+    실제 시간과 무관하게 렌더링 한 번마다 정확히 한 스텝씩 진행
+    """
+    if max_steps is None:
+        if recording.result is not None:
+            max_steps = recording.result.steps
+        else:
+            max_steps = int(recording.duration * recording.sim_rate) + SIM_RATE
+
+    game.state_manager.reset_game()
+    game.replay = ReplayPlayer(recording)
+    player = game.replay
+    game.initialize_game_elements()
+
+    update_times = []
+    render_times = []
+    while game.session_step < max_steps and not game.state_manager.game_over:
+        start = time.perf_counter()
+        game.update()
+        update_times.append(time.perf_counter() - start)
+
+        if render:
+            start = time.perf_counter()
+            game.animation_clock.tick()
+            game.renderer.render()
+            render_times.append(time.perf_counter() - start)
+
+    result = game.session_result()
+    return update_times, render_times, result, player.verify(result)
+
+
+def _summary(times):
+    ms = sorted(t * 1000 for t in times)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    return (
+        f"평균 {statistics.mean(ms):.3f}ms, p95 {p95:.3f}ms, "
+        f"최대 {ms[-1]:.3f}ms, 합계 {sum(ms):.0f}ms"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="리플레이 재생 성능 측정")
+    parser.add_argument("replay", nargs="?", help="리플레이 파일 (.rtrp)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-render", action="store_true", help="업데이트만 측정")
+    parser.add_argument("--seed", type=int, default=1, help="합성 리플레이 시드")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        try:
+            recording = InputRecording.load(args.replay)
+        except (OSError, ValueError) as e:
+            print(f"리플레이 불러오기 실패: {e}")
+            return
+    else:
+        recording = synthetic_recording(args.seed)
+
+    from ..game import Game
+
+    game = Game()
+    game.loader.finished.wait()
+    print(
+        f"리플레이: 시드 {recording.seed}, 입력 {len(recording)}개, "
+        f"{recording.duration:.1f}초"
+    )
+
+    results = []
+    for index in range(args.repeat):
+        update_times, render_times, result, mismatches = run_replay(
+            game, recording, render=not args.no_render
+        )
+        results.append(result)
+        status = "결과 불일치: " + "; ".join(mismatches) if mismatches else "일치"
+        print(
+            f"[{index + 1}] {result.steps}스텝, 점수 {result.score:.1f}, "
+            f"사유 {result.reason}, {status}"
+        )
+        print(f"    업데이트: {_summary(update_times)}")
+        if render_times:
+            print(f"    렌더링: {_summary(render_times)}")
+
+    if len(set(results)) > 1:
+        print("반복마다 결과가 다름 (재현되지 않는 난수 또는 입력이 있음)")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+시작 시간 벤치마크 (첫 display.flip까지, resources_loaded까지 걸린 시간)
+
+실행: python -m ricktcal_game.bench.startup [--runs N] [--cold]
+매 실행마다 새 프로세스에서 게임을 시작하므로 import 시간까지 포함됨
+--cold를 주면 실행마다 빈 캐시 디렉터리를 사용 (프레임/폰트 캐시 없음)
+설정과 리플레이는 임시 설정 디렉터리에 저장하므로 사용자 설정을 건드리지 않음
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# 자식 프로세스가 결과 JSON을 출력할 때 붙이는 접두사 (게임 로그와 구분)
+RESULT_PREFIX = "STARTUP_RESULT "
+
+
+def measure(timeout):
+    """현재 프로세스에서 게임을 시작하고 시간 측정 (자식 프로세스에서 실행)"""
+    start = time.perf_counter()
+
+    import pygame
+
+    timings = {}
+    original_flip = pygame.display.flip
+
+    def timed_flip():
+        original_flip()
+        timings.setdefault("first_flip", time.perf_counter() - start)
+
+    pygame.display.flip = timed_flip
+
+    from ..game import Game
+
+    game = Game()
+    timings["init"] = time.perf_counter() - start
+    while time.perf_counter() - start < timeout:
+        game.event_handler.handle_events()
+        game.update()
+        game.renderer.render()
+        if game.resources_loaded:
+            timings.setdefault("resources_loaded", time.perf_counter() - start)
+        if game.loader.finished.is_set():
+            timings["all_loaded"] = time.perf_counter() - start
+            break
+        game.clock.tick(60)
+
+    pygame.quit()
+    return timings
+
+
+def run_child(cache_dir, config_dir, timeout):
+    """
+    새 프로세스에서 measure()를 실행하고 결과 반환
+    :param cache_dir: 자식 프로세스의 캐시 디렉터리
+    :param config_dir: 자식 프로세스의 설정 디렉터리 (설정, 리플레이 저장 위치)
+    """
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["RICKTCAL_CACHE_DIR"] = cache_dir
+    env["RICKTCAL_CONFIG_DIR"] = config_dir
+    result = subprocess.run(
+        [sys.executable, "-m", __spec__.name, "--child", "--timeout", str(timeout)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX) :])
+    raise RuntimeError(f"측정 결과 없음:\n{result.stdout}\n{result.stderr}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--cold", action="store_true", help="실행마다 빈 캐시 사용")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(RESULT_PREFIX + json.dumps(measure(args.timeout)), flush=True)
+        return
+
+    runs = []
+    with (
+        tempfile.TemporaryDirectory() as shared_cache,
+        tempfile.TemporaryDirectory() as config_dir,
+    ):
+        if not args.cold:
+            # 캐시 준비용 실행 (결과 제외)
+            run_child(shared_cache, config_dir, args.timeout)
+        for _ in range(args.runs):
+            if args.cold:
+                with tempfile.TemporaryDirectory() as cache_dir:
+                    runs.append(run_child(cache_dir, config_dir, args.timeout))
+            else:
+                runs.append(run_child(shared_cache, config_dir, args.timeout))
+
+    mode = "cold" if args.cold else "warm"
+    print(f"시작 시간 ({mode}, {args.runs}회, 단위 ms)")
+    print(f"{'항목':<20}{'중앙값':>10}{'최소':>10}{'최대':>10}")
+    for name in ["init", "first_flip", "resources_loaded", "all_loaded"]:
+        values = [run[name] * 1000 for run in runs if name in run]
+        if not values:
+            print(f"{name:<20}{'-':>10}{'-':>10}{'-':>10}")
+            continue
+        print(
+            f"{name:<20}{statistics.median(values):>10.1f}"
+            f"{min(values):>10.1f}{max(values):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+import queue
+import threading
+from collections import OrderedDict
+
+from ..core.config import ANIMATION_MEMORY_BUDGET
+
+
+def frame_nbytes(frame):
+    """프레임이 차지하는 픽셀 메모리 크기 (바이트)"""
+    return frame.get_width() * frame.get_height() * frame.get_bytesize()
+
+
+class AnimationStore:
+    """
+    애니메이션 상태별 프레임을 처음 요청될 때 로드하고,
+    메모리 예산을 넘으면 가장 오래 사용되지 않은 상태부터 해제하는 저장소
+
+    같은 캐릭터의 애니메이션끼리 동일한 프레임은 하나의 Surface를 공유하며,
+    공유 프레임은 참조하는 상태가 모두 해제되어야 메모리에서 빠짐
+    """
+
+    def __init__(self, loader, budget_bytes=ANIMATION_MEMORY_BUDGET, finalize=None):
+        """
+        :param loader: 키를 받아 AnimationFrames를 반환하는 함수
+        :param budget_bytes: 메모리에 유지할 프레임의 최대 크기 (바이트)
+        :param finalize: 새 프레임을 화면 형식으로 변환하는 함수 (화면 생성 전에는 원본 반환)
+        """
+        self.loader = loader
+        self.budget_bytes = budget_bytes
+        self.finalize = finalize
+
+        # 키 -> (프레임 목록, 참조하는 공유 프레임 키 목록, 프레임 시간표), 뒤쪽일수록 최근에 사용됨
+        self._entries = OrderedDict()
+
+        # (카테고리, 캐릭터, 프레임 해시) -> [Surface, 참조 수, 화면 형식 변환 여부]
+        self._shared_frames = {}
+        self._lock = threading.RLock()
+        self.used_bytes = 0
+
+        # 현재 화면에 그려지는 상태들 (해제 대상에서 제외)
+        self.pinned = set()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # 미리 로드(prefetch) 요청 처리용 백그라운드 스레드
+        self._prefetch_queue = queue.Queue()
+        self._prefetch_thread = None
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key):
+        """키에 해당하는 프레임 목록 반환 (없으면 즉시 로드)"""
+        return self.get_animation(key)[0]
+
+    def get_animation(self, key):
+        """키에 해당하는 (프레임 목록, 프레임 시간표) 반환 (없으면 즉시 로드)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], entry[2]
+            self.misses += 1
+
+        # 로드는 잠금 밖에서 수행 (prefetch 스레드와 동시에 로드되더라도 결과는 같음)
+        animation = self.loader(key)
+        return self.put(key, animation), animation.timeline
+
+    def put(self, key, animation):
+        """
+        로드된 AnimationFrames를 저장소에 등록하고 재생 순서대로 나열한 프레임 목록 반환
+        이미 같은 캐릭터의 다른 상태에 있는 프레임은 기존 Surface를 재사용
+        """
+        category, name = key[0], key[1]
+        with self._lock:
+            self._release(key)
+
+            pool = []
+            shared_keys = []
+            for digest, surface in zip(animation.digests, animation.pool):
+                shared_key = (category, name, digest)
+                slot = self._shared_frames.get(shared_key)
+                if slot is None:
+                    slot = self._shared_frames[shared_key] = self._new_slot(surface)
+                    self.used_bytes += frame_nbytes(slot[0])
+                slot[1] += 1
+                pool.append(slot[0])
+                shared_keys.append(shared_key)
+
+            frames = [pool[index] for index in animation.indices]
+            self._entries[key] = (frames, shared_keys, animation.timeline)
+            self._evict(keep=key)
+            return frames
+
+    def finalize_all(self):
+        """화면 생성 전에 로드되어 아직 변환되지 않은 프레임을 모두 화면 형식으로 변환"""
+        if self.finalize is None:
+            return
+        with self._lock:
+            replaced = {}
+            for slot in self._shared_frames.values():
+                if slot[2]:
+                    continue
+                converted = self._new_slot(slot[0])
+                if converted[2]:
+                    self.used_bytes += frame_nbytes(converted[0]) - frame_nbytes(
+                        slot[0]
+                    )
+                    replaced[id(slot[0])] = converted[0]
+                    slot[0], slot[2] = converted[0], True
+
+            for frames, _, _ in self._entries.values():
+                frames[:] = [replaced.get(id(frame), frame) for frame in frames]
+
+    def _new_slot(self, surface):
+        """공유 프레임 슬롯 생성 (가능하면 화면 형식으로 변환)"""
+        if self.finalize is None:
+            return [surface, 0, False]
+        converted = self.finalize(surface)
+        return [converted, 0, converted is not surface]
+
+    def discard(self, key):
+        """특정 상태의 프레임을 메모리에서 해제"""
+        with self._lock:
+            self._release(key)
+
+    def dedup_stats(self, category, name):
+        """
+        캐릭터의 현재 로드된 상태들에 대한 중복 제거 통계
+        :return: (전체 프레임 수, 고유 프레임 수, 절약한 바이트 수)
+        """
+        with self._lock:
+            total_frames = 0
+            total_bytes = 0
+            unique_keys = set()
+            for key, (frames, shared_keys, _) in self._entries.items():
+                if key[0] != category or key[1] != name:
+                    continue
+                total_frames += len(frames)
+                total_bytes += sum(frame_nbytes(frame) for frame in frames)
+                unique_keys.update(shared_keys)
+            unique_bytes = sum(
+                frame_nbytes(self._shared_frames[shared_key][0])
+                for shared_key in unique_keys
+            )
+            return total_frames, len(unique_keys), total_bytes - unique_bytes
+
+    def _release(self, key):
+        """상태를 제거하고, 더 이상 참조되지 않는 공유 프레임을 해제"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for shared_key in entry[1]:
+            slot = self._shared_frames[shared_key]
+            slot[1] -= 1
+            if slot[1] == 0:
+                del self._shared_frames[shared_key]
+                self.used_bytes -= frame_nbytes(slot[0])
+
+    def prefetch(self, keys):
+        """곧 필요할 것으로 예상되는 상태들을 백그라운드에서 미리 로드"""
+        for key in keys:
+            if key not in self:
+                self._prefetch_queue.put(key)
+
+        if self._prefetch_thread is None:
+            self._prefetch_thread = threading.Thread(
+                target=self._prefetch_worker, daemon=True
+            )
+            self._prefetch_thread.start()
+
+    def _prefetch_worker(self):
+        """prefetch 큐에 들어온 상태를 순서대로 로드"""
+        while True:
+            key = self._prefetch_queue.get()
+            if key in self:
+                continue
+            try:
+                self.put(key, self.loader(key))
+            except Exception as e:
+                print(f"애니메이션 미리 로드 실패 {key}: {e}")
+
+    def _evict(self, keep=None):
+        """메모리 예산을 넘는 동안 가장 오래된 상태부터 해제"""
+        for key in list(self._entries):
+            if self.used_bytes <= self.budget_bytes:
+                break
+            if key == keep or key in self.pinned:
+                continue
+            self._release(key)
+            self.evictions += 1
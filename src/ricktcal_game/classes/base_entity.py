@@ -1,10 +1,92 @@
+import math
+
+from .entity_store import ANIMATION_STATES, KIND_STUDENT, STATE_CODES, EntityStore
+
+
+class StoreField:
+    """EntityStore 배열의 한 칸을 엔티티 속성처럼 읽고 쓰는 디스크립터"""
+
+    def __init__(self, cast=None, encode=None, field=None):
+        """
+        :param cast: 배열 값을 파이썬 값으로 바꾸는 함수 (bool, int, float 등)
+        :param encode: 파이썬 값을 배열에 저장할 값으로 바꾸는 함수 (None 처리 등)
+        :param field: 저장소 배열 이름 (None이면 속성 이름과 같음)
+        """
+        self.cast = cast
+        self.encode = encode
+        self.name = field
+
+    def __set_name__(self, owner, name):
+        if self.name is None:
+            self.name = name
+
+    def __get__(self, entity, owner=None):
+        if entity is None:
+            return self
+        value = getattr(entity.store, self.name)[entity.index]
+        return self.cast(value) if self.cast is not None else value
+
+    def __set__(self, entity, value):
+        if self.encode is not None:
+            value = self.encode(value)
+        getattr(entity.store, self.name)[entity.index] = value
+
+
+def optional_time(value):
+    """NaN(기록 없음)을 None으로 바꾸는 변환 함수"""
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def encode_optional_time(value):
+    """None(기록 없음)을 NaN으로 바꾸는 변환 함수"""
+    return math.nan if value is None else value
+
+
 class Entity:
-    """모든 게임 엔티티의 기본 클래스"""
+    """
+    모든 게임 엔티티의 기본 클래스
+    상태는 EntityStore의 배열에 있고, 엔티티 객체는 그중 한 행을 가리키는 뷰
+    """
+
+    entity_type = "generic"  # 엔티티 타입 식별용
+    kind = KIND_STUDENT  # 저장소에 기록할 엔티티 종류
+
+    x = StoreField(float)
+    y = StoreField(float)
+    frame = StoreField(int)  # 이번 렌더링 프레임에 표시할 애니메이션 프레임 인덱스
+
+    def __init__(self, store=None):
+        """:param store: 상태를 보관할 엔티티 저장소 (None이면 이 엔티티 전용으로 생성)"""
+        self.store = store if store is not None else EntityStore()
+        self.index = self.store.add(self, self.kind)
+        self.name = self.entity_type
+
+    @property
+    def name(self):
+        """캐릭터 이름 (스프라이트와 위치 정보를 찾는 데 사용)"""
+        return self.store.characters[self.store.character[self.index]]
+
+    @name.setter
+    def name(self, name):
+        self.store.character[self.index] = self.store.character_code(name)
+
+    @property
+    def position(self):
+        return (int(self.x), int(self.y))
+
+    @position.setter
+    def position(self, pos):
+        self.x, self.y = pos
+
+    @property
+    def animation_state(self):
+        """현재 애니메이션 상태 이름 (ANIMATION_FILES의 상태)"""
+        return ANIMATION_STATES[self.store.anim_state[self.index]]
 
-    def __init__(self):
-        self.last_update = 0
-        self.animation_frame = 0
-        self.entity_type = "generic"  # 엔티티 타입 식별용
+    @animation_state.setter
+    def animation_state(self, state):
+        self.store.anim_state[self.index] = STATE_CODES[state]
 
     def update(self, current_time):
         """엔티티 상태 업데이트 (모든 서브클래스에서 구현)"""
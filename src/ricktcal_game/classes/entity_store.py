@@ -0,0 +1,306 @@
+import math
+
+import numpy as np
+
+from ..core.config import (
+    ENTITY_STORE_CAPACITY,
+    FOLLOWER_DANCE_AFTER,
+    FOLLOWER_IDLE_3_DURATION,
+    TEACHER_BOUNCE_DURATION,
+    TEACHER_BOUNCE_HEIGHT,
+    TEACHER_TURN_MAX_DELAY,
+    TEACHER_TURN_MIN_DELAY,
+)
+
+# 엔티티 종류
+KIND_TEACHER = 0
+KIND_STUDENT = 1
+KIND_CATEGORIES = {KIND_TEACHER: "teachers", KIND_STUDENT: "students"}
+
+# 애니메이션 상태 이름 <-> 코드 (ANIMATION_FILES의 상태 이름)
+ANIMATION_STATES = (
+    "idle",
+    "dance",
+    "skill",
+    "idle_1",
+    "idle_2",
+    "idle_3",
+    "dance_1",
+    "dance_2",
+    "front",
+    "back",
+)
+STATE_CODES = {name: code for code, name in enumerate(ANIMATION_STATES)}
+NO_STATE = -1  # 아직 그려지지 않은 엔티티의 표시 상태
+
+# 따라 추는 학생(죠안 등)이 춤을 새로 시작할 때 고르는 애니메이션
+FOLLOWER_DANCES = ("dance_1", "dance_2")
+
+# 필드 이름 -> (dtype, 새 엔티티의 기본값)
+FIELDS = {
+    "kind": (np.int8, KIND_STUDENT),
+    "character": (np.int16, 0),  # 캐릭터 이름 코드 (EntityStore.characters 인덱스)
+    "x": (np.float32, 0.0),
+    "y": (np.float32, 0.0),
+    # 애니메이션: 상태, 표시 중인 상태와 시작 시각(애니메이션 시계 ms), 프레임 인덱스
+    "anim_state": (np.int16, STATE_CODES["idle"]),
+    "drawn_state": (np.int16, NO_STATE),
+    "anim_start": (np.float64, 0.0),
+    "frame": (np.int32, 0),
+    # 학생
+    "dancing": (np.bool_, False),
+    "using_skill": (np.bool_, False),
+    "follower": (np.bool_, False),  # 플레이어 캐릭터를 따라 상태가 바뀌는 학생
+    "leader_was_dancing": (np.bool_, False),
+    "last_dance_end_time": (np.float64, math.nan),  # 플레이어가 춤을 멈춘 시각 (초)
+    "dance_anim": (np.int16, NO_STATE),  # 지금 추고 있는 춤 애니메이션
+    # 선생님: 방향 전환 타이머 (ms)와 바운스 애니메이션
+    "facing_away": (np.bool_, True),
+    "last_turn_time": (np.float64, 0.0),
+    "turn_delay": (np.float64, 0.0),
+    "is_bouncing": (np.bool_, False),
+    "bounce_start_time": (np.float64, 0.0),
+    "bounce_offset": (np.int32, 0),
+    "prev_bounce_offset": (np.int32, 0),
+}
+
+
+class EntityStore:
+    """
+    모든 엔티티의 상태를 필드별 NumPy 배열(struct-of-arrays)로 보관하는 저장소
+    선생님 방향 전환, 학생 상태 전환, 애니메이션 프레임 선택을 엔티티 하나씩이 아니라
+    배열 연산으로 한 번에 처리 (엔티티 클래스는 이 배열의 한 행을 가리키는 뷰)
+    """
+
+    def __init__(self, capacity=ENTITY_STORE_CAPACITY):
+        self.count = 0
+        self.capacity = max(1, capacity)
+        self.views = []  # 행 인덱스 -> 엔티티 뷰 객체
+        self.characters = []  # 캐릭터 이름 코드 -> 이름
+        self._character_codes = {}
+        # 종류별 / 따라 추는 학생 행 인덱스 (매 스텝 다시 찾지 않도록 보관, 엔티티 추가 시 초기화)
+        self._rows = {}
+        for name, (dtype, default) in FIELDS.items():
+            setattr(self, name, np.full(self.capacity, default, dtype=dtype))
+
+    def __len__(self):
+        return self.count
+
+    def add(self, view, kind):
+        """
+        새 엔티티 행을 기본값으로 추가
+        :param view: 이 행을 가리키는 엔티티 뷰 객체
+        :param kind: KIND_TEACHER 또는 KIND_STUDENT
+        :return: 행 인덱스
+        """
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+        index = self.count
+        for name, (_, default) in FIELDS.items():
+            getattr(self, name)[index] = default
+        self.kind[index] = kind
+        self.views.append(view)
+        self.count += 1
+        self._rows.clear()
+        return index
+
+    def _grow(self, capacity):
+        """배열 크기를 늘림 (뷰는 행 인덱스만 가지므로 그대로 유효)"""
+        for name, (dtype, default) in FIELDS.items():
+            array = np.full(capacity, default, dtype=dtype)
+            array[: self.count] = getattr(self, name)[: self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def character_code(self, name):
+        """캐릭터 이름의 코드 (처음 보는 이름이면 새로 등록)"""
+        code = self._character_codes.get(name)
+        if code is None:
+            code = self._character_codes[name] = len(self.characters)
+            self.characters.append(name)
+        return code
+
+    def set_follower(self, index, follower=True):
+        """행을 플레이어 캐릭터를 따라 상태가 바뀌는 학생으로 지정 (또는 해제)"""
+        self.follower[index] = follower
+        self._rows.pop("follower", None)
+
+    def rows(self, kind=None):
+        """엔티티 행 인덱스 배열 (kind를 주면 해당 종류만)"""
+        if kind is None:
+            return np.arange(self.count)
+        rows = self._rows.get(kind)
+        if rows is None:
+            rows = self._rows[kind] = np.flatnonzero(self.kind[: self.count] == kind)
+        return rows
+
+    def follower_rows(self):
+        """따라 추는 학생 행 인덱스 배열"""
+        rows = self._rows.get("follower")
+        if rows is None:
+            rows = self._rows["follower"] = np.flatnonzero(self.follower[: self.count])
+        return rows
+
+    def any_watching(self):
+        """정면을 보고 있는 선생님이 하나라도 있는지"""
+        return not self.facing_away[self.rows(KIND_TEACHER)].all()
+
+    def update_teachers(self, current_time, rng, rows=None):
+        """
+        선생님들의 방향 전환 타이머와 바운스 애니메이션을 한 번에 업데이트
+        :param current_time: 현재 시각 (ms)
+        :param rng: 다음 전환 간격을 뽑을 난수 생성기 (random.Random)
+        :param rows: 업데이트할 행 (None이면 모든 선생님)
+        :return: 이번에 방향을 바꾼 선생님 행 인덱스 배열
+        """
+        if rows is None:
+            rows = self.rows(KIND_TEACHER)
+        rows = np.asarray(rows, dtype=np.intp)
+
+        turned = rows[current_time - self.last_turn_time[rows] > self.turn_delay[rows]]
+        if turned.size:
+            self.facing_away[turned] = ~self.facing_away[turned]
+            self.last_turn_time[turned] = current_time
+            # 리플레이가 같은 결과를 내도록 난수는 행 순서대로 하나씩 뽑음
+            for index in turned:
+                self.turn_delay[index] = rng.uniform(
+                    TEACHER_TURN_MIN_DELAY, TEACHER_TURN_MAX_DELAY
+                )
+            # 방향 전환 시 바운스 애니메이션 시작
+            self.is_bouncing[turned] = True
+            self.bounce_start_time[turned] = current_time
+            self.bounce_offset[turned] = 0
+
+        self.update_bounces(current_time, rows)
+        return turned
+
+    def update_bounces(self, current_time, rows):
+        """바운스 애니메이션 업데이트 (사인 곡선으로 위로 튀었다가 돌아옴)"""
+        rows = np.asarray(rows, dtype=np.intp)
+        self.prev_bounce_offset[rows] = self.bounce_offset[rows]
+        bouncing = rows[self.is_bouncing[rows]]
+        if not bouncing.size:
+            return
+
+        elapsed = current_time - self.bounce_start_time[bouncing]
+        progress = np.minimum(1.0, elapsed / TEACHER_BOUNCE_DURATION)
+        finished = progress >= 1.0
+        self.is_bouncing[bouncing[finished]] = False
+        # 위로 올라가는 것이므로 음수 (정수 변환은 int()처럼 0 방향으로 버림)
+        offsets = -np.trunc(TEACHER_BOUNCE_HEIGHT * np.sin(np.pi * progress))
+        offsets[finished] = 0
+        self.bounce_offset[bouncing] = offsets
+
+    def update_followers(
+        self, game_time, leader_dancing, rng, has_leader=True, rows=None
+    ):
+        """
+        플레이어 캐릭터를 따라 상태가 바뀌는 학생들을 한 번에 업데이트
+        FOLLOWER_DANCE_AFTER초 전에는 플레이어가 춤추는 동안 idle_2, 멈춘 뒤
+        FOLLOWER_IDLE_3_DURATION초 동안 idle_3, 그 이후에는 플레이어와 함께 춤
+        :param game_time: 인게임 경과 시간 (초)
+        :param leader_dancing: 플레이어 캐릭터가 춤추고 있는지
+        :param rng: 춤 애니메이션을 고를 난수 생성기 (random.Random)
+        :param has_leader: 플레이어 캐릭터가 있는지 (없으면 idle_1)
+        :param rows: 업데이트할 행 (None이면 모든 따라 추는 학생)
+        """
+        if rows is None:
+            rows = self.follower_rows()
+        rows = np.asarray(rows, dtype=np.intp)
+        if not rows.size:
+            return
+
+        if game_time >= FOLLOWER_DANCE_AFTER:
+            if has_leader and leader_dancing:
+                self.dancing[rows] = True
+                # 춤을 새로 시작할 때만 애니메이션을 고름 (행 순서대로 난수 사용)
+                starting = rows[
+                    ~self.leader_was_dancing[rows] | (self.dance_anim[rows] == NO_STATE)
+                ]
+                for index in starting:
+                    self.dance_anim[index] = STATE_CODES[rng.choice(FOLLOWER_DANCES)]
+                self.anim_state[rows] = self.dance_anim[rows]
+                self.leader_was_dancing[rows] = True
+            else:
+                self.dancing[rows] = False
+                self.anim_state[rows] = STATE_CODES["idle_1"]
+                self.dance_anim[rows] = NO_STATE
+                self.leader_was_dancing[rows] = False
+            return
+
+        if not has_leader:
+            self.anim_state[rows] = STATE_CODES["idle_1"]
+        elif leader_dancing:
+            self.anim_state[rows] = STATE_CODES["idle_2"]
+            self.leader_was_dancing[rows] = True
+            self.last_dance_end_time[rows] = math.nan
+        else:
+            stopped = rows[self.leader_was_dancing[rows]]
+            self.last_dance_end_time[stopped] = game_time
+            self.leader_was_dancing[rows] = False
+
+            # 기록이 없는 행(NaN)은 두 비교 모두 거짓이므로 idle_1
+            since_end = game_time - self.last_dance_end_time[rows]
+            self.anim_state[rows] = np.where(
+                since_end < FOLLOWER_IDLE_3_DURATION,
+                STATE_CODES["idle_3"],
+                STATE_CODES["idle_1"],
+            )
+            self.last_dance_end_time[rows[since_end >= FOLLOWER_IDLE_3_DURATION]] = (
+                math.nan
+            )
+
+    def refresh_animation_states(self):
+        """
+        플래그로 정해지는 애니메이션 상태를 한 번에 갱신
+        선생님은 방향(back/front), 플레이어 학생은 스킬/춤/대기 (따라 추는 학생은 그대로)
+        """
+        count = self.count
+        kind = self.kind[:count]
+        teachers = kind == KIND_TEACHER
+        self.anim_state[:count][teachers] = np.where(
+            self.facing_away[:count][teachers],
+            STATE_CODES["back"],
+            STATE_CODES["front"],
+        )
+
+        players = (kind == KIND_STUDENT) & ~self.follower[:count]
+        self.anim_state[:count][players] = np.select(
+            [self.using_skill[:count][players], self.dancing[:count][players]],
+            [STATE_CODES["skill"], STATE_CODES["dance"]],
+            STATE_CODES["idle"],
+        )
+
+    def advance_frames(self, now, timeline_for):
+        """
+        모든 엔티티의 이번 프레임 인덱스 계산
+        애니메이션 상태가 바뀐 엔티티는 now부터 첫 프레임으로 재생하고,
+        같은 (캐릭터, 상태)인 엔티티끼리 묶어 시간표를 이진 탐색
+        :param now: 애니메이션 시계의 이번 프레임 시각 (ms)
+        :param timeline_for: (종류, 캐릭터 이름, 상태 이름) -> AnimationTimeline 함수
+        """
+        count = self.count
+        if not count:
+            return
+        self.refresh_animation_states()
+
+        state = self.anim_state[:count]
+        changed = np.flatnonzero(state != self.drawn_state[:count])
+        self.drawn_state[changed] = state[changed]
+        self.anim_start[changed] = now
+
+        # (종류, 캐릭터, 상태)를 하나의 정수 키로 묶어 그룹별로 처리
+        groups = (
+            self.kind[:count].astype(np.int64) * len(self.characters)
+            + self.character[:count]
+        ) * len(ANIMATION_STATES) + state
+        elapsed = now - self.anim_start[:count]
+        for group in np.unique(groups):
+            rows = np.flatnonzero(groups == group)
+            first = rows[0]
+            timeline = timeline_for(
+                KIND_CATEGORIES[int(self.kind[first])],
+                self.characters[self.character[first]],
+                ANIMATION_STATES[state[first]],
+            )
+            self.frame[rows] = timeline.frames_at(elapsed[rows])
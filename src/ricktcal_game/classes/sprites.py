@@ -1,97 +1,368 @@
+import argparse
+import multiprocessing
 import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import pygame
-from PIL import Image, ImageSequence
 
+from ..core.animation_clock import AnimationClock, AnimationTimeline
+from ..core.asset_archive import get_assets
 from ..core.config import *
+from ..core.frame_cache import AnimationFrames, FrameCache
+from ..core.frame_decoder import decode_animation
+from ..core.surface_format import optimize_surface
+from .animation_store import AnimationStore
+from .transform_cache import SpriteTransform, TransformCache
+
+ANIMATION_DIR = "animations"  # 리소스 아카이브 안의 애니메이션 디렉터리
+
+# (카테고리, 캐릭터, 애니메이션 상태) -> (GIF 파일 이름, 좌우 반전 여부)
+ANIMATION_FILES = {
+    # 학생 캐릭터 애니메이션
+    ("students", "erpin", "idle"): ("erpin_idle.gif", False),
+    ("students", "erpin", "dance"): ("erpin_dance_1.gif", False),
+    ("students", "erpin", "skill"): ("erpin_skill.gif", False),
+    # 죠안 애니메이션
+    ("students", "joanne", "idle_1"): ("joanne_idle_1.gif", False),
+    ("students", "joanne", "idle_2"): ("joanne_idle_2.gif", False),
+    ("students", "joanne", "idle_3"): ("joanne_idle_3.gif", False),
+    ("students", "joanne", "dance_1"): ("joanne_dance_1.gif", False),
+    ("students", "joanne", "dance_2"): ("joanne_dance_2.gif", False),
+    # 선생님 캐릭터 애니메이션
+    ("teachers", "sherum", "front"): ("sherum_front.gif", True),
+    ("teachers", "sherum", "back"): ("sherum_back.gif", False),
+}
+
+# 그릴 때 변형을 적용할 애니메이션 상태 (변형 결과는 TransformCache에 보관)
+STATE_TRANSFORMS = {
+    # joanne의 idle_2만 좌우 반전
+    ("students", "joanne", "idle_2"): SpriteTransform(flip_x=True),
+}
+
+# 현재 상태 -> 다음에 나올 가능성이 높은 상태 (미리 로드 힌트)
+PREFETCH_HINTS = {
+    ("students", "erpin", "idle"): ["dance", "skill"],
+    ("students", "erpin", "dance"): ["idle", "skill"],
+    ("students", "erpin", "skill"): ["dance", "idle"],
+    ("students", "joanne", "idle_1"): ["idle_2", "dance_1", "dance_2"],
+    ("students", "joanne", "idle_2"): ["idle_3"],
+    ("students", "joanne", "idle_3"): ["idle_1", "idle_2"],
+    ("students", "joanne", "dance_1"): ["idle_1"],
+    ("students", "joanne", "dance_2"): ["idle_1"],
+    ("teachers", "sherum", "back"): ["front"],
+    ("teachers", "sherum", "front"): ["back"],
+}
+
+
+# ANIMATION_FILES 외에 화면에서 사용하는 애니메이션 (리소스 이름, 프레임 크기)
+EXTRA_ANIMATIONS = [
+    (f"{ANIMATION_DIR}/sherum_gameover.gif", GAMEOVER_ANIMATION_SIZE),
+]
+
+
+def frame_size(is_teacher):
+    """캐릭터 종류에 따른 프레임 크기 반환 (선생님은 더 큰 크기 적용)"""
+    if is_teacher:
+        return (TEACHER_DEFAULT_WIDTH, TEACHER_DEFAULT_HEIGHT)
+    return (STUDENT_DEFAULT_WIDTH, STUDENT_DEFAULT_HEIGHT)
+
+
+def frame_variants():
+    """
+    게임이 사용하는 프레임 크기 변형 목록 [(리소스 이름, 크기, 반전 여부)]
+    화면은 논리 해상도에 그리고 마지막에 한 번만 확대하므로, 이 크기들만 있으면
+    실행 중에 스프라이트 크기를 조정할 일이 없음
+    """
+    variants = {}
+    for key, (filename, flip) in ANIMATION_FILES.items():
+        name = f"{ANIMATION_DIR}/{filename}"
+        variants[(name, frame_size(key[0] == "teachers"), flip)] = None
+    for name, size in EXTRA_ANIMATIONS:
+        variants[(name, size, False)] = None
+    return list(variants)
+
+
+def bake_frame_variants(frame_cache=None):
+    """
+    모든 프레임 크기 변형을 미리 디코딩하여 프레임 캐시에 저장
+    :return: (새로 만든 변형 수, 이미 있던 변형 수, 원본이 없는 변형 수)
+    """
+    frame_cache = frame_cache or FrameCache()
+    assets = get_assets()
+    baked = cached = missing = 0
+    for name, size, flip in frame_variants():
+        if not assets.exists(name):
+            missing += 1
+            continue
+        if frame_cache.load_cached(name, size, flip) is not None:
+            cached += 1
+            continue
+        data, digest = frame_cache.read_source(name)
+        frame_cache.store_frames(
+            name, digest, size, flip, decode_animation(data, size, flip)
+        )
+        baked += 1
+    return baked, cached, missing
+
+
+def main(argv=None):
+    """프레임 크기 변형 생성 명령 (python -m ricktcal_game.classes.sprites)"""
+    parser = argparse.ArgumentParser(
+        description="스프라이트 프레임 크기 변형 미리 생성"
+    )
+    parser.add_argument("--cache-dir", help="프레임 캐시 디렉터리 (기본: 사용자 캐시)")
+    args = parser.parse_args(argv)
+
+    baked, cached, missing = bake_frame_variants(FrameCache(args.cache_dir))
+    print(
+        f"프레임 크기 변형 생성 완료: 새로 생성 {baked}개, "
+        f"기존 캐시 {cached}개, 원본 없음 {missing}개"
+    )
+    return 0
 
 
 class SpriteManager:
-    def __init__(self, position_manager, preload=False):
+    def __init__(self, position_manager, preload=False, clock=None):
         self.position_manager = position_manager
+        self.frame_cache = FrameCache()
 
-        # 캐릭터 타입별 애니메이션 프레임 저장소
-        self.animations = {"teachers": {}, "students": {}}
+        # 애니메이션 공통 시계 (렌더링 프레임마다 tick, 프레임은 GIF 표시 시간으로 선택)
+        self.clock = clock if clock is not None else AnimationClock()
+
+        # 애니메이션 프레임 저장소 (처음 요청될 때 로드, 메모리 예산 초과 시 LRU 해제)
+        # 새로 들어온 프레임은 화면 형식(색상 키+RLE / convert / convert_alpha)으로 변환
+        self.store = AnimationStore(self._load_state, finalize=optimize_surface)
+
+        # 반전 등 변형된 프레임 캐시 (매 프레임 새 Surface를 만들지 않도록 함)
+        self.transforms = TransformCache()
+
+        # 엔티티별 마지막으로 그린 애니메이션 상태 (상태 전환 시 미리 로드 힌트에 사용)
+        self._current_states = {}
+
+        # 사전 로드 상태: 캐시에서 읽은 애니메이션과 디코딩 중인 작업
+        self._preload_lock = threading.Lock()
+        self._preloaded = {}
+        self._pending = {}
+        self._executor = None
 
         if preload:
             self._preload_animations()
 
     def _preload_animations(self):
-        """모든 애니메이션 프레임 사전 로드"""
+        """모든 애니메이션 프레임 사전 로드 (캐시에 없는 GIF는 병렬 디코딩)"""
         try:
-            # 학생 캐릭터 애니메이션 로드
-            self.animations["students"]["erpin"] = {
-                "idle": self.load_animation_frames("erpin_idle.gif"),
-                "dance": self.load_animation_frames("erpin_dance_1.gif"),
-                "skill": self.load_animation_frames("erpin_skill.gif"),
-            }
-
-            # 죠안 애니메이션 추가
-            self.animations["students"]["joanne"] = {
-                "idle_1": self.load_animation_frames("joanne_idle_1.gif"),
-                "idle_2": self.load_animation_frames("joanne_idle_2.gif"),
-                "idle_3": self.load_animation_frames("joanne_idle_3.gif"),
-                "dance_1": self.load_animation_frames("joanne_dance_1.gif"),
-                "dance_2": self.load_animation_frames("joanne_dance_2.gif"),
-            }
-
-            # 선생님 캐릭터 애니메이션 로드
-            self.animations["teachers"]["sherum"] = {
-                "front": self.load_animation_frames(
-                    "sherum_front.gif", flip=True, is_teacher=True
-                ),
-                "back": self.load_animation_frames("sherum_back.gif", is_teacher=True),
-            }
+            self.begin_preload(ANIMATION_FILES)
+            for key in ANIMATION_FILES:
+                try:
+                    self.complete_preload(key)
+                except FileNotFoundError as e:
+                    print(e)
 
             print("모든 애니메이션 프레임 로드 완료")
+            self._report_dedup()
         except Exception as e:
             print(f"애니메이션 로드 오류: {e}")
+        finally:
+            self.end_preload()
+
+    def begin_preload(self, keys):
+        """
+        애니메이션 사전 로드 시작: 캐시에 없는 GIF는 주어진 순서대로 프로세스 풀에 제출
+        작업 프로세스는 크기 조정 및 중복 제거된 RGBA 바이트만 만들고,
+        Surface 생성은 complete_preload()를 호출한 스레드에서 처리
+        """
+        decode_jobs = []
+        for key in keys:
+            filename, flip = ANIMATION_FILES[key]
+            gif_name = f"{ANIMATION_DIR}/{filename}"
+            if not get_assets().exists(gif_name):
+                continue  # complete_preload()에서 실패로 보고
+
+            size = self._frame_size(key[0] == "teachers")
+            animation = self.frame_cache.load_cached(gif_name, size, flip)
+            if animation:
+                self._preloaded[key] = animation
+            else:
+                # 작업 프로세스로 보내야 하므로 아카이브 슬라이스를 bytes로 복사
+                data, digest = self.frame_cache.read_source(gif_name)
+                decode_jobs.append((key, (gif_name, bytes(data), digest, size, flip)))
+
+        if decode_jobs:
+            self._executor = self._create_executor(len(decode_jobs))
+
+        with self._preload_lock:
+            for key, job in decode_jobs:
+                future = None
+                if self._executor is not None:
+                    _, data, _, size, flip = job
+                    future = self._executor.submit(decode_animation, data, size, flip)
+                self._pending[key] = (job, future)
+
+    def complete_preload(self, key):
+        """
+        애니메이션 하나의 로드를 마치고 저장소에 등록
+        GIF 파일이 없으면 더미 프레임을 등록한 뒤 FileNotFoundError 발생
+        """
+        animation = self._take_preloaded(key)
+        if animation is None:
+            filename, flip = ANIMATION_FILES[key]
+            if not get_assets().exists(f"{ANIMATION_DIR}/{filename}"):
+                self._register(key, self._create_dummy_animation())
+                raise FileNotFoundError(f"애니메이션 파일 없음: {filename}")
+            animation = self._load_state(key)
+        self._register(key, animation)
+
+    def end_preload(self):
+        """사전 로드 종료: 남은 디코딩 작업을 취소하고 프로세스 풀 정리"""
+        with self._preload_lock:
+            self._preloaded.clear()
+            self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _create_executor(self, job_count):
+        """디코딩용 프로세스 풀 생성 (생성할 수 없으면 None, 이 경우 순차 디코딩)"""
+        workers = min(job_count, DECODE_WORKERS or os.cpu_count() or 1)
+        try:
+            # 렌더링 스레드가 실행 중이므로 fork 대신 spawn 사용
+            return ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        except (OSError, NotImplementedError) as e:
+            print(f"병렬 디코딩 불가, 순차 디코딩으로 전환: {e}")
+            return None
+
+    def _take_preloaded(self, key):
+        """사전 로드 중인 애니메이션을 꺼내 반환 (디코딩 중이면 완료까지 대기)"""
+        with self._preload_lock:
+            animation = self._preloaded.pop(key, None)
+            pending = self._pending.pop(key, None)
+        if animation is not None or pending is None:
+            return animation
+
+        (gif_name, data, digest, size, flip), future = pending
+        decoded = None
+        if future is not None:
+            try:
+                decoded = future.result()
+            except BrokenProcessPool as e:
+                print(f"병렬 디코딩 실패, 순차 디코딩으로 전환: {e}")
+        if decoded is None:
+            decoded = decode_animation(data, size, flip)
+
+        if not decoded[2]:
+            return self._create_dummy_animation()
+        return self.frame_cache.store_frames(gif_name, digest, size, flip, decoded)
+
+    def finalize_surfaces(self):
+        """화면(display.set_mode) 생성 후 호출: 아직 변환되지 않은 프레임을 화면 형식으로 변환"""
+        self.store.finalize_all()
+
+    def _register(self, key, animation):
+        """로드한 애니메이션을 저장소에 등록하고 필요한 변형을 미리 생성"""
+        frames = self.store.put(key, animation)
+        if key in STATE_TRANSFORMS:
+            self.transforms.warm(frames, STATE_TRANSFORMS[key])
+
+    def _report_dedup(self):
+        """캐릭터별 중복 프레임 제거 결과 출력"""
+        for category, name in dict.fromkeys(key[:2] for key in ANIMATION_FILES):
+            total, unique, saved = self.store.dedup_stats(category, name)
+            print(
+                f"{name}: 프레임 {total}개 중 고유 프레임 {unique}개, "
+                f"절약한 메모리 {saved / (1024 * 1024):.1f}MB"
+            )
 
-    def load_animation_frames(self, filename, flip=False, is_teacher=False):
+    def _load_state(self, key):
+        """저장소에 없는 애니메이션 상태를 로드 (사전 로드 중인 작업, 디스크 캐시 우선)"""
+        animation = self._take_preloaded(key)
+        if animation is not None:
+            return animation
+
+        filename, flip = ANIMATION_FILES[key]
+        return self.load_animation(filename, flip=flip, is_teacher=key[0] == "teachers")
+
+    def get_frames(self, category, name, state):
+        """애니메이션 상태의 프레임 목록 반환 (상태가 바뀌면 다음 상태 미리 로드)"""
+        return self.get_animation(category, name, state)[0]
+
+    def get_animation(self, category, name, state):
+        """
+        애니메이션 상태의 (프레임 목록, 프레임 시간표) 반환
+        상태가 바뀌면 다음 상태 미리 로드
+        """
+        key = (category, name, state)
+        if key not in ANIMATION_FILES:
+            raise KeyError(key)
+
+        state_changed = self._current_states.get(name) != key
+        if state_changed:
+            self._current_states[name] = key
+            self.store.pinned = set(self._current_states.values())
+            self.prefetch(category, name, PREFETCH_HINTS.get(key, []))
+
+        frames, timeline = self.store.get_animation(key)
+        if state_changed and key in STATE_TRANSFORMS:
+            # 상태가 처음 그려질 때 모든 프레임의 변형을 한 번에 생성
+            self.transforms.warm(frames, STATE_TRANSFORMS[key])
+        return frames, timeline
+
+    def prefetch(self, category, name, states):
+        """곧 필요할 애니메이션 상태를 백그라운드에서 미리 로드"""
+        self.store.prefetch(
+            [
+                (category, name, state)
+                for state in states
+                if (category, name, state) in ANIMATION_FILES
+            ]
+        )
+
+    def _frame_size(self, is_teacher):
+        """캐릭터 종류에 따른 프레임 크기 반환 (선생님은 더 큰 크기 적용)"""
+        return frame_size(is_teacher)
+
+    def _create_dummy_frame(self):
+        """애니메이션이 없을 때 사용할 더미 프레임 생성"""
+        dummy = pygame.Surface((ENTITY_WIDTH, ENTITY_HEIGHT), pygame.SRCALPHA)
+        dummy.fill((200, 200, 200, 128))
+        return dummy
+
+    def _create_dummy_animation(self):
+        """더미 프레임 하나로 된 애니메이션 생성"""
+        return AnimationFrames.from_surfaces([self._create_dummy_frame()])
+
+    def load_animation(self, filename, flip=False, is_teacher=False):
+        """GIF 애니메이션을 중복 제거된 AnimationFrames로 로드"""
         try:
-            gif_path = f"src/ricktcal_game/resources/animations/{filename}"
+            gif_name = f"{ANIMATION_DIR}/{filename}"
 
-            if not os.path.exists(gif_path):
+            if not get_assets().exists(gif_name):
                 print(f"애니메이션 파일 없음: {filename}")
                 # 더미 프레임 생성하여 반환
-                dummy = pygame.Surface((ENTITY_WIDTH, ENTITY_HEIGHT), pygame.SRCALPHA)
-                dummy.fill((200, 200, 200, 128))
-                return [dummy]
-
-            pil_img = Image.open(gif_path)
-            frames = []
-
-            for frame in ImageSequence.Iterator(pil_img):
-                frame_copy = frame.convert("RGBA")
-                pygame_image = pygame.image.fromstring(
-                    frame_copy.tobytes(), frame_copy.size, frame_copy.mode
-                )
-
-                # 크기 조정 (선생님은 더 큰 크기 적용)
-                if is_teacher:
-                    pygame_image = pygame.transform.scale(
-                        pygame_image, (TEACHER_DEFAULT_WIDTH, TEACHER_DEFAULT_HEIGHT)
-                    )
-                else:
-                    pygame_image = pygame.transform.scale(
-                        pygame_image, (STUDENT_DEFAULT_WIDTH, STUDENT_DEFAULT_HEIGHT)
-                    )
-
-                if flip:  # 설정 시 캐릭터 모션이 변하면 수직으로 뒤집어 뒤를 돌게 함
-                    pygame_image = pygame.transform.flip(pygame_image, True, False)
-
-                frames.append(pygame_image)
-
-            # 프레임이 없으면 더미 프레임 추가
-            if not frames:
-                dummy = pygame.Surface((ENTITY_WIDTH, ENTITY_HEIGHT), pygame.SRCALPHA)
-                frames.append(dummy)
-
-            return frames
+                return self._create_dummy_animation()
+
+            # 디스크 캐시에 크기 조정된 프레임이 있으면 디코딩 없이 사용
+            # flip 설정 시 캐릭터 모션이 변하면 좌우로 뒤집어 뒤를 돌게 함 (캐시 키에 포함)
+            animation = self.frame_cache.load_frames(
+                gif_name, self._frame_size(is_teacher), flip=flip
+            )
+
+            # 프레임이 없으면 더미 프레임 사용
+            if not animation:
+                return self._create_dummy_animation()
+
+            return animation
         except Exception as e:
             print(f"Error loading {filename}: {e}")
-            dummy = pygame.Surface((ENTITY_WIDTH, ENTITY_HEIGHT), pygame.SRCALPHA)
-            return [dummy]
+            return self._create_dummy_animation()
+
+    def load_animation_frames(self, filename, flip=False, is_teacher=False):
+        """GIF 애니메이션을 재생 순서대로 나열한 프레임 목록으로 로드"""
+        return self.load_animation(filename, flip=flip, is_teacher=is_teacher).frames
 
     def draw_entity(self, screen, entity):
         """엔티티 타입에 따라 적절한 렌더링 메서드 호출"""
@@ -102,66 +373,98 @@ class SpriteManager:
         else:
             print(f"알 수 없는 엔티티 타입: {entity.entity_type}")
 
+    def entity_sprite(self, entity, alpha=None):
+        """
+        엔티티의 이번 프레임 이미지와 위치 반환 (프레임 인덱스는 advance_frames()로 계산)
+        :param alpha: 시뮬레이션 스텝 사이 진행 비율 (None이면 보간하지 않음)
+        :return: (Surface, (x, y)) 또는 그릴 것이 없으면 None
+        """
+        if entity.entity_type == "teacher":
+            return self.teacher_sprite(entity, alpha)
+        if entity.entity_type == "student":
+            return self.student_sprite(entity)
+        print(f"알 수 없는 엔티티 타입: {entity.entity_type}")
+        return None
+
     def draw_teacher(self, screen, teacher):
         """선생님 타입 엔티티 렌더링"""
-        now = pygame.time.get_ticks()
+        sprite = self.teacher_sprite(teacher)
+        if sprite is not None:
+            screen.blit(*sprite)
+
+    def advance_frames(self, store):
+        """
+        렌더링 프레임마다 한 번 호출: 저장소의 모든 엔티티가 이번 프레임에 표시할
+        애니메이션 프레임을 애니메이션 시계 시각으로 한 번에 계산 (EntityStore.frame)
+        """
+        store.advance_frames(self.clock.now, self.timeline_for)
+
+    def timeline_for(self, category, name, state):
+        """애니메이션 상태의 프레임 시간표 (애니메이션이 없으면 더미 프레임 하나)"""
+        try:
+            return self.get_animation(category, name, state)[1]
+        except KeyError:
+            return AnimationTimeline.uniform(1)
 
+    def teacher_sprite(self, teacher, alpha=None):
+        """
+        선생님 타입 엔티티의 이번 프레임 이미지와 위치 (alpha를 주면 바운스 보간)
+        프레임 인덱스는 advance_frames()가 계산한 값 사용
+        """
         frames = None
         if teacher.name == "sherum":
-            frames = (
-                self.animations["teachers"]["sherum"]["back"]
-                if teacher.facing_away
-                else self.animations["teachers"]["sherum"]["front"]
-            )
+            frames = self.get_frames("teachers", "sherum", teacher.animation_state)
         # TODO : 이후 버전에 다른 선생님 (네르 등) 이 추가되면 여기에 추가
 
         if not frames:
-            return
+            return None
 
-        if now - teacher.last_update > ANIMATION_FRAME_RATE * 1000:
-            teacher.last_update = now
-            teacher.animation_frame = (teacher.animation_frame + 1) % len(frames)
-
-        if 0 <= teacher.animation_frame < len(frames):
-            teacher_pos = self.position_manager.get_position(teacher.name)
+        frame_index = teacher.frame
+        if 0 <= frame_index < len(frames):
+            teacher_pos = teacher.position
 
             # 바운스 오프셋 적용 (y 좌표에만 적용)
-            adjusted_pos = (teacher_pos[0], teacher_pos[1] + teacher.bounce_offset)
+            if alpha is None:
+                bounce_offset = teacher.bounce_offset
+            else:
+                bounce_offset = teacher.interpolated_bounce(alpha)
+            adjusted_pos = (teacher_pos[0], teacher_pos[1] + bounce_offset)
 
-            screen.blit(frames[teacher.animation_frame], adjusted_pos)
+            return frames[frame_index], adjusted_pos
+        return None
 
     def draw_student(self, screen, student):
         """학생 타입 엔티티 렌더링"""
-        now = pygame.time.get_ticks()
-
-        # joanne은 animation_type 속성 사용, erpin은 기존 방식
-        if student.name == "joanne":
-            anim_type = getattr(student, "animation_type", "idle_1")
-        else:
-            if student.using_skill:
-                anim_type = "skill"
-            elif student.dancing:
-                anim_type = "dance"
-            else:
-                anim_type = "idle"
-
+        sprite = self.student_sprite(student)
+        if sprite is not None:
+            screen.blit(*sprite)
+
+    def student_sprite(self, student):
+        """
+        학생 타입 엔티티의 이번 프레임 이미지와 위치
+        애니메이션 상태(에르핀: 스킬/춤/대기, 죠안: animation_type)와 프레임 인덱스는
+        EntityStore가 한 번에 갱신한 값 사용
+        """
+        anim_type = student.animation_state
         try:
-            frames = self.animations["students"][student.name][anim_type]
+            frames = self.get_frames("students", student.name, anim_type)
         except KeyError:
             print(f"애니메이션 없음: {student.name}/{anim_type}")
             frames = [self._create_dummy_frame()]
 
-        if now - student.last_update > ANIMATION_FRAME_RATE * 1000:
-            student.last_update = now
-            student.animation_frame = (student.animation_frame + 1) % len(frames)
-
-        if 0 <= student.animation_frame < len(frames):
-            student_pos = self.position_manager.get_position(student.name)
-            # joanne의 idle_2만 좌우 반전
-            if student.name == "joanne" and anim_type == "idle_2":
-                flipped_frame = pygame.transform.flip(
-                    frames[student.animation_frame], True, False
-                )
-                screen.blit(flipped_frame, student_pos)
-            else:
-                screen.blit(frames[student.animation_frame], student_pos)
+        frame_index = student.frame
+        if 0 <= frame_index < len(frames):
+            student_pos = student.position
+            frame = frames[frame_index]
+
+            # 변형이 지정된 상태는 캐시된 변형 프레임 사용 (예: joanne의 idle_2 좌우 반전)
+            transform = STATE_TRANSFORMS.get(("students", student.name, anim_type))
+            if transform is not None:
+                frame = self.transforms.get(frame, transform)
+
+            return frame, student_pos
+        return None
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,16 @@
-import pygame
-
-from .base_entity import Entity
+from .base_entity import Entity, StoreField
+from .entity_store import KIND_STUDENT
 
 
 class StudentEntity(Entity):
     """학생 타입 엔티티의 기본 클래스"""
 
-    def __init__(self):
-        super().__init__()
-        self.entity_type = "student"
+    entity_type = "student"
+    kind = KIND_STUDENT
 
-        # 학생 공통 속성
-        self.dancing = False
-        self.using_skill = False
+    # 학생 공통 속성
+    dancing = StoreField(bool)
+    using_skill = StoreField(bool)
 
     def update(self, current_time):
         """학생 상태 업데이트 (서브클래스에서 오버라이드 가능)"""
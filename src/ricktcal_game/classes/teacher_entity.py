@@ -1,47 +1,57 @@
-import math
 import random
 
 import pygame
 
-from ..core.config import TEACHER_TURN_MAX_DELAY, TEACHER_TURN_MIN_DELAY
-from .base_entity import Entity
+from ..core.config import (
+    TEACHER_BOUNCE_DURATION,
+    TEACHER_BOUNCE_HEIGHT,
+    TEACHER_TURN_MAX_DELAY,
+    TEACHER_TURN_MIN_DELAY,
+)
+from .base_entity import Entity, StoreField
+from .entity_store import KIND_TEACHER
 
 
 class TeacherEntity(Entity):
     """선생님 타입 엔티티의 기본 클래스"""
 
-    def __init__(self):
-        super().__init__()
-        self.entity_type = "teacher"
-
-        # 선생님 공통 속성
-        self.facing_away = True
-
-        # 방향 전환 타이밍 관련 변수
-        self.last_turn_time = pygame.time.get_ticks()
-        self.turn_delay = random.uniform(TEACHER_TURN_MIN_DELAY, TEACHER_TURN_MAX_DELAY)
-
-        # 바운스(튀어오르기) 애니메이션 관련 변수
-        self.is_bouncing = False
-        self.bounce_start_time = 0
-        self.bounce_duration = 300  # 바운스 지속 시간 (밀리초)
-        self.bounce_height = 15  # 바운스 최대 높이 (픽셀)
-        self.bounce_offset = 0  # 현재 Y축 오프셋
+    entity_type = "teacher"
+    kind = KIND_TEACHER
+
+    # 선생님 공통 속성
+    facing_away = StoreField(bool)
+
+    # 방향 전환 타이밍 관련 변수 (ms)
+    last_turn_time = StoreField(float)
+    turn_delay = StoreField(float)
+
+    # 바운스(튀어오르기) 애니메이션 관련 변수
+    is_bouncing = StoreField(bool)
+    bounce_start_time = StoreField(float)
+    bounce_offset = StoreField(int)  # 현재 Y축 오프셋
+    prev_bounce_offset = StoreField(int)  # 이전 스텝의 Y축 오프셋 (렌더링 보간용)
+    bounce_duration = TEACHER_BOUNCE_DURATION  # 바운스 지속 시간 (밀리초)
+    bounce_height = TEACHER_BOUNCE_HEIGHT  # 바운스 최대 높이 (픽셀)
+
+    def __init__(self, current_time=None, rng=None, store=None):
+        """
+        :param current_time: 생성 시점의 게임 시각 (ms, None이면 pygame 타이머 사용)
+        :param rng: 판의 난수 생성기 (random.Random, None이면 새로 생성)
+        :param store: 상태를 보관할 엔티티 저장소 (None이면 전용 저장소)
+        """
+        super().__init__(store)
+        self.rng = rng if rng is not None else random.Random()
+
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
+        self.last_turn_time = current_time
+        self.turn_delay = self.rng.uniform(
+            TEACHER_TURN_MIN_DELAY, TEACHER_TURN_MAX_DELAY
+        )
 
     def update(self, current_time):
-        """선생님 상태 업데이트"""
-        # 일정 시간마다 방향 전환
-        if current_time - self.last_turn_time > self.turn_delay:
-            # 방향 전환 시 바운스 애니메이션 시작
-            self.facing_away = not self.facing_away
-            self.last_turn_time = current_time
-            self.turn_delay = random.uniform(
-                TEACHER_TURN_MIN_DELAY, TEACHER_TURN_MAX_DELAY
-            )
-
-            self.start_bounce(current_time)
-
-        self.update_bounce(current_time)
+        """선생님 상태 업데이트 (여러 선생님은 EntityStore.update_teachers로 한 번에)"""
+        self.store.update_teachers(current_time, self.rng, rows=[self.index])
 
     def start_bounce(self, current_time):
         """바운스 애니메이션 시작"""
@@ -49,23 +59,14 @@ class TeacherEntity(Entity):
         self.bounce_start_time = current_time
         self.bounce_offset = 0
 
+    def interpolated_bounce(self, alpha):
+        """
+        이전 스텝과 현재 스텝 사이를 보간한 바운스 오프셋
+        :param alpha: 스텝 사이 진행 비율 (0.0 ~ 1.0)
+        """
+        offset = self.prev_bounce_offset
+        return int(round(offset + (self.bounce_offset - offset) * alpha))
+
     def update_bounce(self, current_time):
         """바운스 애니메이션 업데이트"""
-        if not self.is_bouncing:
-            return
-
-        # 바운스 진행 정도 계산 (0.0 ~ 1.0)
-        elapsed = current_time - self.bounce_start_time
-        progress = min(1.0, elapsed / self.bounce_duration)
-
-        if progress >= 1.0:
-            # 바운스 종료
-            self.is_bouncing = False
-            self.bounce_offset = 0
-            return
-
-        # 사인 함수를 사용하여 자연스러운 바운스 효과 생성
-        bounce_factor = math.sin(math.pi * progress)
-
-        # 바운스 높이 계산 (위로 올라가는 것이므로 음수)
-        self.bounce_offset = -int(self.bounce_height * bounce_factor)
+        self.store.update_bounces(current_time, [self.index])
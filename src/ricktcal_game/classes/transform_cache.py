@@ -0,0 +1,66 @@
+import weakref
+from typing import NamedTuple, Optional, Tuple
+
+import pygame
+
+
+class SpriteTransform(NamedTuple):
+    """스프라이트 변형 파라미터 (적용 순서: 크기 조정 -> 반전 -> 회전)"""
+
+    flip_x: bool = False
+    flip_y: bool = False
+    scale: Optional[Tuple[int, int]] = None  # 조정할 크기 (width, height)
+    angle: float = 0.0  # 반시계 방향 회전 각도 (도)
+
+
+IDENTITY = SpriteTransform()
+
+
+def apply_transform(surface, transform):
+    """Surface에 변형을 적용한 새 Surface 반환"""
+    result = surface
+    if transform.scale and tuple(transform.scale) != result.get_size():
+        result = pygame.transform.scale(result, transform.scale)
+    if transform.flip_x or transform.flip_y:
+        result = pygame.transform.flip(result, transform.flip_x, transform.flip_y)
+    if transform.angle:
+        result = pygame.transform.rotate(result, transform.angle)
+    if result is not surface and surface.get_colorkey() is not None:
+        # 변형 함수는 RLE 가속 플래그를 유지하지 않으므로 다시 설정
+        result.set_colorkey(surface.get_colorkey(), pygame.RLEACCEL)
+    return result
+
+
+class TransformCache:
+    """
+    프레임별 변형(반전, 크기 조정, 회전) 결과를 보관하는 캐시
+    원본 프레임이 메모리에서 해제되면 변형 결과도 함께 해제됨
+    """
+
+    def __init__(self):
+        # 원본 Surface -> {SpriteTransform: 변형된 Surface}
+        self._variants = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, frame, transform):
+        """변형된 프레임 반환 (처음 요청될 때만 생성)"""
+        if transform == IDENTITY:
+            return frame
+
+        variants = self._variants.get(frame)
+        if variants is None:
+            variants = self._variants[frame] = {}
+
+        variant = variants.get(transform)
+        if variant is None:
+            self.misses += 1
+            variant = variants[transform] = apply_transform(frame, transform)
+        else:
+            self.hits += 1
+        return variant
+
+    def warm(self, frames, transform):
+        """프레임 목록의 변형 결과를 미리 생성"""
+        for frame in frames:
+            self.get(frame, transform)
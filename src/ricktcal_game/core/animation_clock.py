@@ -0,0 +1,91 @@
+from bisect import bisect_right
+from itertools import accumulate
+
+import numpy as np
+import pygame
+
+from .config import ANIMATION_FRAME_RATE, ANIMATION_MIN_FRAME_DURATION
+
+
+def frame_duration_ms(duration):
+    """
+    GIF 프레임 표시 시간(ms)을 재생에 쓸 값으로 보정
+    표시 시간이 없거나 너무 짧은 프레임은 기본 간격(ANIMATION_FRAME_RATE) 사용
+    """
+    if duration is None or duration <= ANIMATION_MIN_FRAME_DURATION:
+        return round(ANIMATION_FRAME_RATE * 1000)
+    return duration
+
+
+class AnimationTimeline:
+    """애니메이션 한 바퀴의 프레임별 누적 표시 시간표 (경과 시간 -> 프레임 인덱스)"""
+
+    def __init__(self, durations):
+        """
+        :param durations: 재생 순서대로 나열한 프레임별 표시 시간 (ms, GIF duration 값)
+        """
+        self.durations = [frame_duration_ms(duration) for duration in durations]
+        # ends[i]: i번째 프레임이 끝나는 시각 (애니메이션 시작 기준 ms)
+        self.ends = list(accumulate(self.durations))
+        self.total = self.ends[-1] if self.ends else 0
+
+    @classmethod
+    def uniform(cls, count, duration=None):
+        """모든 프레임이 같은 시간 동안 표시되는 시간표 (더미 프레임 등)"""
+        return cls([duration] * count)
+
+    def __len__(self):
+        return len(self.ends)
+
+    def frame_at(self, elapsed_ms):
+        """애니메이션 시작 후 elapsed_ms가 지났을 때 표시할 프레임 인덱스 (반복 재생)"""
+        if self.total <= 0:
+            return 0
+        return bisect_right(self.ends, elapsed_ms % self.total)
+
+    def frames_at(self, elapsed_ms):
+        """frame_at()의 배열 버전 (경과 시간 배열 -> 프레임 인덱스 배열)"""
+        elapsed_ms = np.asarray(elapsed_ms)
+        if self.total <= 0:
+            return np.zeros(elapsed_ms.shape, dtype=np.intp)
+        return np.searchsorted(self.ends, elapsed_ms % self.total, side="right")
+
+
+class AnimationClock:
+    """
+    모든 애니메이션이 공유하는 시간 기준
+    렌더링 프레임마다 tick()을 한 번 호출해 시각을 고정하고, 애니메이션별로 시작 시각만
+    기록하므로 그리기 호출 횟수와 무관하게 같은 시각에는 같은 프레임이 선택됨
+    """
+
+    def __init__(self, time_source=pygame.time.get_ticks):
+        self.time_source = time_source  # 현재 시각 (ms) 반환 함수
+        self.now = 0  # 이번 렌더링 프레임의 시각 (ms)
+        # 애니메이션 주체 (엔티티 이름 등) -> (애니메이션 상태, 시작 시각)
+        self._starts = {}
+
+    def tick(self, now=None):
+        """
+        렌더링 프레임 시작 시 호출: 이번 프레임의 애니메이션 시각 고정
+        :param now: 현재 시각 (ms, None이면 time_source())
+        """
+        self.now = self.time_source() if now is None else now
+
+    def reset(self):
+        """모든 애니메이션의 시작 시각 초기화 (다음에 그릴 때 첫 프레임부터 재생)"""
+        self._starts.clear()
+
+    def elapsed(self, owner, state):
+        """
+        owner의 state 애니메이션이 시작된 후 지난 시간 (ms)
+        상태가 바뀌었으면 이번 프레임을 시작 시각으로 기록하고 0 반환
+        """
+        start = self._starts.get(owner)
+        if start is None or start[0] != state:
+            self._starts[owner] = (state, self.now)
+            return 0
+        return self.now - start[1]
+
+    def frame_index(self, owner, state, timeline):
+        """owner가 state 애니메이션에서 지금 표시할 프레임 인덱스"""
+        return timeline.frame_at(self.elapsed(owner, state))
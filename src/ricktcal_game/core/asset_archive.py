@@ -0,0 +1,318 @@
+import argparse
+import io
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from contextlib import ExitStack
+from importlib import resources
+from pathlib import Path
+
+# 리소스 아카이브 파일 형식 (리틀 엔디언)
+# [헤더] magic(4) | version(2) | entry_count(4) | index_offset(8)
+# [본문] 엔트리 데이터 (헤더 바로 뒤부터 순서대로)
+# [인덱스] 엔트리마다 name_length(2) | name(UTF-8) | offset(8)
+#          | stored_size(4) | size(4) | flags(1)
+ARCHIVE_MAGIC = b"RTPK"
+ARCHIVE_VERSION = 1
+ARCHIVE_NAME = "resources.pak"
+RESOURCE_DIR = "resources"
+PACKAGE = __name__.split(".")[0]
+
+_HEADER = struct.Struct("<4sHIQ")
+_NAME_LENGTH = struct.Struct("<H")
+_ENTRY = struct.Struct("<QIIB")
+
+FLAG_ZLIB = 0x01  # zlib으로 압축된 엔트리
+
+# 압축 후 크기가 원본의 이 비율 이하일 때만 압축해서 저장 (GIF, PNG 등은 그대로 저장)
+COMPRESS_RATIO = 0.9
+
+# 아카이브에 넣지 않을 파일
+_SKIP_SUFFIXES = {".py", ".pyc"}
+
+
+class EntryReader(io.RawIOBase):
+    """
+    아카이브 엔트리를 파일처럼 읽는 객체 (pygame, PIL에 파일 대신 전달)
+    엔트리 데이터를 미리 복사하지 않고, 읽을 때 필요한 만큼만 복사
+    """
+
+    def __init__(self, data, name=""):
+        self._view = memoryview(data)
+        self._pos = 0
+        self.name = name
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), len(self._view) - self._pos)
+        if size <= 0:
+            return 0
+        buffer[:size] = self._view[self._pos : self._pos + size]
+        self._pos += size
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._pos + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"잘못된 whence 값: {whence}")
+        if position < 0:
+            raise ValueError("음수 위치로 이동할 수 없습니다")
+        self._pos = position
+        return position
+
+    def tell(self):
+        return self._pos
+
+
+class AssetArchive:
+    """
+    인덱스가 있는 단일 리소스 아카이브
+    파일을 한 번만 열어 메모리 매핑하고, 압축되지 않은 엔트리는 복사 없이 슬라이스로 반환
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mapped)
+        self._mtime_ns = self.path.stat().st_mtime_ns
+        self._index = self._read_index()
+
+    def _read_index(self):
+        """헤더와 인덱스를 읽어 {이름: (offset, stored_size, size, flags)} 반환"""
+        if len(self._mapped) < _HEADER.size:
+            raise ValueError(f"리소스 아카이브가 손상되었습니다: {self.path}")
+        magic, version, entry_count, index_offset = _HEADER.unpack_from(self._mapped)
+        if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+            raise ValueError(f"지원하지 않는 리소스 아카이브 형식입니다: {self.path}")
+
+        index = {}
+        position = index_offset
+        for _ in range(entry_count):
+            (name_length,) = _NAME_LENGTH.unpack_from(self._mapped, position)
+            position += _NAME_LENGTH.size
+            name = bytes(self._view[position : position + name_length]).decode("utf-8")
+            position += name_length
+            index[name] = _ENTRY.unpack_from(self._mapped, position)
+            position += _ENTRY.size
+        return index
+
+    def is_outdated(self, root):
+        """
+        리소스 디렉터리와 비교해 아카이브가 오래되었는지 여부
+        엔트리 목록과 크기가 다르거나 아카이브보다 나중에 수정된 파일이 있으면 True
+        (파일 내용은 읽지 않고 stat만 확인)
+        """
+        built = self.path.stat().st_mtime
+        names = set()
+        for name, path in _walk_resources(root):
+            stat = path.stat()
+            entry = self._index.get(name)
+            if entry is None or entry[2] != stat.st_size or stat.st_mtime > built:
+                return True
+            names.add(name)
+        return names != self._index.keys()
+
+    def names(self):
+        """아카이브에 들어 있는 엔트리 이름 목록"""
+        return list(self._index)
+
+    def exists(self, name):
+        """엔트리 존재 여부 (파일 시스템 조회 없이 인덱스에서 확인)"""
+        return name in self._index
+
+    def size(self, name):
+        """압축 해제 후 엔트리 크기 (바이트)"""
+        return self._entry(name)[2]
+
+    def stamp(self, name):
+        """
+        내용을 읽지 않고 엔트리가 바뀌었는지 판단하는 값 (크기, 수정 시각 ns)
+        아카이브 엔트리는 아카이브 파일의 수정 시각을 사용
+        """
+        return (self._entry(name)[2], self._mtime_ns)
+
+    def read(self, name):
+        """엔트리 데이터 반환 (압축되지 않은 엔트리는 복사 없는 memoryview)"""
+        offset, stored_size, size, flags = self._entry(name)
+        data = self._view[offset : offset + stored_size]
+        if flags & FLAG_ZLIB:
+            return zlib.decompress(data, bufsize=size)
+        return data
+
+    def open(self, name):
+        """엔트리를 파일 객체로 반환"""
+        return EntryReader(self.read(name), name)
+
+    def _entry(self, name):
+        try:
+            return self._index[name]
+        except KeyError:
+            raise FileNotFoundError(f"리소스 없음: {name}") from None
+
+
+class LooseAssets:
+    """아카이브가 없을 때 사용하는 리소스 디렉터리 (개발 중 원본 파일을 직접 읽음)"""
+
+    def __init__(self, root):
+        self.root = root
+        # 시작할 때 한 번만 디렉터리를 탐색해 이름 -> (경로, stat 결과) 인덱스를 만듦
+        self._index = {
+            name: (path, path.stat()) for name, path in _walk_resources(root)
+        }
+
+    def names(self):
+        return list(self._index)
+
+    def exists(self, name):
+        return name in self._index
+
+    def size(self, name):
+        return self._entry(name)[1].st_size
+
+    def stamp(self, name):
+        stat = self._entry(name)[1]
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def read(self, name):
+        return self._entry(name)[0].read_bytes()
+
+    def open(self, name):
+        return EntryReader(self.read(name), name)
+
+    def _entry(self, name):
+        try:
+            return self._index[name]
+        except KeyError:
+            raise FileNotFoundError(f"리소스 없음: {name}") from None
+
+
+def _walk_resources(root, prefix=""):
+    """리소스 디렉터리를 재귀 탐색하여 (엔트리 이름, 경로) 생성"""
+    for child in sorted(root.iterdir(), key=lambda item: item.name):
+        if child.name == "__pycache__":
+            continue
+        name = f"{prefix}{child.name}"
+        if child.is_dir():
+            yield from _walk_resources(child, f"{name}/")
+        elif Path(child.name).suffix not in _SKIP_SUFFIXES:
+            yield name, child
+
+
+_assets = None
+_assets_lock = threading.Lock()
+_resource_files = ExitStack()
+
+
+def get_assets():
+    """
+    게임 리소스 반환 (처음 호출할 때 한 번만 열림)
+    패키지에 resources.pak이 있으면 아카이브를, 없으면 resources 디렉터리를 사용
+    resources 디렉터리가 아카이브보다 새로우면 (리소스를 고친 뒤 다시 빌드하지 않은 경우)
+    경고를 출력하고 디렉터리를 사용
+    작업 디렉터리와 관계없이 importlib.resources로 패키지 위치를 찾음
+    RICKTCAL_RESOURCE_DIR 환경 변수가 있으면 그 디렉터리를 사용 (벤치마크용 합성 리소스 등)
+    """
+    global _assets
+    with _assets_lock:
+        if _assets is None:
+            override = os.environ.get("RICKTCAL_RESOURCE_DIR")
+            if override:
+                _assets = LooseAssets(Path(override))
+                return _assets
+
+            package_files = resources.files(PACKAGE)
+            archive = package_files.joinpath(ARCHIVE_NAME)
+            loose_dir = package_files.joinpath(RESOURCE_DIR)
+            if archive.is_file():
+                # zip 등으로 설치된 경우 실제 파일 경로가 필요하므로 as_file 사용
+                _assets = AssetArchive(
+                    _resource_files.enter_context(resources.as_file(archive))
+                )
+                if loose_dir.is_dir() and _assets.is_outdated(loose_dir):
+                    print(
+                        f"경고: {ARCHIVE_NAME}이 {RESOURCE_DIR} 디렉터리보다 오래되어 "
+                        "디렉터리를 사용합니다 "
+                        "(python -m ricktcal_game.core.asset_archive로 다시 빌드)"
+                    )
+                    _assets = LooseAssets(loose_dir)
+            else:
+                _assets = LooseAssets(loose_dir)
+        return _assets
+
+
+def build_archive(resource_root, output_path):
+    """
+    리소스 디렉터리를 아카이브 하나로 묶음
+    :param resource_root: 리소스 디렉터리 (animations, images, sounds 포함)
+    :param output_path: 만들 아카이브 파일 경로
+    :return: 엔트리 개수
+    """
+    entries = []
+    output_path = Path(output_path)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, 0, 0))
+            for name, path in _walk_resources(Path(resource_root)):
+                data = path.read_bytes()
+                flags = 0
+                compressed = zlib.compress(data, 9)
+                if len(compressed) <= len(data) * COMPRESS_RATIO:
+                    data, flags = compressed, FLAG_ZLIB
+                entries.append((name, f.tell(), len(data), path.stat().st_size, flags))
+                f.write(data)
+
+            index_offset = f.tell()
+            for name, offset, stored_size, size, flags in entries:
+                encoded = name.encode("utf-8")
+                f.write(_NAME_LENGTH.pack(len(encoded)))
+                f.write(encoded)
+                f.write(_ENTRY.pack(offset, stored_size, size, flags))
+
+            f.seek(0)
+            f.write(
+                _HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, len(entries), index_offset)
+            )
+        tmp_path.replace(output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return len(entries)
+
+
+def main(argv=None):
+    """리소스 아카이브 빌드 명령 (python -m ricktcal_game.core.asset_archive)"""
+    package_dir = Path(__file__).resolve().parent.parent
+    parser = argparse.ArgumentParser(description="리소스 디렉터리를 아카이브로 묶기")
+    parser.add_argument(
+        "--source", default=package_dir / RESOURCE_DIR, help="리소스 디렉터리"
+    )
+    parser.add_argument(
+        "--output", default=package_dir / ARCHIVE_NAME, help="아카이브 파일 경로"
+    )
+    args = parser.parse_args(argv)
+
+    count = build_archive(args.source, args.output)
+    size = Path(args.output).stat().st_size
+    print(
+        f"리소스 아카이브 생성 완료: {args.output} (엔트리 {count}개, {size:,} 바이트)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
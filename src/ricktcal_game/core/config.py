@@ -1,10 +1,19 @@
 # 게임 설정 상수
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60  # 목표 프레임 속도 (프로파일러의 목표 프레임 시간, 벤치마크 재생 속도)
+
+# 고정 간격 시뮬레이션 설정
+# 게이지, 점수 등 게임 로직은 초당 SIM_RATE번 진행 (아래 증감량은 모두 스텝당 값)
+SIM_RATE = 60
+MAX_SIM_STEPS_PER_FRAME = 5  # 느린 프레임 뒤 한 번에 따라잡을 최대 스텝 수
+SIM_INTERPOLATION = True  # 스텝 사이 렌더링 시 선생님 바운스 위치 보간
+
 GAUGE_DECREASE = 0.25  # 0.1에서 0.25로 증가 (더 빠른 게이지 감소)
 GAUGE_INCREASE = 0.5
+SCORE_PER_STEP = 0.1
 SKILL_CHARGE = 30
+SKILL_EFFECT_DURATION = 0.5  # 스킬 모션 지속 시간 (초, 시뮬레이션 시각 기준)
 GRACE_PERIOD = 0.3  # 0.3초의 유예 시간
 
 # 씬 이름 상수 정의 - 모든 파일에서 일관되게 사용하도록 수정
@@ -19,8 +28,82 @@ SCENE_SETTINGS = "settings"
 DEFAULT_ERPIN_POS = (600, 50)  # 오른쪽 상단
 DEFAULT_SHERUM_POS = (100, 300)  # 왼쪽 중앙
 
-# 애니메이션 프레임 속도 (값을 낮출수록 더 빨라짐)
+# 애니메이션 프레임 표시 시간은 GIF의 프레임별 duration 값을 따름
+# GIF에 표시 시간이 없거나 ANIMATION_MIN_FRAME_DURATION(ms) 이하이면 기본 간격(초) 사용
 ANIMATION_FRAME_RATE = 0.05
+ANIMATION_MIN_FRAME_DURATION = 10
+
+# 화면 출력 설정
+# 게임은 항상 SCREEN_WIDTH x SCREEN_HEIGHT 논리 화면에 그리고,
+# SCALED 모드에서는 SDL이 창/전체 화면 크기에 맞춰 마지막에 한 번 확대 (스프라이트는 다시 크기 조정하지 않음)
+# SCALED 모드에서는 창 전체가 매번 다시 그려지므로 더티 렉트 모드도 바뀐 영역만 화면에 다시 그리고
+# 표시는 display.flip()으로 함 (부분 표시까지 하려면 DISPLAY_SCALED = False, 창 크기 고정)
+DISPLAY_SCALED = True
+DISPLAY_VSYNC = True  # 수직 동기화 (지원하지 않는 환경에서는 자동으로 끔)
+# 렌더링은 게임 로직과 별개로 화면이 허용하는 속도로 진행 (vsync 중에는 화면 주사율이 속도를 정함)
+# vsync를 쓸 수 없을 때만 아래 값으로 프레임 수를 제한 (0이면 제한 없음)
+RENDER_FPS_LIMIT = 240
+DISPLAY_FULLSCREEN = False  # F11로 전환, 설정 파일의 "fullscreen" 값이 우선
+
+# 프레임 구간별 시간 측정 (F3: 오버레이 표시/숨기기)
+# 종료 시 최근 PROFILER_HISTORY 프레임의 구간 시간을 캐시 디렉터리의 profiles/에 CSV로 저장
+# (python -m ricktcal_game --profile 파일.csv|파일.json 으로 경로 지정)
+PROFILER_ENABLED = True
+PROFILER_DUMP = False  # --profile 없이도 종료 시 저장
+PROFILER_WINDOW = 300  # p50/p95/p99와 히스토그램을 계산할 최근 프레임 수
+PROFILER_HISTORY = 36_000  # 보관할 최대 프레임 수 (60FPS 기준 10분)
+PROFILER_OVERLAY_REFRESH = 15  # 오버레이를 다시 그리는 간격 (프레임)
+
+# 판마다 게임 플레이 난수(선생님 방향 전환 등)의 시드 (None이면 판마다 무작위)
+SESSION_SEED = None
+
+# 입력 기록 및 리플레이
+# 판마다 시드와 입력을 기록해 설정 디렉터리의 replays/에 저장 (최근 REPLAY_HISTORY개)
+# 재생: python -m ricktcal_game --replay 파일 / 성능 측정: python -m ricktcal_game.bench.replay 파일
+REPLAY_RECORD = True
+REPLAY_HISTORY = 10
+
+# 게임 화면 렌더링 방식
+RENDER_DIRTY = "dirty"  # 바뀐 영역만 다시 그리고 display.update(rects)로 표시 (SCALED 모드에서는 flip())
+RENDER_FULL = "full"  # 매 프레임 전체 화면을 다시 그리고 display.flip()으로 표시
+RENDER_MODE = RENDER_DIRTY
+
+# 애니메이션 디코딩에 사용할 프로세스 수 (None이면 CPU 코어 수)
+DECODE_WORKERS = None
+
+# 메모리에 유지할 애니메이션 프레임의 최대 크기 (바이트, 초과 시 오래된 상태부터 해제)
+ANIMATION_MEMORY_BUDGET = 64 * 1024 * 1024
+
+# 오디오 출력 설정
+# 저지연 모드는 작은 버퍼를 사용해 키 입력 후 소리가 나기까지의 지연을 줄임 (CPU 사용량 증가)
+# 버퍼 크기별 지연/CPU 비교: python -m ricktcal_game.bench.audio_latency
+AUDIO_LOW_LATENCY = True
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER_LOW_LATENCY = 256  # 샘플 수 (44.1kHz 기준 약 5.8ms)
+AUDIO_BUFFER_DEFAULT = 512  # pygame 기본값
+
+# 설정 변경 후 이 시간(초) 동안 추가 변경이 없으면 설정 파일에 저장
+SETTINGS_FLUSH_DELAY = 0.5
+
+# 효과음 채널 그룹: 그룹 이름 -> (예약 채널 수 = 동시 재생 최대 수, 가득 찼을 때 정책)
+# 정책 "oldest": 가장 오래 재생 중인 소리를 끊고 재생, "none": 새 소리를 재생하지 않음
+SOUND_CHANNEL_GROUPS = {
+    "ui": (2, "oldest"),
+    "gameplay": (4, "oldest"),
+    "voice": (1, "oldest"),  # 캐릭터 춤 음악은 한 번에 하나만 (새로 추면 처음부터)
+}
+
+# 효과음 이름 -> (리소스 파일 이름, 채널 그룹)
+SOUND_EFFECTS = {
+    "click": ("click.wav", "ui"),
+    "dance": ("dance.wav", "voice"),
+    "skill": ("skill.wav", "gameplay"),
+    "game_over": ("game_over.wav", "gameplay"),
+    "warning": ("warning.wav", "gameplay"),
+    "turn": ("turn.wav", "gameplay"),
+}
+# 아직 리소스가 없는 효과음 (파일이 없으면 로드하지 않고 실패로 보고하지 않음, 재생은 무시됨)
+OPTIONAL_SOUND_EFFECTS = {"click", "warning", "turn"}
 
 # 엔티티 크기 설정
 ENTITY_WIDTH = 250
@@ -29,9 +112,11 @@ STUDENT_DEFAULT_WIDTH = 350  # 학생 캐릭터 기본 너비
 STUDENT_DEFAULT_HEIGHT = 350  # 학생 캐릭터 기본 높이
 TEACHER_DEFAULT_WIDTH = 450  # 선생님 캐릭터 기본 너비
 TEACHER_DEFAULT_HEIGHT = 450  # 선생님 캐릭터 기본 높이
+GAMEOVER_ANIMATION_SIZE = (300, 300)  # 게임 오버 화면 선생님 애니메이션 크기
 
 # 폰트 경로 (시스템 폰트 사용)
 FONT_PATH = None  # 기본 시스템 폰트를 사용
+TEXT_CACHE_SIZE = 256  # 렌더링한 텍스트 서피스 LRU 캐시 최대 개수
 
 # 게임 초기 상태 값
 INITIAL_GAME_STATE = SCENE_TITLE  # "menu"에서 SCENE_TITLE로 변경
@@ -43,6 +128,22 @@ GAME_OVER_DELAY = 0.2  # 게임 오버 지연 시간 (초)
 # 선생님 행동 관련 설정
 TEACHER_TURN_MIN_DELAY = 2000  # 최소 방향 전환 지연 시간 (ms)
 TEACHER_TURN_MAX_DELAY = 5000  # 최대 방향 전환 지연 시간 (ms)
+TEACHER_BOUNCE_DURATION = 300  # 방향 전환 시 바운스 지속 시간 (ms)
+TEACHER_BOUNCE_HEIGHT = 15  # 바운스 최대 높이 (픽셀)
+
+# 따라 추는 학생(죠안 등) 행동 설정
+FOLLOWER_DANCE_AFTER = 60  # 이 시간(초)이 지나면 플레이어가 춤출 때 같이 춤
+FOLLOWER_IDLE_3_DURATION = 5  # 플레이어가 춤을 멈춘 뒤 idle_3을 유지하는 시간 (초)
+
+# 교실 모드: 기본 캐릭터(선새임, 에르핀, 죠안) 외에 추가할 선생님과 따라 추는 학생 수
+# 엔티티 상태는 EntityStore의 NumPy 배열에 있으므로 수백 명이어도 한 번에 업데이트
+CLASSROOM_EXTRA_TEACHERS = 0
+CLASSROOM_EXTRA_STUDENTS = 0
+CLASSROOM_COLUMNS = 8  # 추가 학생 배치 열 수
+CLASSROOM_SPACING = (90, 70)  # 추가 학생 사이 간격 (픽셀)
+CLASSROOM_ORIGIN = (60, 300)  # 첫 번째 추가 학생 위치
+CLASSROOM_TEACHER_SPACING = 120  # 추가 선생님 사이 가로 간격 (픽셀)
+ENTITY_STORE_CAPACITY = 16  # 엔티티 저장소 초기 배열 크기 (부족하면 두 배로 늘림)
 
 # 로딩 화면 설정
 LOADING_DURATION = 5.0  # 로딩 화면 지속 시간 (초)
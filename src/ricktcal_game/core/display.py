@@ -0,0 +1,80 @@
+import pygame
+
+from .config import (
+    DISPLAY_FULLSCREEN,
+    DISPLAY_SCALED,
+    DISPLAY_VSYNC,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+
+_vsync_active = False  # 마지막으로 연 화면에 vsync가 적용되었는지 여부
+_scaled_active = False  # 마지막으로 연 화면이 SCALED 모드인지 여부
+
+
+def display_flags(fullscreen=DISPLAY_FULLSCREEN, scaled=DISPLAY_SCALED):
+    """set_mode()에 전달할 화면 플래그"""
+    flags = 0
+    if scaled:
+        # 논리 해상도는 고정하고 창 크기 변경/전체 화면은 SDL이 확대해서 표시
+        flags |= pygame.SCALED | pygame.RESIZABLE
+    if fullscreen:
+        flags |= pygame.FULLSCREEN
+    return flags
+
+
+def open_display(
+    size=(SCREEN_WIDTH, SCREEN_HEIGHT),
+    fullscreen=DISPLAY_FULLSCREEN,
+    scaled=DISPLAY_SCALED,
+    vsync=DISPLAY_VSYNC,
+):
+    """
+    게임 화면 생성 (지원하지 않는 옵션은 vsync, SCALED 순서로 끄고 다시 시도)
+    :return: 논리 해상도 크기의 화면 Surface
+    """
+    attempts = []
+    if vsync:
+        attempts.append((scaled, True))
+    attempts.append((scaled, False))
+    if scaled:
+        attempts.append((False, False))
+
+    global _vsync_active, _scaled_active
+    for index, (use_scaled, use_vsync) in enumerate(attempts):
+        try:
+            screen = pygame.display.set_mode(
+                size,
+                display_flags(fullscreen, use_scaled),
+                vsync=1 if use_vsync else 0,
+            )
+            _vsync_active = use_vsync
+            _scaled_active = use_scaled
+            return screen
+        except pygame.error as e:
+            if index == len(attempts) - 1:
+                raise
+            print(f"화면 모드 설정 실패 (SCALED={use_scaled}, vsync={use_vsync}): {e}")
+
+
+def vsync_active():
+    """화면이 vsync로 열렸는지 여부 (True면 화면 갱신이 주사율에 맞춰 대기)"""
+    return _vsync_active
+
+
+def scaled_active():
+    """
+    화면이 SCALED 모드로 열렸는지 여부
+    SCALED 모드에서는 display.update(rects)도 창 전체를 다시 그리므로 부분 갱신 효과가 없음
+    """
+    return _scaled_active
+
+
+def toggle_fullscreen():
+    """창 모드 <-> 전체 화면 전환 (화면 Surface와 로드된 스프라이트는 그대로 유지)"""
+    try:
+        pygame.display.toggle_fullscreen()
+    except pygame.error as e:
+        print(f"전체 화면 전환 실패: {e}")
+        return False
+    return True
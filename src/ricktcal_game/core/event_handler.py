@@ -23,6 +23,22 @@ class EventHandler:
             if event.type == QUIT:
                 return False  # 게임 종료
 
+            # F11 키로 전체 화면 전환
+            if event.type == KEYDOWN and event.key == K_F11:
+                self.game.toggle_fullscreen()
+                continue
+
+            # F3 키로 프레임 프로파일러 오버레이 표시/숨기기
+            if event.type == KEYDOWN and event.key == K_F3:
+                self.game.renderer.toggle_profiler()
+                continue
+
+            # 창 크기가 바뀌어도 논리 화면 크기는 그대로이므로 다시 그리기만 함
+            # (SCALED 모드에서 SDL이 확대, 스프라이트 크기 조정이나 GIF 재디코딩 없음)
+            if event.type in (VIDEORESIZE, WINDOWSIZECHANGED):
+                self.game.renderer.invalidate()
+                continue
+
             # ESC 키로 설정 화면 열기/닫기
             if (
                 event.type == KEYDOWN
@@ -38,7 +54,9 @@ class EventHandler:
             if self.game.state_manager.game_state == SCENE_TITLE:
                 self.handle_title_events(event)
             elif self.game.state_manager.game_state == SCENE_PLAYING:
-                self.handle_playing_events(event)
+                # 리플레이 중에는 기록된 입력만 반영 (Game.update()에서 전달)
+                if self.game.replay is None:
+                    self.handle_playing_events(event)
             elif self.game.state_manager.game_state == SCENE_GAMEOVER:
                 self.handle_gameover_events(event)
             elif self.game.state_manager.game_state == SCENE_SETTINGS:
@@ -66,13 +84,15 @@ class EventHandler:
         return None
 
     def handle_playing_events(self, event):
-        """게임 플레이 중 이벤트 처리"""
-        # 스킬 사용
+        """게임 플레이 중 이벤트 처리 (입력은 판 시작 후 스텝 시각과 함께 기록)"""
+        if self.game.recorder is not None:
+            self.game.recorder.record(self.game.session_step, event)
+
+        # 스킬 사용 (모션 종료는 Game.update_students()에서 시뮬레이션 시각 기준으로 처리)
         if event.type == KEYDOWN:
             if event.key == K_z and self.game.state_manager.skill_charges > 0:
                 if self.game.state_manager.use_skill():
                     self.game.erpin.update_state(using_skill=True)
-                    pygame.time.set_timer(USEREVENT + 1, 500, loops=1)
                     self.game.sound_manager.play_sfx("skill")
 
             # 춤추기 시작
@@ -85,10 +105,6 @@ class EventHandler:
             self.game.erpin.update_state(dancing=False)
             self.game.sound_manager.stop_sfx("dance")
 
-        # 스킬 효과 종료
-        if event.type == USEREVENT + 1:
-            self.game.erpin.update_state(using_skill=False)
-
     def handle_gameover_events(self, event):
         """게임 오버 화면 이벤트 처리"""
         next_state = self.game.scenes["game_over"].handle_events(event)
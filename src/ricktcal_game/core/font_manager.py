@@ -1,11 +1,33 @@
+import json
+import os
+from collections import OrderedDict
+
 import pygame
 
+from .config import TEXT_CACHE_SIZE
+from .glyph_atlas import GlyphAtlas
+from .paths import user_cache_dir
+
+# 찾은 한글 폰트 경로를 저장하는 캐시 파일 (시스템 폰트 검색은 느리므로 한 번만 수행)
+FONT_CACHE_FILE = "fonts.json"
+
 
 class FontManager:
     """게임 전체의 폰트를 관리하는 클래스"""
 
-    def __init__(self):
+    def __init__(self, text_cache_size=TEXT_CACHE_SIZE):
         self.fonts = {}
+
+        # 렌더링한 텍스트 서피스 캐시
+        # (텍스트, 폰트 타입, 크기, 색상, 안티앨리어싱) -> Surface
+        self.text_cache = OrderedDict()  # 최근에 사용한 순서로 유지 (LRU)
+        self.static_texts = {}  # 게임이 끝날 때까지 버리지 않는 고정 문자열
+        self.text_cache_size = text_cache_size
+        self.text_cache_hits = 0
+        self.text_cache_misses = 0
+
+        # (폰트 타입, 크기, 색상, 안티앨리어싱) -> GlyphAtlas (숫자 HUD 텍스트용)
+        self.glyph_atlases = {}
         self.default_font_sizes = {"small": 24, "normal": 36, "large": 48, "title": 70}
 
         # 한글 폰트 후보 목록 TODO : 커스텀 폰트 추가
@@ -25,17 +47,51 @@ class FontManager:
         self.initialize_fonts()
 
     def find_korean_font(self):
-        """시스템에서 한글 폰트 찾기"""
+        """시스템에서 한글 폰트 찾기 (이전에 찾은 경로가 캐시에 있으면 검색 생략)"""
+        cached_path = self._load_cached_font_path()
+        if cached_path:
+            return cached_path
+
         for font_name in self.korean_font_candidates:
             font_path = pygame.font.match_font(font_name)
             if font_path:
                 print(f"한글 폰트 발견: {font_name} ({font_path})")
+                self._save_cached_font_path(font_path)
                 return font_path
 
         print("경고: 한글 폰트를 찾을 수 없습니다. 대체 폰트를 사용합니다.")
         # 폰트 적용 실패 시 기본 폰트 적용
         return pygame.font.get_default_font()
 
+    def _load_cached_font_path(self):
+        """캐시된 한글 폰트 경로 반환 (없거나, 후보 목록이 바뀌었거나, 파일이 사라졌으면 None)"""
+        try:
+            with open(user_cache_dir() / FONT_CACHE_FILE, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        font_path = cached.get("korean")
+        if (
+            cached.get("candidates") != self.korean_font_candidates
+            or not font_path
+            or not os.path.exists(font_path)
+        ):
+            return None
+        return font_path
+
+    def _save_cached_font_path(self, font_path):
+        """찾은 한글 폰트 경로를 캐시에 저장"""
+        try:
+            cache_dir = user_cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_dir / FONT_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"candidates": self.korean_font_candidates, "korean": font_path}, f
+                )
+        except OSError as e:
+            print(f"폰트 캐시 저장 실패: {e}")
+
     def initialize_fonts(self):
         """폰트 캐시 초기화"""
         try:
@@ -96,8 +152,70 @@ class FontManager:
         size_type="normal",
         color=(255, 255, 255),
         antialias=True,
+        static=False,
     ):
-        """텍스트 렌더링 헬퍼 메서드"""
+        """
+        텍스트 렌더링 헬퍼 메서드 (같은 텍스트는 캐시된 서피스를 반환하므로 수정하지 말 것)
+        :param static: True이면 LRU에서 밀려나지 않도록 게임이 끝날 때까지 보관
+                       (버튼 이름, 도움말 등 바뀌지 않는 문자열)
+        """
         font_type = self.normalize_font_type(font_type)
+        key = (text, font_type, size_type, tuple(color), antialias)
+
+        surface = self.static_texts.get(key)
+        if surface is None:
+            surface = self.text_cache.get(key)
+            if surface is not None:
+                self.text_cache.move_to_end(key)
+        if surface is not None:
+            self.text_cache_hits += 1
+            return surface
+
+        self.text_cache_misses += 1
         font = self.get_font(font_type, size_type)
-        return font.render(text, antialias, color)
+        surface = font.render(text, antialias, color)
+        if static:
+            self.static_texts[key] = surface
+        else:
+            self.text_cache[key] = surface
+            if len(self.text_cache) > self.text_cache_size:
+                self.text_cache.popitem(last=False)
+        return surface
+
+    def get_glyph_atlas(
+        self,
+        font_type="default",
+        size_type="normal",
+        color=(255, 255, 255),
+        labels=(),
+        antialias=True,
+    ):
+        """
+        숫자 텍스트용 글리프 아틀라스 반환 (폰트/크기/색상별로 한 번만 생성)
+        :param labels: 미리 렌더링해 둘 라벨 문자열 목록 (예: "점수: ")
+        """
+        font_type = self.normalize_font_type(font_type)
+        key = (font_type, size_type, tuple(color), antialias)
+        atlas = self.glyph_atlases.get(key)
+        if atlas is None:
+            atlas = self.glyph_atlases[key] = GlyphAtlas(
+                self.get_font(font_type, size_type), color, antialias
+            )
+        for label in labels:
+            atlas.add_label(label)
+        return atlas
+
+    def text_cache_stats(self):
+        """텍스트 캐시 통계 반환 (적중 수, 실패 수, 적중률, 보관 중인 서피스 수)"""
+        total = self.text_cache_hits + self.text_cache_misses
+        return {
+            "hits": self.text_cache_hits,
+            "misses": self.text_cache_misses,
+            "hit_rate": self.text_cache_hits / total if total else 0.0,
+            "cached": len(self.text_cache),
+            "static": len(self.static_texts),
+        }
+
+    def clear_text_cache(self):
+        """LRU 텍스트 캐시 비우기 (고정 문자열은 유지)"""
+        self.text_cache.clear()
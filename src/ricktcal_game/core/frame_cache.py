@@ -0,0 +1,255 @@
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+import pygame
+
+from .animation_clock import AnimationTimeline
+from .asset_archive import get_assets
+from .frame_decoder import decode_animation, frame_digest
+from .paths import user_cache_dir
+
+# 캐시 파일 형식
+# [헤더] magic(4) | version(2) | width(2) | height(2) | unique_count(4)
+#        | index_count(4) | source_digest(32) | source_size(8) | source_mtime_ns(8)
+# [본문] 고유 프레임 해시 (unique_count * 16 바이트)
+#        재생 순서 인덱스 (index_count * 2 바이트, uint16)
+#        재생 순서 프레임별 표시 시간 (index_count * 2 바이트, uint16, ms)
+#        고유 RGBA 프레임 (unique_count * width * height * 4 바이트)
+CACHE_MAGIC = b"RTFC"
+CACHE_VERSION = 4
+CACHE_SUFFIX = ".rtfc"
+_HEADER = struct.Struct("<4sHHHII32sQQ")
+_STAMP = struct.Struct("<QQ")  # 헤더 끝의 원본 크기와 수정 시각
+_STAMP_OFFSET = _HEADER.size - _STAMP.size
+_DIGEST_SIZE = 16
+_MAX_DURATION = 0xFFFF  # 캐시에 저장할 수 있는 최대 프레임 표시 시간 (ms)
+
+
+class AnimationFrames:
+    """
+    중복 제거된 고유 프레임 풀과, 풀을 가리키는 재생 순서 인덱스 목록
+    재생 순서 프레임별 표시 시간(GIF duration)도 함께 보관
+    """
+
+    def __init__(self, pool, digests, indices, durations=None):
+        self.pool = pool  # 고유 프레임 Surface 목록
+        self.digests = digests  # 고유 프레임별 픽셀 해시
+        self.indices = indices  # 재생 순서 (pool 인덱스)
+        # 재생 순서 프레임별 표시 시간 (ms, 0이면 기본 간격)
+        self.durations = durations if durations is not None else [0] * len(indices)
+
+    @classmethod
+    def from_surfaces(cls, surfaces, durations=None):
+        """Surface 목록으로 생성 (더미 프레임 등 캐시를 거치지 않는 프레임용)"""
+        pool = []
+        digests = []
+        indices = []
+        seen = {}
+        for surface in surfaces:
+            digest = frame_digest(pygame.image.tobytes(surface, "RGBA"))
+            if digest not in seen:
+                seen[digest] = len(pool)
+                pool.append(surface)
+                digests.append(digest)
+            indices.append(seen[digest])
+        return cls(pool, digests, indices, durations)
+
+    @property
+    def frames(self):
+        """재생 순서대로 나열한 프레임 목록 (중복 프레임은 같은 Surface 공유)"""
+        return [self.pool[index] for index in self.indices]
+
+    @property
+    def timeline(self):
+        """프레임별 표시 시간으로 만든 누적 시간표 (경과 시간으로 프레임 선택)"""
+        return AnimationTimeline(self.durations)
+
+    def __len__(self):
+        return len(self.indices)
+
+
+class FrameCache:
+    """디코딩 및 크기 조정이 끝난 애니메이션 프레임을 디스크에 캐시하는 클래스"""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir) if cache_dir else user_cache_dir() / "frames"
+
+    def entry_path(self, source_name, size, flip=False):
+        """원본 리소스, 크기, 반전 여부에 해당하는 캐시 파일 경로 반환"""
+        stem = Path(source_name).stem
+        # 다른 디렉터리의 같은 이름 파일이 캐시를 공유하지 않도록 리소스 경로 해시를 붙임
+        path_tag = hashlib.sha1(source_name.encode("utf-8")).hexdigest()[:8]
+        flip_tag = "_flip" if flip else ""
+        return (
+            self.cache_dir
+            / f"{stem}_{path_tag}_{size[0]}x{size[1]}{flip_tag}{CACHE_SUFFIX}"
+        )
+
+    def load_frames(self, source_name, size, flip=False):
+        """
+        캐시에서 프레임을 읽어 AnimationFrames로 반환 (없거나 오래된 경우 다시 생성)
+        :param source_name: 원본 GIF 리소스 이름 (예: "animations/erpin_idle.gif")
+        :param size: 프레임 크기 (width, height)
+        :param flip: True면 좌우 반전된 프레임 사용
+        """
+        animation = self.load_cached(source_name, size, flip)
+        if animation is not None:
+            return animation
+
+        data, digest = self.read_source(source_name)
+        decoded = decode_animation(data, size, flip)
+        return self.store_frames(source_name, digest, size, flip, decoded)
+
+    def read_source(self, source_name):
+        """원본 리소스 데이터(아카이브에서는 복사 없는 memoryview)와 내용 해시 반환"""
+        data = get_assets().read(source_name)
+        return data, hashlib.sha256(data).digest()
+
+    def load_cached(self, source_name, size, flip=False):
+        """
+        유효한 캐시가 있으면 AnimationFrames를, 없거나 오래되었으면 None 반환
+        원본 크기와 수정 시각이 캐시에 기록된 값과 같으면 원본을 읽지 않고,
+        다를 때만 원본을 읽어 내용 해시로 확인
+        """
+        size = (int(size[0]), int(size[1]))
+        return self._read_entry(
+            self.entry_path(source_name, size, flip),
+            source_name,
+            get_assets().stamp(source_name),
+            size,
+        )
+
+    def store_frames(self, source_name, digest, size, flip, decoded):
+        """
+        디코딩 결과를 캐시에 저장하고 AnimationFrames로 반환
+        :param decoded: decode_animation()이 반환한 (고유 프레임, 해시, 인덱스, 표시 시간)
+        """
+        size = (int(size[0]), int(size[1]))
+        unique_frames, digests, indices, durations = decoded
+        self._write_entry(
+            self.entry_path(source_name, size, flip),
+            digest,
+            get_assets().stamp(source_name),
+            size,
+            decoded,
+        )
+        pool = [pygame.image.frombuffer(raw, size, "RGBA") for raw in unique_frames]
+        return AnimationFrames(pool, list(digests), list(indices), list(durations))
+
+    def _read_entry(self, entry_path, source_name, stamp, size):
+        """캐시 파일을 메모리 매핑하여 AnimationFrames 생성 (유효하지 않으면 None)"""
+        try:
+            with open(entry_path, "rb") as f:
+                # 쓰기 시 복사(ACCESS_COPY) 매핑: 프레임 데이터는 복사 없이 공유됨
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (FileNotFoundError, ValueError):
+            return None
+        except OSError as e:
+            print(f"프레임 캐시 읽기 실패 ({entry_path.name}): {e}")
+            return None
+
+        if len(mapped) < _HEADER.size:
+            mapped.close()
+            return None
+
+        (
+            magic,
+            version,
+            width,
+            height,
+            unique_count,
+            index_count,
+            source_digest,
+            *source_stamp,
+        ) = _HEADER.unpack_from(mapped, 0)
+        frame_bytes = width * height * 4
+        digests_offset = _HEADER.size
+        indices_offset = digests_offset + unique_count * _DIGEST_SIZE
+        durations_offset = indices_offset + index_count * 2
+        frames_offset = durations_offset + index_count * 2
+        valid = (
+            magic == CACHE_MAGIC
+            and version == CACHE_VERSION
+            and (width, height) == size
+            and len(mapped) == frames_offset + unique_count * frame_bytes
+        )
+        if valid and tuple(source_stamp) != stamp:
+            # 크기나 수정 시각이 다를 때만 원본 내용 확인 (내용이 같으면 기록만 갱신)
+            valid = self.read_source(source_name)[1] == source_digest
+            if valid:
+                self._update_stamp(entry_path, stamp)
+        if not valid:
+            # 원본이 바뀌었거나 형식이 다른 캐시는 버리고 다시 생성
+            mapped.close()
+            print(f"오래된 프레임 캐시 재생성: {entry_path.name}")
+            return None
+
+        digests = [
+            mapped[offset : offset + _DIGEST_SIZE]
+            for offset in range(digests_offset, indices_offset, _DIGEST_SIZE)
+        ]
+        indices = list(struct.unpack_from(f"<{index_count}H", mapped, indices_offset))
+        durations = list(
+            struct.unpack_from(f"<{index_count}H", mapped, durations_offset)
+        )
+
+        view = memoryview(mapped)
+        pool = []
+        for index in range(unique_count):
+            offset = frames_offset + index * frame_bytes
+            pool.append(
+                pygame.image.frombuffer(
+                    view[offset : offset + frame_bytes], size, "RGBA"
+                )
+            )
+        return AnimationFrames(pool, digests, indices, durations)
+
+    def _update_stamp(self, entry_path, stamp):
+        """캐시 파일 헤더의 원본 크기와 수정 시각만 갱신 (실패해도 캐시는 그대로 사용)"""
+        try:
+            with open(entry_path, "r+b") as f:
+                f.seek(_STAMP_OFFSET)
+                f.write(_STAMP.pack(*stamp))
+        except OSError as e:
+            print(f"프레임 캐시 갱신 실패 ({entry_path.name}): {e}")
+
+    def _write_entry(self, entry_path, digest, stamp, size, decoded):
+        """프레임 데이터를 캐시 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        unique_frames, digests, indices, durations = decoded
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(
+                        _HEADER.pack(
+                            CACHE_MAGIC,
+                            CACHE_VERSION,
+                            size[0],
+                            size[1],
+                            len(unique_frames),
+                            len(indices),
+                            digest,
+                            *stamp,
+                        )
+                    )
+                    f.write(b"".join(digests))
+                    f.write(struct.pack(f"<{len(indices)}H", *indices))
+                    f.write(
+                        struct.pack(
+                            f"<{len(durations)}H",
+                            *(min(d, _MAX_DURATION) for d in durations),
+                        )
+                    )
+                    for raw in unique_frames:
+                        f.write(raw)
+                os.replace(tmp_path, entry_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"프레임 캐시 저장 실패 ({entry_path.name}): {e}")
@@ -0,0 +1,53 @@
+import hashlib
+import io
+
+# 이 모듈은 디코딩 작업 프로세스에서도 import되므로 pygame에 의존하지 않음
+# PIL은 실제로 디코딩할 때만 import (캐시가 있으면 게임 시작 시 PIL을 불러오지 않음)
+
+
+def frame_digest(raw):
+    """프레임 픽셀 바이트의 해시 (중복 프레임 판별용)"""
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def dedupe_frames(raw_frames):
+    """
+    동일한 프레임을 하나로 합치고 재생 순서를 인덱스 목록으로 반환
+    :return: (고유 프레임 바이트 목록, 고유 프레임 해시 목록, 재생 순서 인덱스 목록)
+    """
+    unique_frames = []
+    digests = []
+    indices = []
+    seen = {}
+    for raw in raw_frames:
+        digest = frame_digest(raw)
+        if digest not in seen:
+            seen[digest] = len(unique_frames)
+            unique_frames.append(raw)
+            digests.append(digest)
+        indices.append(seen[digest])
+    return unique_frames, digests, indices
+
+
+def decode_animation(data, size, flip=False):
+    """
+    GIF 바이트를 디코딩하여 지정한 크기의 RGBA 프레임으로 변환 (중복 프레임 제거)
+    :param data: 원본 GIF 파일 바이트
+    :param size: 조정할 프레임 크기 (width, height)
+    :param flip: True면 좌우 반전
+    :return: dedupe_frames()의 (고유 프레임, 해시, 인덱스)에
+             재생 순서대로 나열한 프레임별 표시 시간 (ms, GIF에 없으면 0)을 더한 튜플
+    """
+    from PIL import Image, ImageSequence
+
+    frames = []
+    durations = []
+    with Image.open(io.BytesIO(data)) as pil_img:
+        for frame in ImageSequence.Iterator(pil_img):
+            durations.append(int(frame.info.get("duration", 0)))
+            # pygame.transform.scale과 같은 최근접 보간 사용
+            frame_copy = frame.convert("RGBA").resize(size, Image.Resampling.NEAREST)
+            if flip:
+                frame_copy = frame_copy.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+            frames.append(frame_copy.tobytes())
+    return (*dedupe_frames(frames), durations)
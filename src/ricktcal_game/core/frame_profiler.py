@@ -0,0 +1,230 @@
+import csv
+import json
+import time
+from collections import deque
+from itertools import islice
+from pathlib import Path
+
+from .config import PROFILER_HISTORY, PROFILER_WINDOW
+from .paths import user_cache_dir
+
+# 프레임 구간 이름 (표시 순서)
+# events/update/render는 Game.run의 한 프레임, render.*는 render 안의 세부 구간,
+# wait는 clock.tick()이 프레임 제한을 위해 기다린 시간
+PHASE_EVENTS = "events"
+PHASE_UPDATE = "update"
+PHASE_RENDER = "render"
+PHASE_LAYERS = "render.layers"  # 레이어 수집, 바뀐 영역 계산
+PHASE_SPRITES = "render.sprites"
+PHASE_HUD = "render.hud"
+PHASE_OVERLAY = "render.overlay"
+PHASE_PRESENT = "render.present"  # display.flip/update
+PHASE_WAIT = "wait"
+PHASES = (
+    PHASE_EVENTS,
+    PHASE_UPDATE,
+    PHASE_RENDER,
+    PHASE_LAYERS,
+    PHASE_SPRITES,
+    PHASE_HUD,
+    PHASE_OVERLAY,
+    PHASE_PRESENT,
+    PHASE_WAIT,
+)
+FRAME = "frame"  # 이전 프레임 시작부터 이번 프레임 시작까지 (실제 프레임 시간)
+
+
+def profile_dir():
+    """프레임 기록을 저장하는 디렉터리"""
+    return user_cache_dir() / "profiles"
+
+
+def percentile(sorted_values, percent):
+    """정렬된 값 목록의 백분위수 (nearest-rank, 값이 없으면 0)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100)))
+    return sorted_values[rank]
+
+
+class _Phase:
+    """with 블록의 실행 시간을 현재 프레임의 구간 시간에 더하는 타이머 (구간마다 재사용)"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        times = self.profiler.current
+        times[self.name] = times.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+class _NullPhase:
+    """프로파일러가 꺼져 있을 때 사용하는 아무 일도 하지 않는 타이머"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class FrameProfiler:
+    """
+    프레임 구간별 시간 측정기
+    구간 시간은 프레임마다 한 줄로 모아 최근 history 프레임을 보관하고,
+    최근 window 프레임으로 p50/p95/p99를 계산 (오버레이 표시, 종료 시 CSV/JSON 저장)
+    """
+
+    def __init__(self, enabled=True, window=PROFILER_WINDOW, history=PROFILER_HISTORY):
+        self.enabled = enabled
+        self.window = window
+        self.frames = deque(maxlen=history)  # 프레임별 {구간: 초}
+        self.current = {}  # 측정 중인 프레임의 구간 시간
+        self._phases = {}
+        self._frame_start = None
+        self.frame_count = 0
+
+    def phase(self, name):
+        """
+        구간 시간 측정용 컨텍스트 관리자 (같은 프레임에서 여러 번 쓰면 합산)
+        사용: with profiler.phase(PHASE_UPDATE): ...
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        timer = self._phases.get(name)
+        if timer is None:
+            timer = self._phases[name] = _Phase(self, name)
+        return timer
+
+    def begin_frame(self):
+        """
+        새 프레임 시작 (이전 프레임을 기록)
+        프레임 시간은 프레임 시작 간격이므로 구간에 잡히지 않은 시간도 포함
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.current[FRAME] = now - self._frame_start
+            self.frames.append(self.current)
+            self.frame_count += 1
+        self.current = {}
+        self._frame_start = now
+
+    def recent(self, name, window=None):
+        """
+        최근 window 프레임의 구간 시간 목록 (ms, 최근 프레임부터, 구간이 없었던 프레임은 제외)
+        """
+        window = window or self.window
+        values = []
+        for frame in islice(reversed(self.frames), window):
+            value = frame.get(name)
+            if value is not None:
+                values.append(value * 1000)
+        return values
+
+    def stats(self, name, window=None):
+        """최근 window 프레임의 (p50, p95, p99) ms"""
+        values = sorted(self.recent(name, window))
+        return (
+            percentile(values, 50),
+            percentile(values, 95),
+            percentile(values, 99),
+        )
+
+    def histogram(self, name=FRAME, bins=20, max_ms=50.0, window=None):
+        """
+        최근 window 프레임의 구간 시간 히스토그램
+        :return: 구간별 프레임 수 목록 (마지막 구간은 max_ms 이상 전부 포함)
+        """
+        counts = [0] * bins
+        width = max_ms / bins
+        for value in self.recent(name, window):
+            counts[min(bins - 1, int(value / width))] += 1
+        return counts
+
+    def phase_names(self):
+        """기록된 구간 이름 (PHASES 순서, 그 외 구간은 뒤에 이름순)"""
+        seen = set()
+        for frame in self.frames:
+            seen.update(frame)
+        seen.discard(FRAME)
+        known = [name for name in PHASES if name in seen]
+        return known + sorted(seen - set(PHASES))
+
+    def summary(self):
+        """전체 기록의 구간별 통계 (JSON 저장용)"""
+        summary = {}
+        for name in [FRAME] + self.phase_names():
+            values = sorted(self.recent(name, len(self.frames)))
+            summary[name] = {
+                "count": len(values),
+                "mean_ms": sum(values) / len(values) if values else 0.0,
+                "p50_ms": percentile(values, 50),
+                "p95_ms": percentile(values, 95),
+                "p99_ms": percentile(values, 99),
+                "max_ms": values[-1] if values else 0.0,
+            }
+        return summary
+
+    def dump(self, path=None):
+        """
+        기록을 파일로 저장 (확장자가 .json이면 JSON, 그 외에는 CSV)
+        CSV: 프레임마다 한 줄, 구간별 ms (측정되지 않은 구간은 빈 칸)
+        JSON: 구간별 통계(summary)와 프레임별 기록(columns, rows)
+        :return: 저장한 파일 경로 (기록이 없거나 실패하면 None)
+        """
+        if not self.frames:
+            return None
+        if path is None:
+            path = profile_dir() / time.strftime("frames_%Y%m%d_%H%M%S.csv")
+        path = Path(path)
+        columns = [FRAME] + self.phase_names()
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.suffix == ".json":
+                data = {
+                    "frames": len(self.frames),
+                    "summary": self.summary(),
+                    "columns": columns,
+                    "rows": [
+                        [
+                            round(frame[name] * 1000, 4) if name in frame else None
+                            for name in columns
+                        ]
+                        for frame in self.frames
+                    ],
+                }
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+            else:
+                with open(path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    writer.writerow([f"{name}_ms" for name in columns])
+                    for frame in self.frames:
+                        writer.writerow(
+                            [
+                                f"{frame[name] * 1000:.4f}" if name in frame else ""
+                                for name in columns
+                            ]
+                        )
+            print(f"프레임 기록 저장: {path}")
+            return path
+        except OSError as e:
+            print(f"프레임 기록 저장 실패: {e}")
+            return None
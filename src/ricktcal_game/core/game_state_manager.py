@@ -1,7 +1,5 @@
 import time
 
-import pygame
-
 from ..core.config import *
 
 
@@ -10,7 +8,7 @@ class GameStateManager:
 
     def __init__(self, game=None):
         self.game = game
-        self.game_state = SCENE_TITLE
+        self._game_state = SCENE_TITLE
 
         self.game_over = False
         self.game_over_triggered = False
@@ -20,6 +18,7 @@ class GameStateManager:
         self.score = 0
         self.gauge = INITIAL_GAUGE
         self.skill_charges = INITIAL_SKILL_CHARGES
+        self.skill_end_time = 0  # 스킬 모션이 끝나는 시뮬레이션 시각 (초)
         self.last_turn_time = 0
         self.prev_facing_state = False
 
@@ -27,6 +26,21 @@ class GameStateManager:
         self.loading_start_time = 0
         self.loading_progress = 0
 
+    @property
+    def game_state(self):
+        """현재 씬 이름"""
+        return self._game_state
+
+    @game_state.setter
+    def game_state(self, state):
+        """씬 전환 (다른 씬으로 바뀌면 새 씬의 enter() 호출)"""
+        if state == self._game_state:
+            return
+        self._game_state = state
+        scene = getattr(self.game, "scenes", {}).get(state)
+        if scene is not None:
+            scene.enter()
+
     def reset_game(self):
         """게임 상태를 초기값으로 리셋"""
         self.game_state = SCENE_TITLE
@@ -38,6 +52,7 @@ class GameStateManager:
         self.score = 0
         self.gauge = INITIAL_GAUGE
         self.skill_charges = INITIAL_SKILL_CHARGES
+        self.skill_end_time = 0
         self.last_turn_time = 0
         self.prev_facing_state = False
 
@@ -79,10 +94,14 @@ class GameStateManager:
                 return True
         return False
 
-    def update_gauge(self, is_dancing):
-        """게이지 업데이트 및 게임 오버 체크"""
+    def update_gauge(self, is_dancing, current_time=None):
+        """
+        게이지 업데이트 및 게임 오버 체크 (시뮬레이션 한 스텝)
+        :param current_time: 시뮬레이션 시각 (초, None이면 게임 시계 사용)
+        """
         # TODO : 게이지 고갈 경고음 추가 / 제거 여부 결정
-        current_time = pygame.time.get_ticks() / 1000  # 초 단위
+        if current_time is None:
+            current_time = self.game.sim_clock.time
 
         # 에너지 고갈 경고음 (20% 이하일 때)
         if (
@@ -110,55 +129,27 @@ class GameStateManager:
             return True
         return False
 
-    def use_skill(self):
-        """스킬 사용"""
+    def use_skill(self, current_time=None):
+        """
+        스킬 사용 (스킬 모션은 SKILL_EFFECT_DURATION초 동안 유지)
+        :param current_time: 시뮬레이션 시각 (초, None이면 게임 시계 사용)
+        """
         if self.skill_charges > 0:
+            if current_time is None:
+                current_time = self.game.sim_clock.time
             self.gauge = min(100, self.gauge + SKILL_CHARGE)
             self.skill_charges -= 1
+            self.skill_end_time = current_time + SKILL_EFFECT_DURATION
             return True
         return False
 
-    def update_score(self):
-        """점수 업데이트"""
-        self.score += 0.1
+    def skill_active(self, current_time):
+        """스킬 모션이 아직 유지 중인지 여부"""
+        return current_time < self.skill_end_time
 
-    def update_gameplay(self):
-        """게임 플레이 로직 업데이트"""
-        # TODO : 선생님 방향 전환 sfx 추가 여부 결정
-        current_time = pygame.time.get_ticks() / 1000  # 초 단위
-
-        # 게임 오버 지연 체크
-        if self.check_game_over_delay(current_time):
-            return
-
-        if not self.game_over and not self.game_over_triggered:
-            # 선생님(들) 업데이트
-            for teacher_name, teacher in self.game.entities["teachers"].items():
-                prev_state = teacher.facing_away
-                teacher.update(current_time * 1000)
-
-                # 방향 전환 감지 및 효과음 재생
-                if teacher.facing_away != prev_state:
-                    self.last_turn_time = current_time
-                    # 선생님 방향 전환 효과음 재생
-                    if hasattr(self.game, "sound_manager"):
-                        self.game.sound_manager.play_sfx("turn")
-
-            # 모든 학생 상태 확인
-            active_student = self.game.erpin  # 현재 활성화된 학생
-
-            # 게임 오버 조건 체크 (춤추다 들킨 경우)
-            if active_student.dancing and not self.game.sherum.facing_away:
-                elapsed = current_time - self.last_turn_time
-                if elapsed > GRACE_PERIOD:
-                    self.trigger_game_over(current_time, "caught")
-
-            # 게이지 업데이트 및 게임 오버 체크
-            if self.update_gauge(active_student.dancing):
-                self.trigger_game_over(current_time, "no_energy")
-
-            # 점수 업데이트
-            self.update_score()
+    def update_score(self):
+        """점수 업데이트 (시뮬레이션 한 스텝)"""
+        self.score += SCORE_PER_STEP
 
     def show_warning(self, text):
         """경고 메시지 표시"""
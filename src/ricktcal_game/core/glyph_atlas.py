@@ -0,0 +1,101 @@
+import pygame
+
+DIGITS = "0123456789"
+
+
+class GlyphAtlas:
+    """
+    숫자, ':' 글리프와 고정 라벨을 폰트/크기/색상별로 한 번만 렌더링해 두고
+    문자열을 글리프 blit으로 조합하는 텍스트 렌더러 (매 프레임 바뀌는 점수, 시간 표시용)
+    숫자는 가장 넓은 숫자 폭의 칸에 가운데 정렬하므로 값이 바뀌어도 글자가 흔들리지 않음
+    """
+
+    def __init__(self, font, color, antialias=True, labels=()):
+        self.font = font
+        self.color = tuple(color)
+        self.antialias = antialias
+
+        self.digits = [font.render(digit, antialias, self.color) for digit in DIGITS]
+        self.colon = font.render(":", antialias, self.color)
+        self.digit_width = max(glyph.get_width() for glyph in self.digits)
+        self.height = max(
+            [font.get_height(), self.colon.get_height()]
+            + [glyph.get_height() for glyph in self.digits]
+        )
+
+        self.labels = {}
+        for label in labels:
+            self.add_label(label)
+
+    def add_label(self, label):
+        """라벨 문자열을 미리 렌더링 (이미 있으면 다시 렌더링하지 않음)"""
+        surface = self.labels.get(label)
+        if surface is None:
+            surface = self.labels[label] = self.font.render(
+                label, self.antialias, self.color
+            )
+        return surface
+
+    def _digit_indices(self, value, min_digits):
+        """정수의 자릿수 목록 (앞자리부터, 음수는 0으로 표시)"""
+        value = max(0, int(value))
+        indices = []
+        while True:
+            value, digit = divmod(value, 10)
+            indices.append(digit)
+            if value == 0 and len(indices) >= min_digits:
+                break
+        indices.reverse()
+        return indices
+
+    def _run(self, label, fields):
+        """
+        라벨과 ':'로 구분된 숫자 필드를 그릴 (Surface, x 오프셋) 목록과 전체 폭 반환
+        :param fields: (값, 최소 자릿수) 목록
+        """
+        run = []
+        x = 0
+        if label:
+            surface = self.add_label(label)
+            run.append((surface, 0))
+            x = surface.get_width()
+
+        for index, (value, min_digits) in enumerate(fields):
+            if index:
+                run.append((self.colon, x))
+                x += self.colon.get_width()
+            for digit in self._digit_indices(value, min_digits):
+                glyph = self.digits[digit]
+                run.append((glyph, x + (self.digit_width - glyph.get_width()) // 2))
+                x += self.digit_width
+        return run, x
+
+    def _draw_run(self, surface, pos, run, width):
+        x, y = pos
+        surface.blits([(glyph, (x + offset, y)) for glyph, offset in run], False)
+        return pygame.Rect(x, y, width, self.height)
+
+    def number_rect(self, pos, value, label=None, min_digits=1):
+        """draw_number()가 그릴 영역"""
+        _, width = self._run(label, [(value, min_digits)])
+        return pygame.Rect(pos[0], pos[1], width, self.height)
+
+    def draw_number(self, surface, pos, value, label=None, min_digits=1):
+        """
+        라벨과 정수를 그리고 그린 영역 반환
+        :param label: 숫자 앞에 붙일 라벨 (예: "점수: ")
+        """
+        run, width = self._run(label, [(value, min_digits)])
+        return self._draw_run(surface, pos, run, width)
+
+    def time_rect(self, pos, seconds, label=None):
+        """draw_time()이 그릴 영역"""
+        minutes, seconds = divmod(max(0, int(seconds)), 60)
+        _, width = self._run(label, [(minutes, 2), (seconds, 2)])
+        return pygame.Rect(pos[0], pos[1], width, self.height)
+
+    def draw_time(self, surface, pos, seconds, label=None):
+        """라벨과 MM:SS 형식의 시간을 그리고 그린 영역 반환"""
+        minutes, seconds = divmod(max(0, int(seconds)), 60)
+        run, width = self._run(label, [(minutes, 2), (seconds, 2)])
+        return self._draw_run(surface, pos, run, width)
@@ -0,0 +1,37 @@
+import os
+import sys
+from pathlib import Path
+
+APP_NAME = "ricktcal_game"
+
+
+def user_cache_dir():
+    """사용자별 캐시 디렉터리 경로 반환 (RICKTCAL_CACHE_DIR 환경 변수로 변경 가능)"""
+    override = os.environ.get("RICKTCAL_CACHE_DIR")
+    if override:
+        return Path(override)
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+
+    return Path(base) / APP_NAME
+
+
+def user_config_dir():
+    """사용자별 설정 디렉터리 경로 반환 (RICKTCAL_CONFIG_DIR 환경 변수로 변경 가능)"""
+    override = os.environ.get("RICKTCAL_CONFIG_DIR")
+    if override:
+        return Path(override)
+
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+
+    return Path(base) / APP_NAME
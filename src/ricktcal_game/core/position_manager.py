@@ -1,68 +1,153 @@
 import json
 import os
+import tempfile
+from pathlib import Path
+from types import MappingProxyType
+
+from .config import SCREEN_HEIGHT, SCREEN_WIDTH
+
+POSITION_FILE = Path(__file__).with_name("position.json")
+
+# 기준점 이름 -> 화면 크기에 대한 비율 (x, y)
+# position.json 항목에 "anchor"를 지정하면 x, y는 기준점으로부터의 오프셋이 됨
+ANCHORS = {
+    "top_left": (0.0, 0.0),
+    "top": (0.5, 0.0),
+    "top_right": (1.0, 0.0),
+    "left": (0.0, 0.5),
+    "center": (0.5, 0.5),
+    "right": (1.0, 0.5),
+    "bottom_left": (0.0, 1.0),
+    "bottom": (0.5, 1.0),
+    "bottom_right": (1.0, 1.0),
+}
+
+# position.json을 읽지 못했을 때 사용할 기본 위치 정보
+DEFAULT_POSITIONS = {
+    "erpin": {"x": 600, "y": 50},
+    "sherum": {"x": 100, "y": 300},
+    "joanne": {"x": 300, "y": 50},
+}
+
+
+def resolve_position(entry, screen_size):
+    """위치 항목 하나를 화면 크기에 맞는 정수 좌표로 변환"""
+    fx, fy = ANCHORS[entry.get("anchor", "top_left")]
+    return (
+        int(round(screen_size[0] * fx + entry["x"])),
+        int(round(screen_size[1] * fy + entry["y"])),
+    )
+
+
+def compile_layout(entries, screen_size):
+    """위치 항목 전체를 미리 계산하여 읽기 전용 좌표 표로 반환 {이름: (x, y)}"""
+    return MappingProxyType(
+        {name: resolve_position(entry, screen_size) for name, entry in entries.items()}
+    )
 
 
 class PositionManager:
-    def __init__(self):
-        self.positions = {}
+    """
+    엔티티 위치 관리 클래스
+    position.json은 시작할 때 한 번만 읽어 좌표 표로 컴파일하고,
+    명시적으로 위치를 수정(set_position)해서 값이 바뀔 때만 파일에 저장
+    """
+
+    def __init__(self, screen_size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.screen_size = tuple(screen_size)
+        self.entries = {}
+        self.positions = MappingProxyType({})
+        self.student_positions = MappingProxyType({})
+        self._warned = set()  # 위치 정보 없음 경고를 이미 출력한 엔티티
+
         self.load_positions()
-        self.student_positions = {}
         self.update_student_positions()
 
     def load_positions(self):
         """position.json 파일에서 엔티티 위치 정보 로드"""
         try:
-            json_path = os.path.join("src", "ricktcal_game", "core", "position.json")
-            with open(json_path, "r") as f:
-                self.positions = json.load(f)
+            with open(POSITION_FILE, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            for name, entry in entries.items():
+                if entry.get("anchor", "top_left") not in ANCHORS:
+                    raise ValueError(f"{name}: 알 수 없는 기준점 {entry['anchor']}")
+            # 좌표가 빠진 항목 등도 여기서 실패하도록 컴파일까지 함께 시도
+            self.positions = compile_layout(entries, self.screen_size)
+            self.entries = entries
             print("위치 정보 로드 성공!")
         except Exception as e:
             print(f"위치 정보 로드 실패: {e}")
             # 기본 위치 정보 설정
-            self.positions = {
-                "erpin": {"x": 600, "y": 50},
-                "sherum": {"x": 100, "y": 300},
-                "joanne": {"x": 300, "y": 50},
+            self.entries = {
+                name: dict(entry) for name, entry in DEFAULT_POSITIONS.items()
             }
+            self.positions = compile_layout(self.entries, self.screen_size)
 
     def update_student_positions(self):
-        """학생 캐릭터들의 위치를 자동으로 계산"""
+        """학생 캐릭터들의 기본 위치 계산 (position.json에 없는 학생에만 적용, 저장 안 함)"""
         base_x = 600  # joanne 기준 오른쪽, erpin 기준 왼쪽 (더 오른쪽으로)
         base_y = 50
         spacing_x = -520  # 더 넓은 간격으로 겹침 방지
 
         student_names = ["joanne", "erpin"]
 
+        student_positions = {}
         for i, name in enumerate(student_names):
             # 각 학생의 위치 계산 (죠안이 왼쪽, 에르핀이 오른쪽)
             pos_x = base_x + (i * spacing_x)
 
-            if name not in self.positions:
-                self.positions[name] = {"x": pos_x, "y": base_y}
+            if name not in self.entries:
+                self.entries[name] = {"x": pos_x, "y": base_y}
 
-            self.student_positions[name] = (pos_x, base_y)
+            student_positions[name] = (pos_x, base_y)
 
-        self.save_positions()
+        self.student_positions = MappingProxyType(student_positions)
+        self.positions = compile_layout(self.entries, self.screen_size)
 
     def get_position(self, entity_name):
-        """지정된 엔티티의 위치 반환"""
-        if entity_name in self.positions:
-            pos = self.positions[entity_name]
-            return (pos["x"], pos["y"])
-        else:
-            print(f"경고: {entity_name}의 위치 정보가 없습니다. 기본값 사용.")
+        """지정된 엔티티의 위치 반환 (미리 계산된 좌표, 없으면 한 번만 경고)"""
+        position = self.positions.get(entity_name)
+        if position is None:
+            if entity_name not in self._warned:
+                self._warned.add(entity_name)
+                print(f"경고: {entity_name}의 위치 정보가 없습니다. 기본값 사용.")
             return (0, 0)
+        return position
 
     def get_all_student_positions(self):
         """모든 학생의 위치 정보 반환"""
         return self.student_positions
 
+    def set_position(self, entity_name, x, y, anchor=None):
+        """
+        엔티티 위치 수정 (값이 바뀐 경우에만 다시 계산하고 파일에 저장)
+        :param anchor: 기준점 이름 (None이면 기준점 없이 화면 좌상단 기준)
+        """
+        entry = {"x": x, "y": y}
+        if anchor is not None:
+            if anchor not in ANCHORS:
+                raise ValueError(f"알 수 없는 기준점: {anchor}")
+            entry["anchor"] = anchor
+        if self.entries.get(entity_name) == entry:
+            return False
+
+        self.entries[entity_name] = entry
+        self.positions = compile_layout(self.entries, self.screen_size)
+        self._warned.discard(entity_name)
+        self.save_positions()
+        return True
+
     def save_positions(self):
-        """변경된 위치 정보를 파일에 저장"""
+        """위치 정보를 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
         try:
-            json_path = os.path.join("src", "ricktcal_game", "core", "position.json")
-            with open(json_path, "w") as f:
-                json.dump(self.positions, f, indent=2)
+            fd, tmp_path = tempfile.mkstemp(dir=POSITION_FILE.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self.entries, f, indent=2)
+                os.replace(tmp_path, POSITION_FILE)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             print("위치 정보 저장 성공!")
         except Exception as e:
             print(f"위치 정보 저장 실패: {e}")
@@ -1,8 +1,12 @@
 import math
+from typing import Any, Callable, NamedTuple
 
 import pygame
 
 from .config import (
+    RENDER_DIRTY,
+    RENDER_FULL,
+    RENDER_MODE,
     SCENE_GAMEOVER,
     SCENE_LOADING,
     SCENE_PLAYING,
@@ -10,19 +14,151 @@ from .config import (
     SCENE_TITLE,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
+    SIM_INTERPOLATION,
 )
+from ..ui import Label, Panel, ProfilerOverlay, Slider, WidgetTree
+from .display import scaled_active
+from .frame_profiler import (
+    PHASE_HUD,
+    PHASE_LAYERS,
+    PHASE_OVERLAY,
+    PHASE_PRESENT,
+    PHASE_SPRITES,
+    FrameProfiler,
+)
+from .glyph_atlas import GlyphAtlas
+
+GAME_BACKGROUND = (255, 255, 255)
+
+# HUD 숫자 앞에 붙는 라벨 (글리프 아틀라스에 미리 렌더링)
+HUD_LABELS = {"score": "점수: ", "skill": "스킬: ", "time": "경과 시간: "}
+HUD_LABELS_DEFAULT = {"score": "Score: ", "skill": "Skill: ", "time": "Time: "}
+HUD_TEXT_COLOR = (255, 255, 255)
+HUD_GAUGE_RECT = (20, 20, 200, 30)
+HUD_TEXT_POS = (20, 60)  # 점수 텍스트 위치 (게이지 바 아래 10픽셀)
+HUD_TEXT_SPACING = 35
+PLAY_TIME_COLOR = (30, 30, 30)
+PROFILER_OVERLAY_POS = (SCREEN_WIDTH - 340, SCREEN_HEIGHT - 260)
+
+
+class RenderLayer(NamedTuple):
+    """게임 화면에 그릴 요소 하나 (영역이나 서명이 바뀌면 다시 그림)"""
+
+    name: str
+    rect: pygame.Rect  # 이번 프레임에 그릴 영역
+    signature: Any  # 내용이 바뀌었는지 판단하는 값 (이미지, 위치, 표시 값 등)
+    draw: Callable[[], None]
+    phase: str = PHASE_SPRITES  # 그리기 시간을 기록할 프로파일러 구간
+
+
+def merge_rects(rects):
+    """겹치는 사각형을 합쳐서 반환 (같은 픽셀을 두 번 그리거나 보내지 않도록)"""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        index = 0
+        while index < len(merged):
+            if rect.colliderect(merged[index]):
+                rect.union_ip(merged.pop(index))
+                index = 0
+            else:
+                index += 1
+        merged.append(rect)
+    return merged
 
 
 class Renderer:
     """게임 렌더링을 담당하는 클래스"""
 
-    def __init__(self, game):
+    def __init__(self, game, render_mode=RENDER_MODE):
         self.game = game
         self.screen = game.screen
+        self.render_mode = render_mode
+
+        # 더티 렉트 모드: 레이어 이름 -> (이전 프레임 영역, 서명)
+        self._layers = {}
+        self._full_redraw = True
+        self._last_state = None
+        self._atlases = {}  # 폰트 관리자가 없을 때 사용할 색상별 글리프 아틀라스
+        self.build_hud()
+
+        # 프레임 프로파일러 (게임에 없으면 측정하지 않음)와 오버레이
+        if hasattr(game, "profiler"):
+            self.profiler = game.profiler
+        else:
+            self.profiler = FrameProfiler(enabled=False)
+        self.profiler_overlay = None
+        self.show_profiler = False
+
+        # 화면으로 보낸 픽셀 수 통계
+        self.frames = 0
+        self.pixels_pushed = 0  # 마지막 프레임
+        self.total_pixels_pushed = 0
+
+    def set_render_mode(self, render_mode):
+        """렌더링 방식 변경 (RENDER_DIRTY 또는 RENDER_FULL)"""
+        if render_mode not in (RENDER_DIRTY, RENDER_FULL):
+            raise ValueError(f"알 수 없는 렌더링 방식: {render_mode}")
+        self.render_mode = render_mode
+        self._full_redraw = True
+
+    def invalidate(self):
+        """다음 프레임에 화면 전체를 다시 그리도록 표시 (창 크기 변경, 전체 화면 전환 등)"""
+        self._full_redraw = True
+
+    def toggle_profiler(self):
+        """프로파일러 오버레이 표시/숨기기 (숨기면 가려졌던 영역을 다시 그림)"""
+        self.show_profiler = not self.show_profiler
+        if self.show_profiler and self.profiler_overlay is None:
+            self.profiler_overlay = ProfilerOverlay(PROFILER_OVERLAY_POS, self.profiler)
+        if not self.show_profiler:
+            self.invalidate()
+
+    def draw_profiler_overlay(self):
+        """
+        프로파일러 오버레이 그리기 (불투명하므로 덮어 그리기만 하면 됨)
+        :return: 오버레이 영역 (숨김 상태면 None)
+        """
+        if not self.show_profiler:
+            return None
+        with self.profiler.phase(PHASE_OVERLAY):
+            self.profiler_overlay.draw(self.screen)
+        return self.profiler_overlay.rect
+
+    @property
+    def average_pixels_pushed(self):
+        """프레임당 평균 전송 픽셀 수"""
+        return self.total_pixels_pushed / self.frames if self.frames else 0
+
+    def _record_pixels(self, pixels):
+        """화면으로 보낸 픽셀 수 기록 (flip()으로 표시한 프레임은 화면 전체)"""
+        self.frames += 1
+        self.pixels_pushed = pixels
+        self.total_pixels_pushed += pixels
 
     def render(self):
         """현재 게임 상태에 따라 화면 렌더링"""
         current_state = self.game.state_manager.game_state
+        if current_state != self._last_state:
+            # 다른 씬이 화면을 덮었으므로 게임 화면은 처음부터 다시 그림
+            self._last_state = current_state
+            self._full_redraw = True
+
+        if current_state == SCENE_PLAYING and self.render_mode == RENDER_DIRTY:
+            rects = self.render_game_dirty()
+            overlay_rect = self.draw_profiler_overlay()
+            if overlay_rect is not None:
+                rects = merge_rects(rects + [overlay_rect])
+            with self.profiler.phase(PHASE_PRESENT):
+                if scaled_active():
+                    # SCALED 모드는 부분 갱신도 창 전체를 다시 그리므로 flip()으로 표시
+                    pygame.display.flip()
+                    pixels = self.screen.get_width() * self.screen.get_height()
+                else:
+                    pygame.display.update(rects)
+                    pixels = sum(rect.width * rect.height for rect in rects)
+            self._record_pixels(pixels)
+            return
 
         if current_state == SCENE_TITLE:
             self.render_title()
@@ -42,7 +178,10 @@ class Renderer:
                 )
                 self.screen.blit(error_text, (100, 100))
 
-        pygame.display.flip()
+        self.draw_profiler_overlay()
+        with self.profiler.phase(PHASE_PRESENT):
+            pygame.display.flip()
+        self._record_pixels(self.screen.get_width() * self.screen.get_height())
 
     def render_title(self):
         """타이틀 화면 렌더링"""
@@ -79,143 +218,228 @@ class Renderer:
             print(f"로딩 렌더링 오류: {e}")
 
     def render_game(self):
-        """게임 화면 렌더링"""
-        self.screen.fill((255, 255, 255))
+        """게임 화면 전체를 다시 렌더링"""
+        with self.profiler.phase(PHASE_LAYERS):
+            layers = self.collect_game_layers()
+        self.screen.fill(GAME_BACKGROUND)
+        for layer in layers:
+            with self.profiler.phase(layer.phase):
+                layer.draw()
+        self._layers = {layer.name: (layer.rect, layer.signature) for layer in layers}
+        self._full_redraw = False
+
+    def render_game_dirty(self):
+        """
+        게임 화면에서 바뀐 영역만 다시 렌더링
+        :return: 화면에 표시해야 할 영역 목록 (display.update에 전달)
+        """
+        if self._full_redraw:
+            self.render_game()
+            return [self.screen.get_rect()]
+
+        profiler = self.profiler
+        with profiler.phase(PHASE_LAYERS):
+            layers = self.collect_game_layers()
+            rects = self.dirty_rects(layers)
+
+        # 바뀐 영역마다 배경을 지우고, 그 영역에 걸친 레이어를 순서대로 다시 그림
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self.screen.fill(GAME_BACKGROUND)
+            for layer in layers:
+                if layer.rect.colliderect(rect):
+                    with profiler.phase(layer.phase):
+                        layer.draw()
+        self.screen.set_clip(None)
+        return rects
+
+    def dirty_rects(self, layers):
+        """이전 프레임과 비교해 다시 그려야 할 영역 목록 (겹치는 영역은 합침)"""
+        # 영역이나 내용이 바뀐 레이어의 이전/현재 영역, 사라진 레이어의 이전 영역
+        dirty = []
+        current = {}
+        for layer in layers:
+            current[layer.name] = (layer.rect, layer.signature)
+            previous = self._layers.get(layer.name)
+            if previous != current[layer.name]:
+                dirty.append(layer.rect)
+                if previous is not None:
+                    dirty.append(previous[0])
+        for name, (rect, _) in self._layers.items():
+            if name not in current:
+                dirty.append(rect)
+        self._layers = current
+
+        screen_rect = self.screen.get_rect()
+        return merge_rects(
+            rect.clip(screen_rect) for rect in dirty if rect.colliderect(screen_rect)
+        )
 
-        if self.game.sprites:
-            # 선생님 엔티티 렌더링
-            for teacher in self.game.entities["teachers"].values():
-                self.game.sprites.draw_entity(self.screen, teacher)
+    def collect_game_layers(self):
+        """이번 프레임에 그릴 게임 화면 레이어 목록 (그리는 순서대로)"""
+        layers = []
 
-            # 학생 엔티티 렌더링
-            for student in self.game.entities["students"].values():
-                self.game.sprites.draw_entity(self.screen, student)
+        if self.game.sprites:
+            # 선생님, 학생 엔티티 (모든 엔티티의 애니메이션 프레임을 한 번에 계산)
+            self.game.sprites.advance_frames(self.game.entity_store)
+            alpha = self.game.sim_clock.alpha if SIM_INTERPOLATION else None
+            for category in ("teachers", "students"):
+                for entity_id, entity in self.game.entities[category].items():
+                    sprite = self.game.sprites.entity_sprite(entity, alpha)
+                    if sprite is None:
+                        continue
+                    frame, pos = sprite
+                    layers.append(
+                        RenderLayer(
+                            f"{category}/{entity_id}",
+                            frame.get_rect(topleft=pos),
+                            (frame, pos),
+                            lambda frame=frame, pos=pos: self.screen.blit(frame, pos),
+                        )
+                    )
 
-            # 느낌표 렌더링 (게임 오버 트리거 시)
+            # 느낌표 (게임 오버 트리거 시, 박동 효과로 매 프레임 변함)
             if self.game.state_manager.show_exclamation:
                 sherum_pos = self.game.position_manager.get_position("sherum")
                 # 느낌표 위치 - 선생님 기준 오른쪽
                 exclamation_pos = (sherum_pos[0] + 300, sherum_pos[1] + 100)
-                self.draw_exclamation(exclamation_pos)
-
-        # 인게임 경과 시간 표시 (우측 상단)
-        play_time_str = "00:00"
-        if (
-            hasattr(self.game, "play_start_ticks")
-            and self.game.play_start_ticks is not None
-            and self.game.state_manager.game_state == SCENE_PLAYING
-        ):
-            elapsed_ms = pygame.time.get_ticks() - self.game.play_start_ticks
-            elapsed_sec = elapsed_ms // 1000
-            minutes = elapsed_sec // 60
-            seconds = elapsed_sec % 60
-            play_time_str = f"{minutes:02d}:{seconds:02d}"
-        if hasattr(self.game, "font_manager"):
-            time_text = self.game.font_manager.render_text(
-                f"경과 시간: {play_time_str}", "korean", "normal", (30, 30, 30)
-            )
-        else:
-            time_text = self.game.font.render(
-                f"Time: {play_time_str}", True, (30, 30, 30)
-            )
-        self.screen.blit(time_text, (SCREEN_WIDTH - 300, 30))
-
-        self.render_ui()
+                current_time = pygame.time.get_ticks() / 1000
+                layers.append(
+                    RenderLayer(
+                        "exclamation",
+                        self.exclamation_rect(exclamation_pos),
+                        current_time,
+                        lambda: self.draw_exclamation(exclamation_pos, current_time),
+                    )
+                )
 
-    def render_ui(self):
-        """UI 요소 렌더링"""
-        gauge_x = 20
-        gauge_y = 20
-        gauge_width = 200
-        gauge_height = 30
-
-        # 게이지 바
-        pygame.draw.rect(
-            self.screen, (0, 0, 200), (gauge_x, gauge_y, gauge_width, gauge_height)
+        # 인게임 경과 시간 표시 (우측 상단, 초가 바뀔 때만 다시 그림)
+        seconds = self.play_time_seconds()
+        atlas, labels = self.hud_atlas(PLAY_TIME_COLOR)
+        time_pos = (SCREEN_WIDTH - 300, 30)
+        layers.append(
+            RenderLayer(
+                "play_time",
+                atlas.time_rect(time_pos, seconds, labels["time"]),
+                seconds,
+                lambda: atlas.draw_time(self.screen, time_pos, seconds, labels["time"]),
+                PHASE_HUD,
+            )
         )
-        pygame.draw.rect(
-            self.screen,
-            (0, 200, 0),
-            (gauge_x, gauge_y, self.game.state_manager.gauge * 2, gauge_height),
+
+        # 게이지, 점수, 스킬, 조작법
+        state = self.game.state_manager
+        layers.append(
+            RenderLayer(
+                "ui",
+                self.ui_rect(),
+                (state.gauge, int(state.score), state.skill_charges),
+                self.render_ui,
+                PHASE_HUD,
+            )
         )
+        return layers
 
-        text_y = gauge_y + gauge_height + 10
-        text_spacing = 35
+    def play_time_seconds(self):
+        """인게임 경과 시간 (시뮬레이션 기준 초, 게임 중이 아니면 0)"""
+        if self.game.state_manager.game_state == SCENE_PLAYING:
+            return int(self.game.play_time)
+        return 0
 
-        # 텍스트 배경 TODO : 텍스트 배경 이미지 리소스 추가
-        pygame.draw.rect(
-            self.screen,
-            (0, 0, 0, 128),
-            (gauge_x - 5, text_y - 5, 250, 150),
-            border_radius=5,
-        )
+    def hud_atlas(self, color):
+        """HUD 숫자용 글리프 아틀라스와 라벨 반환 (폰트 관리자가 없으면 기본 폰트 사용)"""
+        if hasattr(self.game, "font_manager"):
+            atlas = self.game.font_manager.get_glyph_atlas(
+                "korean", "normal", color, HUD_LABELS.values()
+            )
+            return atlas, HUD_LABELS
 
-        # 점수 및 스킬 표시
-        try:
-            if hasattr(self.game, "font_manager"):
-                # 점수 텍스트
-                score_text = self.game.font_manager.render_text(
-                    f"점수: {int(self.game.state_manager.score)}",
-                    "korean",
-                    "normal",
-                    (255, 255, 255),
-                )
-                self.screen.blit(score_text, (gauge_x, text_y))
-
-                # 스킬 텍스트
-                skill_text = self.game.font_manager.render_text(
-                    f"스킬: {self.game.state_manager.skill_charges}",
-                    "korean",
-                    "normal",
-                    (255, 255, 255),
-                )
-                self.screen.blit(skill_text, (gauge_x, text_y + text_spacing))
+        atlas = self._atlases.get(color)
+        if atlas is None:
+            atlas = self._atlases[color] = GlyphAtlas(
+                self.game.font, color, labels=HUD_LABELS_DEFAULT.values()
+            )
+        return atlas, HUD_LABELS_DEFAULT
 
-                # 조작법 도움말 텍스트
-                skill_help = self.game.font_manager.render_text(
-                    "Z - 스킬", "korean", "small", (200, 200, 255)
-                )
-                dance_help = self.game.font_manager.render_text(
-                    "스페이스바 - 춤추기", "korean", "small", (200, 200, 255)
-                )
-                self.screen.blit(skill_help, (gauge_x, text_y + text_spacing * 2))
-                self.screen.blit(dance_help, (gauge_x, text_y + text_spacing * 3))
+    def ui_rect(self):
+        """render_ui()가 그리는 영역 (게이지 바 + 텍스트 배경)"""
+        return self.hud.bounding_rect()
 
-            else:
-                # 기본 폰트 사용
-                # 한글 폰트가 없는 경우 대비 (영문만 표시)
-                score_text = self.game.font.render(
-                    f"Score: {int(self.game.state_manager.score)}",
-                    True,
-                    (255, 255, 255),
-                )
-                self.screen.blit(score_text, (gauge_x, text_y))
+    def build_hud(self):
+        """게이지 바, 텍스트 배경, 조작법 도움말 위젯 생성 (점수와 스킬은 글리프 아틀라스)"""
+        text_x, text_y = HUD_TEXT_POS
+        if hasattr(self.game, "font_manager"):
+            skill_help = self.game.font_manager.render_text(
+                "Z - 스킬", "korean", "small", (200, 200, 255), static=True
+            )
+            dance_help = self.game.font_manager.render_text(
+                "스페이스바 - 춤추기", "korean", "small", (200, 200, 255), static=True
+            )
+        else:
+            # 기본 폰트 사용
+            # 한글 폰트가 없는 경우 대비 (영문만 표시)
+            skill_help = self.game.font.render("Z - Skill", True, (200, 200, 255))
+            dance_help = self.game.font.render("Space - Dance", True, (200, 200, 255))
+
+        self.hud = WidgetTree()
+        self.gauge_bar = self.hud.add(
+            Slider(
+                HUD_GAUGE_RECT,
+                track_color=(0, 0, 200),
+                fill_color=(0, 200, 0),
+                handle_size=0,
+            )
+        )
+        # 텍스트 배경 TODO : 텍스트 배경 이미지 리소스 추가
+        self.hud.add(
+            Panel((text_x - 5, text_y - 5, 250, 150), (0, 0, 0), border_radius=5)
+        )
+        self.hud.add(Label((text_x, text_y + HUD_TEXT_SPACING * 2), skill_help))
+        self.hud.add(Label((text_x, text_y + HUD_TEXT_SPACING * 3), dance_help))
 
-                # 스킬 텍스트
-                skill_text = self.game.font.render(
-                    f"Skill: {self.game.state_manager.skill_charges}",
-                    True,
-                    (255, 255, 255),
-                )
-                self.screen.blit(skill_text, (gauge_x, text_y + text_spacing))
+    def render_ui(self):
+        """UI 요소 렌더링 (게이지 값이 바뀔 때만 게이지 바를 다시 합성)"""
+        self.gauge_bar.set_value(self.game.state_manager.gauge / 100)
+        self.hud.draw(self.screen, mouse_pos=(-1, -1))
 
-                # 조작법 도움말 텍스트
-                skill_help = self.game.font.render("Z - Skill", True, (200, 200, 255))
-                dance_help = self.game.font.render(
-                    "Space - Dance", True, (200, 200, 255)
-                )
-                self.screen.blit(skill_help, (gauge_x, text_y + text_spacing * 2))
-                self.screen.blit(dance_help, (gauge_x, text_y + text_spacing * 3))
+        # 점수 및 스킬 표시 (글리프 아틀라스로 조합, 매 프레임 폰트 렌더링 없음)
+        text_x, text_y = HUD_TEXT_POS
+        try:
+            atlas, labels = self.hud_atlas(HUD_TEXT_COLOR)
+            atlas.draw_number(
+                self.screen,
+                (text_x, text_y),
+                self.game.state_manager.score,
+                labels["score"],
+            )
+            atlas.draw_number(
+                self.screen,
+                (text_x, text_y + HUD_TEXT_SPACING),
+                self.game.state_manager.skill_charges,
+                labels["skill"],
+            )
         except Exception as e:
             print(f"UI 텍스트 렌더링 오류: {e}")
             error_text = self.game.font.render(f"Text Error: {e}", True, (255, 50, 50))
-            self.screen.blit(error_text, (gauge_x, text_y))
+            self.screen.blit(error_text, (text_x, text_y))
 
     def render_gameover(self):
         """게임 오버 화면 렌더링"""
         self.game.scenes["game_over"].draw(self.game.state_manager.score)
 
-    def draw_exclamation(self, pos):
+    def exclamation_rect(self, pos):
+        """draw_exclamation()이 그릴 수 있는 최대 영역 (박동 효과 포함)"""
+        width = 14
+        height = 60
+        gap = 10
+        max_radius = int(width // 2 * 1.3)
+        circle_y = pos[1] + height + gap + width // 2
+        left = min(pos[0], pos[0] + width // 2 - max_radius)
+        right = max(pos[0] + width, pos[0] + width // 2 + max_radius + 1)
+        bottom = max(pos[1] + int(height * 1.2), circle_y + max_radius + 1)
+        return pygame.Rect(left, pos[1], right - left, bottom - pos[1])
+
+    def draw_exclamation(self, pos, current_time=None):
         """게임 오버 느낌표"""
         # TODO : 느낌표 이미지 추가 및 애니메이션 재설정 (현재는 직접 그리는 버전)
         width = 14
@@ -223,7 +447,8 @@ class Renderer:
         color = (255, 30, 30)
         gap = 10
 
-        current_time = pygame.time.get_ticks() / 1000
+        if current_time is None:
+            current_time = pygame.time.get_ticks() / 1000
 
         # 박동 효과 - 기둥
         rect_scale = 1.0 + 0.2 * abs(math.sin(current_time * 8))
@@ -0,0 +1,220 @@
+import os
+import struct
+import tempfile
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import pygame
+
+from .config import REPLAY_HISTORY
+from .paths import user_config_dir
+
+# 리플레이 파일 형식
+# [헤더] magic(4) | version(2) | sim_rate(2) | seed(8) | start_step(8) | event_count(4)
+# [본문] 입력 이벤트 (event_count * 9 바이트)
+#        step(4, 판 시작 후 스텝) | kind(1) | key(4)
+# [결과] steps(4) | score(8) | gauge(8) | skill_charges(1) | reason(1)
+REPLAY_MAGIC = b"RTRP"
+REPLAY_VERSION = 1
+REPLAY_SUFFIX = ".rtrp"
+_HEADER = struct.Struct("<4sHHQQI")
+_EVENT = struct.Struct("<IBI")
+_RESULT = struct.Struct("<Iddbb")
+
+# 기록하는 입력 이벤트 종류
+EVENT_KEYDOWN = 0
+EVENT_KEYUP = 1
+_EVENT_TYPES = {pygame.KEYDOWN: EVENT_KEYDOWN, pygame.KEYUP: EVENT_KEYUP}
+_PYGAME_TYPES = {kind: event_type for event_type, kind in _EVENT_TYPES.items()}
+
+# 게임 플레이에 영향을 주는 키 (춤추기, 스킬)
+RECORDED_KEYS = (pygame.K_SPACE, pygame.K_z)
+
+# 게임 오버 사유 코드 (0은 게임 오버 전에 끝난 판)
+_REASONS = {None: 0, "caught": 1, "no_energy": 2}
+_REASON_NAMES = {code: reason for reason, code in _REASONS.items()}
+
+
+def replay_dir():
+    """리플레이 파일을 저장하는 디렉터리"""
+    return user_config_dir() / "replays"
+
+
+class SessionResult(NamedTuple):
+    """판이 끝났을 때의 결과 (리플레이가 같은 결과로 끝나는지 확인용)"""
+
+    steps: int  # 판 시작 후 진행한 스텝 수
+    score: float
+    gauge: float
+    skill_charges: int
+    reason: str = None  # 게임 오버 사유 (게임 오버 전에 끝났으면 None)
+
+
+class InputRecording:
+    """한 판의 난수 시드, 시작 시각, 입력 이벤트 목록과 결과"""
+
+    def __init__(self, seed, sim_rate, start_step, events=None, result=None):
+        """
+        :param seed: 판의 난수 시드 (선생님 방향 전환 등)
+        :param start_step: 판 시작 시점의 시뮬레이션 스텝 (시각 계산이 같도록 리플레이에서 복원)
+        :param events: (판 시작 후 스텝, 이벤트 종류, 키) 목록
+        """
+        self.seed = seed
+        self.sim_rate = sim_rate
+        self.start_step = start_step
+        self.events = events if events is not None else []
+        self.result = result
+
+    @property
+    def duration(self):
+        """판 길이 (초, 결과가 없으면 마지막 입력까지)"""
+        if self.result is not None:
+            return self.result.steps / self.sim_rate
+        return self.events[-1][0] / self.sim_rate if self.events else 0.0
+
+    def __len__(self):
+        return len(self.events)
+
+    def to_bytes(self):
+        result = self.result or SessionResult(0, 0.0, 0.0, 0)
+        parts = [
+            _HEADER.pack(
+                REPLAY_MAGIC,
+                REPLAY_VERSION,
+                self.sim_rate,
+                self.seed,
+                self.start_step,
+                len(self.events),
+            )
+        ]
+        parts.extend(_EVENT.pack(*event) for event in self.events)
+        parts.append(
+            _RESULT.pack(
+                result.steps,
+                result.score,
+                result.gauge,
+                result.skill_charges,
+                _REASONS.get(result.reason, 0),
+            )
+        )
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        try:
+            magic, version, sim_rate, seed, start_step, count = _HEADER.unpack_from(
+                data
+            )
+            if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+                raise ValueError("지원하지 않는 리플레이 파일")
+
+            offset = _HEADER.size
+            events = [
+                _EVENT.unpack_from(data, offset + index * _EVENT.size)
+                for index in range(count)
+            ]
+            steps, score, gauge, skill_charges, reason = _RESULT.unpack_from(
+                data, offset + count * _EVENT.size
+            )
+        except struct.error as e:
+            raise ValueError(f"손상된 리플레이 파일: {e}") from e
+        result = None
+        if steps:
+            result = SessionResult(
+                steps, score, gauge, skill_charges, _REASON_NAMES.get(reason)
+            )
+        return cls(seed, sim_rate, start_step, events, result)
+
+    def save(self, path):
+        """임시 파일에 쓴 뒤 교체"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.to_bytes())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class InputRecorder:
+    """게임 플레이 중 입력 이벤트를 시뮬레이션 스텝 시각과 함께 기록"""
+
+    def __init__(self, seed, sim_rate, start_step, directory=None):
+        self.recording = InputRecording(seed, sim_rate, start_step)
+        self.directory = Path(directory) if directory else replay_dir()
+        self.path = None  # 저장한 파일 경로
+
+    def record(self, step, event):
+        """
+        게임 플레이 입력 이벤트 기록 (플레이에 영향이 없는 이벤트는 무시)
+        :param step: 판 시작 후 스텝 (이 이벤트 다음 스텝부터 반영됨)
+        """
+        kind = _EVENT_TYPES.get(event.type)
+        if kind is not None and event.key in RECORDED_KEYS:
+            self.recording.events.append((step, kind, event.key))
+
+    def finish(self, result):
+        """판 결과를 기록하고 리플레이 파일로 저장 (최근 REPLAY_HISTORY개만 유지)"""
+        self.recording.result = result
+        name = time.strftime("replay_%Y%m%d_%H%M%S") + REPLAY_SUFFIX
+        try:
+            self.recording.save(self.directory / name)
+            self.path = self.directory / name
+            self.prune()
+            print(f"리플레이 저장: {self.path}")
+        except OSError as e:
+            print(f"리플레이 저장 실패: {e}")
+        return self.path
+
+    def prune(self):
+        """오래된 리플레이 파일 삭제"""
+        replays = sorted(self.directory.glob(f"replay_*{REPLAY_SUFFIX}"))
+        for path in replays[:-REPLAY_HISTORY]:
+            path.unlink(missing_ok=True)
+
+
+class ReplayPlayer:
+    """기록된 입력 이벤트를 기록된 스텝에 다시 전달"""
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.position = 0  # 다음에 전달할 이벤트 번호
+
+    @property
+    def finished(self):
+        return self.position >= len(self.recording.events)
+
+    def events_at(self, step):
+        """
+        판 시작 후 step 스텝까지 기록된 이벤트를 pygame 이벤트로 반환
+        (스텝마다 호출, 기록 순서 유지)
+        """
+        events = []
+        recorded = self.recording.events
+        while self.position < len(recorded) and recorded[self.position][0] <= step:
+            _, kind, key = recorded[self.position]
+            events.append(pygame.event.Event(_PYGAME_TYPES[kind], key=key))
+            self.position += 1
+        return events
+
+    def verify(self, result):
+        """
+        리플레이 결과가 기록된 결과와 같은지 확인
+        :return: 다른 항목 설명 목록 (같으면 빈 목록)
+        """
+        expected = self.recording.result
+        if expected is None:
+            return []
+        return [
+            f"{field}: 기록 {want}, 리플레이 {got}"
+            for field, want, got in zip(SessionResult._fields, expected, result)
+            if want != got
+        ]
@@ -0,0 +1,97 @@
+import heapq
+import itertools
+import threading
+
+from .asset_archive import get_assets
+
+# 리소스 우선순위 (낮을수록 먼저 로드)
+PRIORITY_CRITICAL = 0  # 첫 플레이 화면을 그리는 데 필요한 리소스
+PRIORITY_GAMEPLAY = 1  # 플레이 중 곧 필요한 리소스 (춤, 스킬, 효과음 등)
+PRIORITY_COSMETIC = 2  # 없어도 플레이에 지장이 없는 리소스
+
+
+class AssetJob:
+    """로드할 리소스 하나에 대한 작업 정보"""
+
+    def __init__(self, name, load, priority, weight, required):
+        self.name = name  # 화면에 표시할 리소스 이름
+        self.load = load  # 실제 로드 함수 (실패 시 예외 발생 또는 False 반환)
+        self.priority = priority
+        self.weight = weight  # 진행률 가중치 (파일 바이트 수)
+        self.required = required  # 게임 시작 전에 반드시 로드되어야 하는지 여부
+
+
+def asset_weight(name):
+    """리소스 크기를 진행률 가중치로 사용 (리소스가 없으면 최소 가중치)"""
+    try:
+        return max(1, get_assets().size(name))
+    except FileNotFoundError:
+        return 1
+
+
+class ResourceLoader:
+    """우선순위 큐 기반 리소스 로더 (실제 바이트 기준 진행률 제공)"""
+
+    def __init__(self):
+        self._queue = []
+        self._counter = itertools.count()  # 같은 우선순위는 추가한 순서대로
+        self._lock = threading.Lock()
+
+        self.total_weight = 0
+        self.loaded_weight = 0
+        self.pending_required = 0
+
+        self.current_asset = None  # 현재 로드 중인 리소스 이름
+        self.failures = {}  # 리소스 이름 -> 실패 사유
+        self.required_done = threading.Event()
+        self.finished = threading.Event()
+
+    def add(self, name, load, priority=PRIORITY_GAMEPLAY, weight=1, required=True):
+        """로드 작업 추가"""
+        job = AssetJob(name, load, priority, weight, required)
+        with self._lock:
+            heapq.heappush(self._queue, (priority, next(self._counter), job))
+            self.total_weight += weight
+            if required:
+                self.pending_required += 1
+                self.required_done.clear()
+            self.finished.clear()
+        return job
+
+    @property
+    def progress(self):
+        """전체 진행률 (0 ~ 100)"""
+        if self.total_weight == 0:
+            return 100.0
+        return 100.0 * self.loaded_weight / self.total_weight
+
+    def run(self):
+        """큐가 빌 때까지 우선순위 순서대로 로드"""
+        while True:
+            with self._lock:
+                if not self._queue:
+                    break
+                _, _, job = heapq.heappop(self._queue)
+                self.current_asset = job.name
+
+            try:
+                # 로드 함수가 False를 반환해도 실패로 처리 (자체적으로 오류를 출력하는 함수용)
+                if job.load() is False:
+                    raise RuntimeError("로드 실패")
+            except Exception as e:
+                # 실패한 리소스는 개별적으로 기록하고 나머지 로드를 계속 진행
+                self.failures[job.name] = str(e) or type(e).__name__
+                print(f"리소스 로드 실패: {job.name} ({self.failures[job.name]})")
+
+            with self._lock:
+                self.loaded_weight += job.weight
+                if job.required:
+                    self.pending_required -= 1
+                    if self.pending_required == 0:
+                        self.required_done.set()
+
+        with self._lock:
+            self.current_asset = None
+            if self.pending_required == 0:
+                self.required_done.set()
+            self.finished.set()
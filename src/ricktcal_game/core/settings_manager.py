@@ -1,49 +1,124 @@
+import atexit
 import json
 import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from .config import SETTINGS_FLUSH_DELAY
+from .paths import user_config_dir
+
+SETTINGS_FILE = "settings.json"
+
+# 패키지에 포함된 기본 설정 (읽기 전용, 사용자 설정 파일이 없을 때 사용)
+DEFAULT_SETTINGS_PATH = Path(__file__).with_name(SETTINGS_FILE)
 
 
 class SettingsManager:
-    """게임 설정을 관리하는 클래스"""
+    """
+    게임 설정을 관리하는 클래스
+    변경된 설정은 메모리에 모아 두었다가, 마지막 변경 후 잠시 뒤(또는 종료 시)
+    백그라운드 스레드에서 한 번에 저장 (임시 파일에 쓴 뒤 교체)
+    """
 
-    def __init__(self):
+    def __init__(self, path=None, flush_delay=SETTINGS_FLUSH_DELAY):
         self.settings = {
             "bgm_volume": 0.7,  # 배경 음악 볼륨 (0.0 ~ 1.0)
             "sfx_volume": 0.8,  # 효과음 볼륨 (0.0 ~ 1.0)
         }
+        self.path = Path(path) if path else user_config_dir() / SETTINGS_FILE
+        self.flush_delay = flush_delay
+
+        # 저장 대기 상태 (변경 횟수로 어떤 변경까지 저장되었는지 추적)
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._version = 0
+        self._saved_version = 0
+        self._last_change = 0.0
+        self._writer = None
+
         self.load_settings()
+        atexit.register(self.flush)
 
     def load_settings(self):
-        """설정 파일에서 설정 로드"""
-        try:
-            settings_path = os.path.join(
-                "src", "ricktcal_game", "core", "settings.json"
-            )
-            if os.path.exists(settings_path):
-                with open(settings_path, "r") as f:
-                    loaded_settings = json.load(f)
-                    self.settings.update(loaded_settings)
-                print("설정 로드 성공!")
-        except Exception as e:
-            print(f"설정 로드 실패: {e}")
+        """설정 파일에서 설정 로드 (사용자 설정이 없으면 패키지 기본 설정 사용)"""
+        for settings_path in (DEFAULT_SETTINGS_PATH, self.path):
+            try:
+                with open(settings_path, "r", encoding="utf-8") as f:
+                    self.settings.update(json.load(f))
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"설정 로드 실패 ({settings_path}): {e}")
+        print("설정 로드 성공!")
 
     def save_settings(self):
-        """설정을 파일에 저장"""
-        try:
-            settings_path = os.path.join(
-                "src", "ricktcal_game", "core", "settings.json"
-            )
-            with open(settings_path, "w") as f:
-                json.dump(self.settings, f, indent=2)
-            print("설정 저장 성공!")
-        except Exception as e:
-            print(f"설정 저장 실패: {e}")
+        """설정 저장 예약 (마지막 변경 후 flush_delay초 동안 변경이 없으면 저장)"""
+        with self._cond:
+            self._version += 1
+            self._last_change = time.monotonic()
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_behind, daemon=True)
+                self._writer.start()
+            self._cond.notify()
+
+    def flush(self):
+        """저장되지 않은 변경을 즉시 저장 (게임 종료 시 호출)"""
+        with self._cond:
+            if self._version == self._saved_version:
+                return
+            version, snapshot = self._version, dict(self.settings)
+        self._write(version, snapshot)
+
+    def _write_behind(self):
+        """변경이 잠잠해질 때까지 기다렸다가 저장하는 백그라운드 스레드"""
+        while True:
+            with self._cond:
+                while self._version == self._saved_version:
+                    self._cond.wait()
+                # 슬라이더를 드래그하는 동안은 저장하지 않고 마지막 변경까지 모아서 저장
+                while True:
+                    remaining = self._last_change + self.flush_delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                version, snapshot = self._version, dict(self.settings)
+            self._write(version, snapshot)
+
+    def _write(self, version, snapshot):
+        """설정을 임시 파일에 쓴 뒤 교체 (이미 더 새 설정이 저장되었으면 생략)"""
+        with self._write_lock:
+            if version <= self._saved_version:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(snapshot, f, indent=2)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+                print("설정 저장 성공!")
+            except Exception as e:
+                print(f"설정 저장 실패: {e}")
+            finally:
+                # 실패해도 같은 변경을 계속 재시도하지 않음 (다음 변경 때 다시 저장)
+                with self._cond:
+                    self._saved_version = max(self._saved_version, version)
 
     def get_setting(self, key, default=None):
         """설정 값 조회"""
         return self.settings.get(key, default)
 
     def update_setting(self, key, value):
-        """설정 값 업데이트"""
+        """설정 값 업데이트 (값이 바뀌었을 때만 저장 예약)"""
+        if self.settings.get(key) == value:
+            return
         self.settings[key] = value
         self.save_settings()
 
@@ -57,10 +132,8 @@ class SettingsManager:
 
     def set_bgm_volume(self, volume):
         """배경 음악 볼륨 설정"""
-        self.settings["bgm_volume"] = max(0.0, min(1.0, volume))
-        self.save_settings()
+        self.update_setting("bgm_volume", max(0.0, min(1.0, volume)))
 
     def set_sfx_volume(self, volume):
         """효과음 볼륨 설정"""
-        self.settings["sfx_volume"] = max(0.0, min(1.0, volume))
-        self.save_settings()
+        self.update_setting("sfx_volume", max(0.0, min(1.0, volume)))
@@ -0,0 +1,63 @@
+import time
+
+from .config import MAX_SIM_STEPS_PER_FRAME, SIM_RATE
+
+
+class SimClock:
+    """
+    고정 간격 시뮬레이션 시계
+    게임 로직은 항상 dt(1/SIM_RATE초) 단위로 진행하고, 실제 경과 시간은 누산기에 모아
+    프레임마다 몇 스텝을 진행할지 결정 (렌더링 속도와 무관하게 같은 난이도 유지)
+    """
+
+    def __init__(self, rate=SIM_RATE, max_steps=MAX_SIM_STEPS_PER_FRAME):
+        self.rate = rate
+        self.dt = 1.0 / rate
+        self.max_steps = max_steps  # 한 프레임에 따라잡을 최대 스텝 수
+
+        self.steps = 0  # 지금까지 진행한 스텝 수
+        self.accumulator = 0.0  # 아직 진행하지 않은 실제 경과 시간 (초)
+        self.dropped_time = 0.0  # 따라잡기 한도를 넘어 버린 시간 (초)
+        self._last_frame = None
+
+    @property
+    def time(self):
+        """시뮬레이션 시각 (초, 스텝 수로 계산하므로 오차가 쌓이지 않음)"""
+        return self.steps * self.dt
+
+    @property
+    def time_ms(self):
+        return self.steps * 1000.0 / self.rate
+
+    @property
+    def alpha(self):
+        """마지막 스텝과 다음 스텝 사이의 진행 비율 (0.0 ~ 1.0, 렌더링 보간용)"""
+        return min(1.0, self.accumulator / self.dt)
+
+    def step(self):
+        """시뮬레이션을 한 스텝 진행"""
+        self.steps += 1
+
+    def frame(self, now=None):
+        """
+        실제 경과 시간을 누산기에 더하고 이번 프레임에 진행할 스텝 수 반환
+        느린 프레임 뒤에도 max_steps까지만 따라잡고 나머지 시간은 버림
+        :param now: 현재 시각 (초, None이면 time.perf_counter())
+        """
+        if now is None:
+            now = time.perf_counter()
+        if self._last_frame is None:
+            self._last_frame = now
+            return 0
+
+        self.accumulator += now - self._last_frame
+        self._last_frame = now
+
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            dropped = (steps - self.max_steps) * self.dt
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+            steps = self.max_steps
+        self.accumulator -= steps * self.dt
+        return steps
@@ -0,0 +1,130 @@
+import threading
+import time
+
+import pygame
+
+from .asset_archive import get_assets
+
+# 채널 그룹이 가득 찼을 때의 정책
+STEAL_OLDEST = "oldest"  # 가장 오래 재생 중인 소리를 끊고 새 소리 재생
+STEAL_NONE = "none"  # 새 소리를 재생하지 않음
+
+
+class SoundHandle:
+    """사운드 뱅크에서 빌린 사운드 (release()로 반납, 참조가 모두 반납되면 해제)"""
+
+    def __init__(self, bank, name, sound):
+        self.bank = bank
+        self.name = name  # 리소스 이름 (예: "sounds/dance.wav")
+        self.sound = sound
+        self.released = False
+
+    def release(self):
+        """사운드 반납 (여러 번 호출해도 한 번만 반납)"""
+        if not self.released:
+            self.released = True
+            self.bank.release(self.name)
+
+
+class SoundBank:
+    """사운드 파일을 한 번만 로드하여 참조 카운트로 공유하는 저장소"""
+
+    def __init__(self):
+        # 리소스 이름 -> [Sound, 참조 수]
+        self._sounds = {}
+        self._lock = threading.Lock()  # 리소스 로더 스레드에서도 로드하므로 보호
+
+    def acquire(self, name):
+        """
+        사운드 핸들 반환 (이미 로드된 파일이면 다시 읽지 않고 공유)
+        :param name: 리소스 이름 (예: "sounds/dance.wav")
+        """
+        with self._lock:
+            entry = self._sounds.get(name)
+            if entry is None:
+                sound = pygame.mixer.Sound(file=get_assets().open(name))
+                entry = self._sounds[name] = [sound, 0]
+            entry[1] += 1
+            return SoundHandle(self, name, entry[0])
+
+    def release(self, name):
+        """참조 하나를 반납하고, 남은 참조가 없으면 사운드 해제"""
+        with self._lock:
+            entry = self._sounds.get(name)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] <= 0:
+                entry[0].stop()
+                del self._sounds[name]
+
+    def is_loaded(self, name):
+        return name in self._sounds
+
+    def __len__(self):
+        return len(self._sounds)
+
+
+class ChannelGroup:
+    """
+    예약된 믹서 채널 묶음 (그룹별 동시 재생 수 제한과 볼륨 적용)
+    볼륨은 채널에 한 번만 설정되므로 재생할 때마다 볼륨을 바꿀 필요가 없음
+    """
+
+    def __init__(self, name, channel_ids, steal=STEAL_OLDEST):
+        self.name = name
+        self.channels = [pygame.mixer.Channel(index) for index in channel_ids]
+        self.steal = steal
+        self.volume = None
+        self._started = [0.0] * len(self.channels)  # 채널별 재생 시작 시각
+
+    @property
+    def max_voices(self):
+        return len(self.channels)
+
+    def set_volume(self, volume):
+        """그룹 볼륨 설정 (값이 바뀌었을 때만 채널에 적용)"""
+        if volume == self.volume:
+            return
+        self.volume = volume
+        for channel in self.channels:
+            channel.set_volume(volume)
+
+    def play(self, sound, loops=0):
+        """
+        그룹 채널에서 사운드 재생 (볼륨이 0이면 재생하지 않음)
+        :return: 재생한 채널 (재생하지 않았으면 None)
+        """
+        if not self.volume:
+            return None
+
+        index = self._pick_channel()
+        if index is None:
+            return None
+
+        channel = self.channels[index]
+        channel.play(sound, loops)
+        self._started[index] = time.monotonic()
+        return channel
+
+    def _pick_channel(self):
+        """빈 채널 인덱스 반환 (없으면 정책에 따라 가장 오래된 채널 또는 None)"""
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+
+        if self.steal == STEAL_OLDEST:
+            index = min(range(len(self.channels)), key=self._started.__getitem__)
+            self.channels[index].stop()
+            return index
+        return None
+
+    def stop(self, sound=None):
+        """그룹의 채널 중지 (sound를 주면 그 사운드를 재생 중인 채널만)"""
+        for channel in self.channels:
+            if sound is None or channel.get_sound() is sound:
+                channel.stop()
+
+    def playing(self):
+        """현재 재생 중인 사운드 목록"""
+        return [channel.get_sound() for channel in self.channels if channel.get_busy()]
@@ -1,51 +1,110 @@
 import pygame
 
+from .asset_archive import get_assets
+from .config import (
+    AUDIO_BUFFER_DEFAULT,
+    AUDIO_BUFFER_LOW_LATENCY,
+    AUDIO_FREQUENCY,
+    SOUND_CHANNEL_GROUPS,
+    SOUND_EFFECTS,
+)
+from .sound_bank import ChannelGroup, SoundBank
+
+SOUND_DIR = "sounds"  # 리소스 아카이브 안의 사운드 디렉터리
+
+
+def configure_audio(low_latency):
+    """
+    믹서 출력 형식 지정 (pygame 모듈 초기화 전에 호출해야 적용됨)
+    :param low_latency: True면 작은 버퍼를 사용하는 저지연 모드
+    :return: 사용할 버퍼 크기 (샘플 수)
+    """
+    buffer = AUDIO_BUFFER_LOW_LATENCY if low_latency else AUDIO_BUFFER_DEFAULT
+    pygame.mixer.pre_init(
+        frequency=AUDIO_FREQUENCY, size=-16, channels=2, buffer=buffer
+    )
+    return buffer
+
 
 class SoundManager:
     """게임 사운드를 관리하는 클래스"""
 
     def __init__(self, settings_manager):
         self.settings_manager = settings_manager
-        pygame.mixer.init()
+
+        # 오디오 장치를 여는 데 시간이 걸리므로 믹서는 init_mixer()에서 백그라운드로 초기화
+        self.ready = False
 
         self.bgm = None
+        self._bgm_file = None
+
+        # 효과음은 사운드 뱅크에서 한 번만 로드하고, 이름별 핸들을 보관
+        self.bank = SoundBank()
         self.sfx = {}
-        self.current_dance_sound = None
-        self.load_sounds()
+        self.groups = {}
 
-    def load_sounds(self):
-        """기본 사운드 파일 로드"""
+    def init_mixer(self):
+        """믹서 초기화 후 채널 그룹을 만들고 배경 음악 재생 (성공 여부 반환)"""
         try:
-            try:
-                pygame.mixer.music.load("src/ricktcal_game/resources/sounds/bgm.mp3")
-            except Exception as e:
-                print(f"배경 음악 로드 실패: {e}")
-
-            self.load_sfx("click", "click.wav")
-
+            pygame.mixer.init()  # configure_audio()에서 지정한 형식 사용
+        except pygame.error as e:
+            print(f"믹서 초기화 실패: {e}")
+            return False
+
+        self._create_channel_groups()
+        self.ready = True
+        self.update_volumes()
+        self.load_bgm()
+        self.play_bgm()
+        return True
+
+    def _create_channel_groups(self):
+        """
+        채널 그룹별로 믹서 채널을 예약
+        예약된 채널은 Sound.play()의 자동 채널 선택에 쓰이지 않으므로 그룹끼리 간섭하지 않음
+        """
+        reserved = sum(count for count, _ in SOUND_CHANNEL_GROUPS.values())
+        if pygame.mixer.get_num_channels() < reserved:
+            pygame.mixer.set_num_channels(reserved)
+        pygame.mixer.set_reserved(reserved)
+
+        next_channel = 0
+        for group_name, (count, steal) in SOUND_CHANNEL_GROUPS.items():
+            channel_ids = range(next_channel, next_channel + count)
+            self.groups[group_name] = ChannelGroup(group_name, channel_ids, steal)
+            next_channel += count
+
+    def load_bgm(self):
+        """배경 음악 로드"""
+        try:
+            # 스트리밍 재생이므로 파일 객체를 음악 재생이 끝날 때까지 유지
+            self._bgm_file = get_assets().open(f"{SOUND_DIR}/bgm.mp3")
+            pygame.mixer.music.load(self._bgm_file, "bgm.mp3")
         except Exception as e:
-            print(f"사운드 로드 실패: {e}")
-
-    def load_sfx(self, name, filename):
-        """개별 효과음 로드 함수"""
+            print(f"배경 음악 로드 실패: {e}")
+
+    def load_sfx(self, name, filename=None):
+        """
+        효과음 로드 (성공 여부 반환)
+        같은 파일은 사운드 뱅크에서 공유되므로 여러 번 호출해도 한 번만 읽음
+        :param filename: 생략하면 SOUND_EFFECTS에 등록된 파일 사용
+        """
+        if name in self.sfx:
+            return True
+        if filename is None:
+            filename = SOUND_EFFECTS[name][0]
         try:
-            self.sfx[name] = pygame.mixer.Sound(
-                f"src/ricktcal_game/resources/sounds/{filename}"
-            )
+            self.sfx[name] = self.bank.acquire(f"{SOUND_DIR}/{filename}")
+            return True
         except Exception as e:
             print(f"{filename} 효과음 로드 실패: {e}")
+            return False
 
-    def load_gameplay_sounds(self):
-        """게임 플레이 관련 사운드 로드"""
-        # TODO : 효과음 추가 혹은 제거
-        self.load_sfx("dance", "dance.wav")
-        self.load_sfx("skill", "skill.wav")
-        self.load_sfx("game_over", "game_over.wav")
-        self.load_sfx("warning", "warning.wav")  # TODO : 경고음 추가 혹은 제거
-        self.load_sfx(
-            "turn", "turn.wav"
-        )  # TODO : 선생님 방향 전환 효과음 추가 혹은 제거
-        print("게임 플레이 사운드 로드 완료")
+    def unload_sfx(self, name):
+        """효과음 핸들 반납 (다른 곳에서 쓰지 않으면 메모리에서 해제)"""
+        handle = self.sfx.pop(name, None)
+        if handle is not None:
+            handle.release()
 
     def play_bgm(self):
         """배경 음악 재생"""
@@ -57,80 +116,64 @@ class SoundManager:
 
     def stop_bgm(self):
         """배경 음악 중지"""
+        if not self.ready:
+            return
         try:
             pygame.mixer.music.stop()
         except Exception as e:
             print(f"배경 음악 중지 실패: {e}")
 
     def play_sfx(self, sound_name):
-        """효과음 재생"""
-        if sound_name in self.sfx:
-            try:
-                self.sfx[sound_name].set_volume(self.settings_manager.get_sfx_volume())
-
-                if sound_name == "dance":
-                    # 이전에 재생 중이던 춤 효과음이 있으면 중지
-                    if self.current_dance_sound:
-                        self.current_dance_sound.stop()
-                    # 새로운 춤 효과음 재생 및 추적
-                    self.current_dance_sound = self.sfx[sound_name]
-                    self.current_dance_sound.play()
-                else:
-                    # 일반 효과음 재생
-                    self.sfx[sound_name].play()
-            except Exception as e:
-                print(f"{sound_name} 효과음 재생 실패: {e}")
+        """
+        효과음을 해당 채널 그룹에서 재생
+        볼륨은 그룹 채널에 미리 적용되어 있고, 그룹 볼륨이 0이면 재생하지 않음
+        """
+        handle = self.sfx.get(sound_name)
+        if handle is None:
+            return
+        try:
+            self.groups[SOUND_EFFECTS[sound_name][1]].play(handle.sound)
+        except Exception as e:
+            print(f"{sound_name} 효과음 재생 실패: {e}")
 
     def stop_sfx(self, sound_name):
         """특정 효과음 중지"""
-        if sound_name == "dance" and self.current_dance_sound:
-            try:
-                self.current_dance_sound.stop()
-                self.current_dance_sound = None
-            except Exception as e:
-                print(f"{sound_name} 효과음 중지 실패: {e}")
-
-    def update_volumes(self):
-        """볼륨 설정 업데이트"""
+        handle = self.sfx.get(sound_name)
+        if handle is None:
+            return
         try:
-            pygame.mixer.music.set_volume(self.settings_manager.get_bgm_volume())
-
-            for sound in self.sfx.values():
-                sound.set_volume(self.settings_manager.get_sfx_volume())
+            self.groups[SOUND_EFFECTS[sound_name][1]].stop(handle.sound)
+        except Exception as e:
+            print(f"{sound_name} 효과음 중지 실패: {e}")
+
+    def update_volumes(self, changed=None):
+        """
+        볼륨 설정 업데이트 (채널 그룹과 배경 음악에만 적용, 사운드별 작업 없음)
+        :param changed: "bgm" 또는 "sfx"를 주면 해당 볼륨만 갱신
+        """
+        if not self.ready:
+            return  # 믹서 초기화 후 현재 설정 볼륨이 적용됨
+        try:
+            if changed in (None, "bgm"):
+                pygame.mixer.music.set_volume(self.settings_manager.get_bgm_volume())
+            if changed in (None, "sfx"):
+                sfx_volume = self.settings_manager.get_sfx_volume()
+                for group in self.groups.values():
+                    group.set_volume(sfx_volume)
         except Exception as e:
             print(f"볼륨 업데이트 실패: {e}")
 
-    def load_all_sounds(self):
-        """모든 게임 사운드 로드"""
-        self._sound_categories = {
-            "ui": ["click"],
-            "gameplay": ["dance", "skill", "game_over", "warning", "turn"],
-        }
-
-        for category, sounds in self._sound_categories.items():
-            self._load_sound_category(category, sounds)
-
-        self._load_background_music()
-
-    def _load_sound_category(self, category, sound_list):
-        """특정 카테고리의 사운드 효과 로드"""
-        print(f"{category} 사운드 로드 중...")
-        for sound_name in sound_list:
-            self.load_sfx(sound_name, f"{sound_name}.wav")
-        print(f"{category} 사운드 로드 완료")
-
     def stop_all_sounds(self, except_sounds=None):
         """모든 효과음 중지 (예외 리스트 제외)"""
         if except_sounds is None:
             except_sounds = []
 
         try:
-            for sound_name, sound in self.sfx.items():
-                if sound_name not in except_sounds:
-                    sound.stop()
-
-            if "dance" not in except_sounds:
-                self.current_dance_sound = None
+            keep = {self.sfx[name].sound for name in except_sounds if name in self.sfx}
+            for group in self.groups.values():
+                for channel in group.channels:
+                    if channel.get_sound() not in keep:
+                        channel.stop()
 
             if "bgm" not in except_sounds:
                 self.stop_bgm()
@@ -0,0 +1,55 @@
+import pygame
+
+# 이진 투명도 프레임의 투명 픽셀에 사용할 색상 키
+COLORKEY = (255, 0, 255)
+
+# 투명도 종류
+ALPHA_OPAQUE = "opaque"  # 모든 픽셀이 불투명
+ALPHA_BINARY = "binary"  # 픽셀이 완전 투명 또는 완전 불투명 (GIF 프레임 등)
+ALPHA_BLENDED = "blended"  # 반투명 픽셀 존재
+
+
+def classify_alpha(surface):
+    """Surface의 투명도 종류 판별"""
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return ALPHA_OPAQUE
+
+    total = surface.get_width() * surface.get_height()
+    visible = pygame.mask.from_surface(surface, 0)  # 알파 > 0
+    solid = pygame.mask.from_surface(surface, 254)  # 알파 == 255
+
+    if solid.count() == total:
+        return ALPHA_OPAQUE
+    if visible.count() == solid.count():
+        # 불투명 픽셀 중 색상 키와 같은 색이 있으면 색상 키를 쓸 수 없음
+        key_pixels = pygame.mask.from_threshold(
+            surface, COLORKEY + (255,), (1, 1, 1, 255)
+        )
+        if key_pixels.overlap_area(solid, (0, 0)) == 0:
+            return ALPHA_BINARY
+    return ALPHA_BLENDED
+
+
+def optimize_surface(surface):
+    """
+    Surface를 화면 픽셀 형식에 맞춰 가장 빠르게 blit되는 형식으로 변환
+    - 불투명 이미지: convert()
+    - 이진 투명도: 색상 키 + RLEACCEL
+    - 반투명: convert_alpha()
+    화면(display.set_mode)이 만들어지기 전에는 변환 없이 그대로 반환
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+
+    alpha = classify_alpha(surface)
+    if alpha == ALPHA_OPAQUE:
+        return surface.convert()
+
+    if alpha == ALPHA_BINARY:
+        keyed = pygame.Surface(surface.get_size()).convert()
+        keyed.fill(COLORKEY)
+        keyed.blit(surface, (0, 0))
+        keyed.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        return keyed
+
+    return surface.convert_alpha()
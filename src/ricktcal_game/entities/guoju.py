@@ -4,12 +4,13 @@ import random
 
 
 class GyoJu:
-    def __init__(self):
+    def __init__(self, rng=None):
         self.facing_away = False
+        self.rng = rng if rng is not None else random.Random()
         self.next_turn_time = 0
         # self.position = GYOJU_POS
 
     def update(self, current_time):
         if current_time > self.next_turn_time:
             self.facing_away = not self.facing_away
-            self.next_turn_time = current_time + random.randint(1000, 3000)
+            self.next_turn_time = current_time + self.rng.randint(1000, 3000)
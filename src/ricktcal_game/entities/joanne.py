@@ -1,3 +1,5 @@
+from ..classes.base_entity import StoreField, encode_optional_time, optional_time
+from ..classes.entity_store import ANIMATION_STATES, NO_STATE, STATE_CODES
 from ..classes.student_entity import StudentEntity
 import random
 from typing import Optional
@@ -6,16 +8,43 @@ from typing import Optional
 class Joanne(StudentEntity):
     """조안 캐릭터 클래스 (플레이어의 친구 역할)"""
 
-    def __init__(self) -> None:
-        super().__init__()
+    # 플레이어가 춤을 멈춘 인게임 시각 (초, 없으면 None)
+    last_dance_end_time = StoreField(optional_time, encode_optional_time)
+    _last_erpin_dancing = StoreField(bool, field="leader_was_dancing")
+
+    def __init__(self, rng: Optional[random.Random] = None, store=None) -> None:
+        """
+        :param rng: 판의 난수 생성기 (None이면 새로 생성)
+        :param store: 상태를 보관할 엔티티 저장소 (None이면 전용 저장소)
+        """
+        super().__init__(store)
+        self.rng: random.Random = rng if rng is not None else random.Random()
         self.name: str = "joanne"
+        # 플레이어를 따라 상태가 바뀌는 학생 (EntityStore.update_followers로 한 번에 업데이트)
+        self.store.set_follower(self.index)
         self.animation_type: str = "idle_1"  # joanne_idle_1.gif
-        self.last_dance_end_time: Optional[int] = None
-        self.dancing: bool = False
-        self._last_erpin_dancing: bool = False
-        self.current_dance_anim: Optional[str] = None  # 현재 dance 애니메이션 타입
         # TODO : 조안 춤추는 속성 추가, 선생님이 뒤도는 타이밍을 알고 있는 설정으로 절대 춤추는 걸 걸리지 않음
 
+    @property
+    def animation_type(self) -> str:
+        return self.animation_state
+
+    @animation_type.setter
+    def animation_type(self, state: str) -> None:
+        self.animation_state = state
+
+    @property
+    def current_dance_anim(self) -> Optional[str]:
+        """현재 dance 애니메이션 타입"""
+        code = self.store.dance_anim[self.index]
+        return None if code == NO_STATE else ANIMATION_STATES[code]
+
+    @current_dance_anim.setter
+    def current_dance_anim(self, state: Optional[str]) -> None:
+        self.store.dance_anim[self.index] = (
+            NO_STATE if state is None else STATE_CODES[state]
+        )
+
     def update(
         self,
         current_time: float,
@@ -24,44 +53,15 @@ class Joanne(StudentEntity):
     ) -> None:
         """
         joanne의 상태를 인게임 경과 시간, erpin의 상태에 따라 업데이트
+        (여러 학생은 EntityStore.update_followers로 한 번에 업데이트)
         :param current_time: 현재 시간(ms)
         :param erpin: 플레이어 캐릭터 엔티티
         :param game_time: 인게임 경과 시간(초)
         """
-        # 60초(1분) 이후에는 erpin이 춤출 때 joanne도 같이 춤
-        if game_time >= 60:
-            if erpin and erpin.dancing:
-                self.dancing = True
-                # 춤을 새로 시작할 때만 랜덤 애니메이션 선택
-                if not self._last_erpin_dancing or self.current_dance_anim is None:
-                    self.current_dance_anim = random.choice(["dance_1", "dance_2"])
-                self.animation_type = self.current_dance_anim
-                self._last_erpin_dancing = True
-            else:
-                self.dancing = False
-                self.animation_type = "idle_1"
-                self.current_dance_anim = None
-                self._last_erpin_dancing = False
-            return
-
-        # 60초 이전: 상태 전환 로직
-        if erpin:
-            if erpin.dancing:
-                self.animation_type = "idle_2"
-                self._last_erpin_dancing = True
-                self.last_dance_end_time = None
-            else:
-                if self._last_erpin_dancing:
-                    self.last_dance_end_time = game_time
-                    self._last_erpin_dancing = False
-                # 춤 멈춘 후 5초간 idle_3, 그 후 idle_1
-                if self.last_dance_end_time is not None:
-                    if game_time - self.last_dance_end_time < 5:
-                        self.animation_type = "idle_3"
-                    else:
-                        self.animation_type = "idle_1"
-                        self.last_dance_end_time = None
-                else:
-                    self.animation_type = "idle_1"
-        else:
-            self.animation_type = "idle_1"
+        self.store.update_followers(
+            game_time,
+            leader_dancing=erpin is not None and erpin.dancing,
+            rng=self.rng,
+            has_leader=erpin is not None,
+            rows=[self.index],
+        )
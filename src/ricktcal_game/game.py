@@ -1,3 +1,4 @@
+import random
 import threading
 import time
 from typing import Optional
@@ -5,15 +6,35 @@ from typing import Optional
 import pygame
 from pygame.locals import *
 
-from .classes.sprites import SpriteManager
+from .classes.entity_store import EntityStore
+from .classes.sprites import ANIMATION_DIR, ANIMATION_FILES, SpriteManager
+from .core.animation_clock import AnimationClock
+from .core.asset_archive import get_assets
 from .core.config import *
+from .core.display import open_display, toggle_fullscreen, vsync_active
 from .core.event_handler import EventHandler
 from .core.font_manager import FontManager
+from .core.frame_profiler import (
+    PHASE_EVENTS,
+    PHASE_RENDER,
+    PHASE_UPDATE,
+    PHASE_WAIT,
+    FrameProfiler,
+)
 from .core.game_state_manager import GameStateManager
 from .core.position_manager import PositionManager
+from .core.replay import InputRecorder, ReplayPlayer, SessionResult
 from .core.renderer import Renderer
+from .core.resource_loader import (
+    PRIORITY_COSMETIC,
+    PRIORITY_CRITICAL,
+    PRIORITY_GAMEPLAY,
+    ResourceLoader,
+    asset_weight,
+)
 from .core.settings_manager import SettingsManager
-from .core.sound_manager import SoundManager
+from .core.sim_clock import SimClock
+from .core.sound_manager import SOUND_DIR, SoundManager, configure_audio
 from .entities.erpin import Erpin
 from .entities.sherum import Sherum
 from .entities.joanne import Joanne
@@ -25,13 +46,41 @@ class Game:
     게임 전체의 상태와 루프를 관리하는 메인 클래스
     """
 
-    def __init__(self) -> None:
-        pygame.init()
-        self.screen: pygame.Surface = pygame.display.set_mode(
-            (SCREEN_WIDTH, SCREEN_HEIGHT)
+    def __init__(self, replay=None, profile_path=None) -> None:
+        """
+        :param replay: 재생할 InputRecording (리소스 로딩이 끝나면 자동으로 판을 시작)
+        :param profile_path: 종료 시 프레임 구간 기록을 저장할 파일 (.csv 또는 .json)
+        """
+        # 믹서 출력 형식(저지연 모드 버퍼 크기)은 pygame 모듈 초기화 전에 지정
+        self.settings_manager: SettingsManager = SettingsManager()
+        configure_audio(
+            self.settings_manager.get_setting("low_latency_audio", AUDIO_LOW_LATENCY)
+        )
+
+        # 첫 화면을 빨리 띄우기 위해 화면과 폰트만 먼저 초기화
+        # (믹서는 리소스 로더가 백그라운드에서 초기화, 타이머는 Clock 생성 시 초기화)
+        pygame.display.init()
+        pygame.font.init()
+        # 논리 해상도 화면 (창/전체 화면 크기와 무관, SCALED 모드에서 SDL이 확대)
+        self.fullscreen: bool = self.settings_manager.get_setting(
+            "fullscreen", DISPLAY_FULLSCREEN
+        )
+        self.screen: pygame.Surface = open_display(
+            (SCREEN_WIDTH, SCREEN_HEIGHT),
+            fullscreen=self.fullscreen,
+            vsync=self.settings_manager.get_setting("vsync", DISPLAY_VSYNC),
         )
         pygame.display.set_caption("[트릭컬 리바이브 팬 게임] 선새임 몰래 춤추기")
         self.clock: pygame.time.Clock = pygame.time.Clock()
+        # 렌더링 프레임 제한 (vsync 중에는 화면 갱신이 주사율에 맞춰 대기하므로 제한 없음)
+        self.frame_limit: int = 0 if vsync_active() else RENDER_FPS_LIMIT
+        # 게임 로직용 고정 간격 시계 (게임 중에만 진행, 설정 화면에서는 멈춤)
+        self.sim_clock: SimClock = SimClock()
+        # 애니메이션 시계 (렌더링 프레임마다 한 번 시각을 고정, GIF 프레임 표시 시간 기준)
+        self.animation_clock: AnimationClock = AnimationClock()
+        # 프레임 구간별 시간 측정 (F3 오버레이, 종료 시 저장)
+        self.profiler: FrameProfiler = FrameProfiler(enabled=PROFILER_ENABLED)
+        self.profile_path = profile_path
 
         self.position_manager: PositionManager = PositionManager()
         self.state_manager: GameStateManager = GameStateManager(self)
@@ -41,15 +90,12 @@ class Game:
         self.font: pygame.font.Font = self.font_manager.get_font()
         self.big_font: pygame.font.Font = self.font_manager.get_font(size_type="title")
 
-        self.settings_manager: SettingsManager = SettingsManager()
         self.sound_manager: SoundManager = SoundManager(self.settings_manager)
 
         self.previous_state: str = SCENE_TITLE
 
-        # 리소스 로딩 상태 추적
-        self.resources_loaded: bool = False
-        self.loading_progress: int = 0
-        self.loading_message: str = "리소스 로딩 준비 중..."
+        # 리소스 로더 (우선순위 큐, 실제 바이트 기준 진행률)
+        self.loader: ResourceLoader = ResourceLoader()
 
         # 모든 씬 초기화
         self.scenes: dict = {
@@ -66,19 +112,15 @@ class Game:
         self.erpin: Optional[Erpin] = None
         self.joanne: Optional[Joanne] = None
 
-        # 스프라이트 관리자
-        self.sprites: Optional[SpriteManager] = None
-
-        # 리소스 준비 상태 플래그
-        self.sprites_ready: bool = False
-        self.characters_ready: bool = False
-        self.sounds_ready: bool = False
+        # 스프라이트 관리자 (애니메이션은 리소스 로더가 채움)
+        self.sprites: SpriteManager = SpriteManager(
+            self.position_manager, clock=self.animation_clock
+        )
 
         # 백그라운드 로딩 스레드
         self.start_background_loading()
 
         self.running: bool = True
-        self.sound_manager.play_bgm()
 
         # 초기화 진행 플래그
         self.initializing: bool = False
@@ -87,108 +129,165 @@ class Game:
         self.state_manager.game_state = SCENE_TITLE
         print(f"초기 게임 상태 설정: {self.state_manager.game_state}")
 
-        self.play_start_ticks: Optional[int] = None  # 게임 플레이 시작 시각 (ms)
+        self.play_start_time: Optional[float] = (
+            None  # 게임 플레이 시작 시뮬레이션 시각 (초)
+        )
         self.play_elapsed_time: int = 0  # 누적 경과 시간 (초)
 
+        # 판의 난수 생성기 (게임 플레이 난수는 모두 여기서, 판 시작 시 시드 지정)
+        self.rng: random.Random = random.Random()
+        self.session_seed: Optional[int] = None
+        self.session_start_step: int = 0  # 판 시작 시점의 시뮬레이션 스텝
+        # 입력 기록기 (플레이 중인 판) / 리플레이 재생기 (재생 중인 판)
+        self.recorder: Optional[InputRecorder] = None
+        self.replay: Optional[ReplayPlayer] = ReplayPlayer(replay) if replay else None
+
         self._character_data: dict = {"sherum": {}, "erpin": {}}
         self.entities: dict = {}
+        # 모든 엔티티 상태를 NumPy 배열로 보관 (엔티티 객체는 한 행을 가리키는 뷰)
+        self.entity_store: EntityStore = EntityStore()
+
+    @property
+    def play_time(self) -> float:
+        """인게임 경과 시간 (시뮬레이션 기준 초, 게임 시작 전이면 0)"""
+        if self.play_start_time is None:
+            return 0.0
+        return self.sim_clock.time - self.play_start_time
+
+    @property
+    def session_step(self) -> int:
+        """판 시작 후 진행한 시뮬레이션 스텝 수 (입력 기록 시각)"""
+        return self.sim_clock.steps - self.session_start_step
+
+    @property
+    def resources_loaded(self) -> bool:
+        """게임 시작에 필요한 리소스가 모두 로드되었는지 여부"""
+        return self.loader.required_done.is_set()
+
+    @property
+    def loading_progress(self) -> float:
+        """전체 리소스 로딩 진행률 (0 ~ 100, 실제 바이트 기준)"""
+        return self.loader.progress
+
+    @property
+    def loading_message(self) -> str:
+        """현재 로드 중인 리소스 이름"""
+        return self.loader.current_asset or ""
 
     def start_background_loading(self) -> None:
         """백그라운드에서 리소스 로딩 시작"""
+        self._queue_resources()
         loading_thread = threading.Thread(target=self.load_all_resources, daemon=True)
         loading_thread.start()
 
+    def _queue_resources(self) -> None:
+        """
+        로드할 리소스를 우선순위와 함께 등록
+        첫 플레이 화면에 필요한 리소스가 먼저, 꾸밈용 리소스가 나중에 로드됨
+        """
+        # 타이틀 화면은 배경 없이 먼저 그려지고, 배경과 믹서(배경 음악)가 가장 먼저 로드됨
+        self.loader.add(
+            "main_title.png",
+            self.scenes[SCENE_TITLE].load_background,
+            priority=PRIORITY_CRITICAL,
+            weight=asset_weight("images/main_title.png"),
+            required=False,
+        )
+        self.loader.add(
+            "오디오 초기화",
+            self.sound_manager.init_mixer,
+            priority=PRIORITY_CRITICAL,
+        )
+
+        animation_priorities = {
+            ("students", "erpin", "idle"): PRIORITY_CRITICAL,
+            ("students", "joanne", "idle_1"): PRIORITY_CRITICAL,
+            ("teachers", "sherum", "back"): PRIORITY_CRITICAL,
+            ("students", "erpin", "dance"): PRIORITY_GAMEPLAY,
+            ("students", "erpin", "skill"): PRIORITY_GAMEPLAY,
+            ("teachers", "sherum", "front"): PRIORITY_GAMEPLAY,
+        }
+        # 캐시에 없는 애니메이션은 우선순위 순서대로 병렬 디코딩이 시작됨
+        self._animation_keys = sorted(
+            ANIMATION_FILES,
+            key=lambda key: animation_priorities.get(key, PRIORITY_COSMETIC),
+        )
+        for key in self._animation_keys:
+            filename = ANIMATION_FILES[key][0]
+            priority = animation_priorities.get(key, PRIORITY_COSMETIC)
+            self.loader.add(
+                filename,
+                lambda key=key: self.sprites.complete_preload(key),
+                priority=priority,
+                weight=asset_weight(f"{ANIMATION_DIR}/{filename}"),
+                required=priority != PRIORITY_COSMETIC,
+            )
+
+        # UI 효과음(클릭)은 타이틀 화면에서 바로 쓰이므로 먼저 로드
+        for sound, (filename, group) in SOUND_EFFECTS.items():
+            if sound in OPTIONAL_SOUND_EFFECTS and not get_assets().exists(
+                f"{SOUND_DIR}/{filename}"
+            ):
+                continue
+            self.loader.add(
+                filename,
+                lambda sound=sound: self.sound_manager.load_sfx(sound),
+                priority=PRIORITY_CRITICAL if group == "ui" else PRIORITY_GAMEPLAY,
+                weight=asset_weight(f"{SOUND_DIR}/{filename}"),
+            )
+
+        self.loader.add(
+            "sherum_gameover.gif",
+            self.scenes[SCENE_GAMEOVER].load_animations,
+            priority=PRIORITY_COSMETIC,
+            weight=asset_weight(f"{ANIMATION_DIR}/sherum_gameover.gif"),
+            required=False,
+        )
+        self.loader.add(
+            "gameover_bg.png",
+            self.scenes[SCENE_GAMEOVER].load_background,
+            priority=PRIORITY_COSMETIC,
+            weight=asset_weight("images/gameover_bg.png"),
+            required=False,
+        )
+
     def load_all_resources(self) -> None:
         """모든 게임 리소스 로드 (백그라운드 스레드에서 실행)"""
         try:
-            self.loading_message = "스프라이트 준비 중..."
-            self._prepare_sprite_data()
-            self.loading_progress = 30
-            time.sleep(0.05)
-
-            self.loading_message = "캐릭터 초기화 중..."
-            self._prepare_character_data()
-            self.loading_progress = 60
-            time.sleep(0.05)
-
-            self.loading_message = "효과음 로드 중..."
-            self._prepare_sound_data()
-            self.loading_progress = 90
-            time.sleep(0.05)
-
-            self.loading_message = "그래픽 로드 중..."
-            self._create_sprite_manager()
-
-            self.loading_progress = 100
-            self.resources_loaded = True
-            self.loading_message = "로딩 완료! 게임을 시작하세요."
-            print("모든 리소스 로딩 완료!")
+            self.sprites.begin_preload(self._animation_keys)
+            self.loader.run()
         except Exception as e:
             print(f"리소스 로딩 오류: {e}")
-            self.loading_message = "일부 리소스 로딩 실패"
-            self.resources_loaded = True
-
-    def _prepare_sprite_data(self) -> None:
-        """스프라이트 데이터 준비"""
-        try:
-            self._sprite_data = {
-                "erpin_idle": "erpin_idle.gif",
-                "erpin_dance": "erpin_dance_1.gif",
-                "erpin_skill": "erpin_skill.gif",
-                "sherum_front": "sherum_front.gif",
-                "sherum_back": "sherum_back.gif",
-                "joanne_idle_1": "joanne_idle_1.gif",
-                "joanne_idle_2": "joanne_idle_2.gif",
-                "joanne_idle_3": "joanne_idle_3.gif",
-                "joanne_dance_1": "joanne_dance_1.gif",
-                "joanne_dance_2": "joanne_dance_2.gif",
-            }
-            self.sprites_ready = True
-            print("스프라이트 데이터 준비 완료")
-        except Exception as e:
-            print(f"스프라이트 준비 오류: {e}")
-
-    def _prepare_character_data(self) -> None:
-        """캐릭터 데이터 준비"""
-        try:
-            self.characters_ready = True
-            print("캐릭터 데이터 준비 완료")
-        except Exception as e:
-            print(f"캐릭터 준비 오류: {e}")
-
-    def _prepare_sound_data(self) -> None:
-        """사운드 데이터 준비"""
-        try:
-            self._sound_list = ["dance", "skill", "game_over", "warning", "turn"]
-            for sound in self._sound_list:
-                self.sound_manager.load_sfx(sound, f"{sound}.wav")
-            self.sounds_ready = True
-            print("사운드 로드 완료")
-        except Exception as e:
-            print(f"사운드 로드 오류: {e}")
+        finally:
+            self.sprites.end_preload()
 
-    def _create_sprite_manager(self) -> None:
-        """스프라이트 매니저 초기화"""
-        try:
-            self.sprites = SpriteManager(self.position_manager, preload=True)
-            print("스프라이트 매니저 초기화 완료")
-        except Exception as e:
-            print(f"스프라이트 매니저 초기화 오류: {e}")
+        # 메인 스레드 출력과 섞이지 않도록 줄바꿈까지 한 번에 출력
+        if self.loader.failures:
+            print(f"로드 실패한 리소스: {', '.join(self.loader.failures)}\n", end="")
+        else:
+            print("모든 리소스 로딩 완료!\n", end="")
 
     def initialize_game_elements(self) -> None:
         """게임 요소 초기화 (메인 스레드에서 실행)"""
         self.initializing = True
         try:
             start_time = time.time()
+            self.start_session()
             self.entities = {"teachers": {}, "students": {}}
-            self.sherum = Sherum()
+            store = self.entity_store = EntityStore()
+            self.sherum = Sherum(
+                current_time=self.sim_clock.time_ms, rng=self.rng, store=store
+            )
             self.entities["teachers"]["sherum"] = self.sherum
-            self.erpin = Erpin()
+            self.erpin = Erpin(store=store)
             self.entities["students"]["erpin"] = self.erpin
-            self.joanne = Joanne()
+            self.joanne = Joanne(rng=self.rng, store=store)
             self.entities["students"]["joanne"] = self.joanne
+            for entity in (self.sherum, self.erpin, self.joanne):
+                entity.position = self.position_manager.get_position(entity.name)
+            self.spawn_classroom()
             self.state_manager.game_state = SCENE_PLAYING
-            self.play_start_ticks = pygame.time.get_ticks()  # 게임 시작 시각(ms)
+            self.play_start_time = self.sim_clock.time  # 게임 시작 시각(초)
             self.play_elapsed_time = 0
             print(f"게임 요소 초기화 완료: {time.time() - start_time:.3f}초")
         except Exception as e:
@@ -196,19 +295,86 @@ class Game:
         finally:
             self.initializing = False
 
+    def start_session(self) -> None:
+        """
+        판 시작: 난수 시드 지정, 입력 기록 시작
+        리플레이 중이면 기록된 시드와 시작 스텝을 복원해 같은 판을 재현
+        """
+        if self.replay is not None:
+            recording = self.replay.recording
+            self.session_seed = recording.seed
+            self.sim_clock.steps = recording.start_step
+        elif SESSION_SEED is not None:
+            self.session_seed = SESSION_SEED
+        else:
+            self.session_seed = random.getrandbits(64)
+        self.rng.seed(self.session_seed)
+        self.session_start_step = self.sim_clock.steps
+        # 새 판의 애니메이션은 첫 프레임부터 재생
+        self.animation_clock.reset()
+
+        self.recorder = None
+        if REPLAY_RECORD and self.replay is None:
+            self.recorder = InputRecorder(
+                self.session_seed, self.sim_clock.rate, self.session_start_step
+            )
+
+    def session_result(self) -> SessionResult:
+        """현재 판의 결과 (리플레이 저장 및 확인용)"""
+        return SessionResult(
+            self.session_step,
+            self.state_manager.score,
+            self.state_manager.gauge,
+            self.state_manager.skill_charges,
+            self.state_manager.game_over_reason,
+        )
+
+    def end_session(self) -> None:
+        """판 종료: 입력 기록 저장, 리플레이 중이면 기록된 결과와 비교"""
+        if self.recorder is not None:
+            self.recorder.finish(self.session_result())
+            self.recorder = None
+        if self.replay is not None:
+            if self.replay.recording.result is not None:
+                mismatches = self.replay.verify(self.session_result())
+                if mismatches:
+                    print(f"리플레이 결과 불일치: {'; '.join(mismatches)}")
+                else:
+                    print("리플레이 결과 일치")
+            # 이후 판은 직접 플레이
+            self.replay = None
+
+    def abandon_session(self) -> None:
+        """
+        판을 마치지 않고 떠날 때 호출 (설정 화면에서 타이틀로 이동 등)
+        지금까지의 입력 기록은 저장하고, 재생 중이던 리플레이는 결과 비교 없이 중단
+        """
+        if self.recorder is not None:
+            self.recorder.finish(self.session_result())
+            self.recorder = None
+        self.replay = None
+
     def update(self) -> None:
-        """게임 상태 업데이트"""
+        """게임 상태를 고정 간격(1/SIM_RATE초) 한 스텝만큼 업데이트"""
         if self.state_manager.game_state == SCENE_TITLE:
-            pass
+            # 리플레이는 리소스가 로드되면 바로 시작
+            if self.replay is not None and self.resources_loaded:
+                self.initialize_game_elements()
         elif self.state_manager.game_state == SCENE_PLAYING:
             if self.sherum is None or self.erpin is None or self.initializing:
                 return
+            if self.replay is not None:
+                # 기록된 입력을 기록 당시와 같은 스텝 직전에 전달
+                for event in self.replay.events_at(self.session_step):
+                    self.event_handler.handle_playing_events(event)
+            self.sim_clock.step()
             self.update_gameplay()
 
     def update_gameplay(self) -> None:
         """게임 플레이 로직 업데이트"""
-        current_time = pygame.time.get_ticks() / 1000  # 초 단위
+        current_time = self.sim_clock.time  # 시뮬레이션 시각 (초 단위)
         if self.state_manager.check_game_over_delay(current_time):
+            self.end_session()
             return
         if (
             not self.state_manager.game_over
@@ -218,36 +384,63 @@ class Game:
             self.update_students(current_time)
             self.state_manager.update_score()
 
+    def spawn_classroom(self) -> None:
+        """
+        교실 모드: 추가 선생님과 따라 추는 학생 생성 (CLASSROOM_EXTRA_* 설정)
+        추가 선생님은 선새임 옆에, 추가 학생은 격자로 배치
+        """
+        store = self.entity_store
+        sherum_x, sherum_y = self.position_manager.get_position("sherum")
+        for number in range(1, CLASSROOM_EXTRA_TEACHERS + 1):
+            teacher = Sherum(
+                current_time=self.sim_clock.time_ms, rng=self.rng, store=store
+            )
+            teacher.position = (
+                sherum_x + number * CLASSROOM_TEACHER_SPACING,
+                sherum_y,
+            )
+            self.entities["teachers"][f"sherum_{number}"] = teacher
+
+        origin_x, origin_y = CLASSROOM_ORIGIN
+        spacing_x, spacing_y = CLASSROOM_SPACING
+        for number in range(CLASSROOM_EXTRA_STUDENTS):
+            student = Joanne(rng=self.rng, store=store)
+            row, column = divmod(number, CLASSROOM_COLUMNS)
+            student.position = (
+                origin_x + column * spacing_x,
+                origin_y + row * spacing_y,
+            )
+            self.entities["students"][f"student_{number + 1}"] = student
+
     def update_teachers(self, current_time: float) -> None:
-        """모든 선생님 엔티티 업데이트"""
-        for teacher_id, teacher in self.entities["teachers"].items():
-            prev_facing = teacher.facing_away
-            teacher.update(current_time * 1000)
-            if teacher.facing_away != prev_facing:
-                self.state_manager.last_turn_time = current_time
-                self.sound_manager.play_sfx("turn")
+        """모든 선생님 엔티티의 방향 전환과 바운스를 한 번에 업데이트"""
+        turned = self.entity_store.update_teachers(current_time * 1000, self.rng)
+        if turned.size:
+            self.state_manager.last_turn_time = current_time
+            self.sound_manager.play_sfx("turn")
 
     def update_students(self, current_time: float) -> None:
-        """모든 학생 엔티티 업데이트"""
+        """플레이어 학생 상태 확인 후 따라 추는 학생들을 한 번에 업데이트"""
         active_student = self.erpin
-        if self.play_start_ticks is not None:
-            play_elapsed_sec = (pygame.time.get_ticks() - self.play_start_ticks) // 1000
-        else:
-            play_elapsed_sec = 0
+        play_elapsed_sec = int(self.play_time)
         if active_student is not None and self.sherum is not None:
-            if active_student.dancing and not self.sherum.facing_away:
+            if active_student.using_skill and not self.state_manager.skill_active(
+                current_time
+            ):
+                active_student.update_state(using_skill=False)
+            # 정면을 보는 선생님이 하나라도 있으면 들킬 수 있음
+            if active_student.dancing and self.entity_store.any_watching():
                 elapsed = current_time - self.state_manager.last_turn_time
                 if elapsed > GRACE_PERIOD:
                     self.state_manager.trigger_game_over(current_time, "caught")
-            if self.state_manager.update_gauge(active_student.dancing):
+            if self.state_manager.update_gauge(active_student.dancing, current_time):
                 self.state_manager.trigger_game_over(current_time, "no_energy")
-        for student_id, student in self.entities["students"].items():
-            if student_id == "joanne":
-                student.update(
-                    current_time * 1000, erpin=self.erpin, game_time=play_elapsed_sec
-                )
-            else:
-                student.update(current_time * 1000)
+        self.entity_store.update_followers(
+            play_elapsed_sec,
+            leader_dancing=active_student is not None and active_student.dancing,
+            rng=self.rng,
+            has_leader=active_student is not None,
+        )
 
     def restart_game(self) -> None:
         """게임을 처음부터 다시 시작"""
@@ -262,15 +455,37 @@ class Game:
         self.state_manager.game_state = SCENE_PLAYING
         print("게임 재시작 완료")
 
+    def toggle_fullscreen(self) -> None:
+        """창 모드 <-> 전체 화면 전환 (논리 화면과 스프라이트는 그대로, 설정에 저장)"""
+        if toggle_fullscreen():
+            self.fullscreen = not self.fullscreen
+            self.settings_manager.update_setting("fullscreen", self.fullscreen)
+            self.renderer.invalidate()
+
     def run(self) -> None:
         """게임 메인 루프"""
         print(f"게임 시작 상태: {self.state_manager.game_state}")
         print(f"사용 가능한 씬: {list(self.scenes.keys())}")
+        profiler = self.profiler
         while self.running:
-            self.running = self.event_handler.handle_events()
-            self.update()
-            self.renderer.render()
-            self.clock.tick(FPS)
+            profiler.begin_frame()
+            with profiler.phase(PHASE_EVENTS):
+                self.running = self.event_handler.handle_events()
+            # 실제 경과 시간만큼 고정 간격 스텝 진행 (느린 프레임 뒤에는 최대 스텝 수까지만)
+            with profiler.phase(PHASE_UPDATE):
+                for _ in range(self.sim_clock.frame()):
+                    self.update()
+            with profiler.phase(PHASE_RENDER):
+                self.animation_clock.tick()
+                self.renderer.render()
+            with profiler.phase(PHASE_WAIT):
+                self.clock.tick(self.frame_limit)
+        # 게임 오버 전에 종료한 판도 기록은 저장
+        if self.recorder is not None:
+            self.end_session()
+        if self.profile_path or PROFILER_DUMP:
+            profiler.dump(self.profile_path)
+        self.settings_manager.flush()
         pygame.quit()
 
 
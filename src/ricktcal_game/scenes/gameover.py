@@ -1,9 +1,11 @@
-import os
-
 import pygame
-from PIL import Image, ImageSequence
 
+from ..core.animation_clock import AnimationTimeline
+from ..core.asset_archive import get_assets
 from ..core.config import *
+from ..core.frame_cache import FrameCache
+from ..core.surface_format import optimize_surface
+from ..ui import Button, WidgetTree
 
 
 class GameOverScene:
@@ -13,14 +15,10 @@ class GameOverScene:
         self.game = game
         self.screen = game.screen
         self.bg_image = None
-        self.gameover_animations = {}
-        self.current_frame = 0
-        self.last_update = 0
-        self.frame_rate = 100  # 밀리초 단위 (낮을수록 빠름)
-
-        self.load_animations()
+        self.gameover_animations = {}  # 캐릭터 -> (프레임 목록, 프레임 시간표)
 
-        self.load_background()
+        # 게임 오버 애니메이션과 배경은 리소스 로더가 백그라운드에서
+        # load_animations(), load_background()로 로드
 
         button_width = 200
         button_height = 50
@@ -34,89 +32,114 @@ class GameOverScene:
         self.menu_button_rect = pygame.Rect(
             SCREEN_WIDTH // 2 - button_width // 2, 470, button_width, button_height
         )
+        self.build_widgets()
 
-    def load_animations(self):
-        """게임 오버 애니메이션 로드"""
-        try:
-            sherum_go_path = (
-                "src/ricktcal_game/resources/animations/sherum_gameover.gif"
+    def build_widgets(self):
+        """재시작, 타이틀로 버튼 위젯 생성 (텍스트는 한 번만 렌더링)"""
+        if hasattr(self.game, "font_manager"):
+            restart_text = self.game.font_manager.render_text(
+                "다시 시작", "korean", "normal", (255, 255, 255), static=True
             )
+            menu_text = self.game.font_manager.render_text(
+                "타이틀로", "korean", "normal", (255, 255, 255), static=True
+            )
+        else:
+            restart_text = self.game.font.render("다시 시작", True, (255, 255, 255))
+            menu_text = self.game.font.render("타이틀로", True, (255, 255, 255))
 
-            if os.path.exists(sherum_go_path):
-                sherum_frames = []
-                pil_img = Image.open(sherum_go_path)
+        self.widgets = WidgetTree()
+        self.widgets.add(
+            Button(
+                self.restart_button_rect,
+                restart_text,
+                on_click=lambda: self.on_button("restart"),
+            )
+        )
+        self.widgets.add(
+            Button(
+                self.menu_button_rect,
+                menu_text,
+                on_click=lambda: self.on_button("title"),
+            )
+        )
 
-                for frame in ImageSequence.Iterator(pil_img):
-                    frame_copy = frame.convert("RGBA")
-                    frame_data = frame_copy.tobytes()
-                    size = frame_copy.size
-                    mode = frame_copy.mode
+    def load_animations(self):
+        """게임 오버 애니메이션 로드 (파일이 없거나 실패하면 False 반환)"""
+        try:
+            sherum_go_name = "animations/sherum_gameover.gif"
 
-                    py_img = pygame.image.frombuffer(
-                        frame_data, size, mode
-                    ).convert_alpha()
-                    py_img = pygame.transform.scale(py_img, (300, 300))  # 크기 조정
-                    sherum_frames.append(py_img)
+            if get_assets().exists(sherum_go_name):
+                # 디스크 캐시에서 크기 조정된 프레임을 읽어 화면 형식으로 변환
+                animation = FrameCache().load_frames(
+                    sherum_go_name, GAMEOVER_ANIMATION_SIZE
+                )
+                sherum_frames = [optimize_surface(frame) for frame in animation.frames]
 
-                self.gameover_animations["sherum"] = sherum_frames
+                self.gameover_animations["sherum"] = (sherum_frames, animation.timeline)
                 print("선생님 게임오버 애니메이션 로드 완료")
-            else:
-                print("선생님 게임오버 애니메이션 파일 없음")
-                # 더미 프레임 생성
-                dummy = pygame.Surface((300, 300), pygame.SRCALPHA)
-                dummy.fill((200, 0, 0, 128))
-                self.gameover_animations["sherum"] = [dummy]
+                return True
+
+            print("선생님 게임오버 애니메이션 파일 없음")
+            # 더미 프레임 생성
+            dummy = pygame.Surface(GAMEOVER_ANIMATION_SIZE, pygame.SRCALPHA)
+            dummy.fill((200, 0, 0, 128))
+            self.gameover_animations["sherum"] = (
+                [dummy],
+                AnimationTimeline.uniform(1),
+            )
         except Exception as e:
             print(f"게임오버 애니메이션 로드 오류: {e}")
+        return False
 
     def load_background(self):
-        """배경 이미지 로드"""
+        """배경 이미지 로드 (파일이 없거나 실패하면 False 반환)"""
         try:
             # 기본 게임오버 배경(게이지 소진 시)
-            bg_path = "src/ricktcal_game/resources/images/gameover_bg.png"
-            if os.path.exists(bg_path):
-                self.bg_image = pygame.image.load(bg_path).convert_alpha()
-                self.bg_image = pygame.transform.scale(
-                    self.bg_image, (SCREEN_WIDTH, SCREEN_HEIGHT)
+            bg_name = "images/gameover_bg.png"
+            assets = get_assets()
+            if assets.exists(bg_name):
+                self.bg_image = pygame.image.load(assets.open(bg_name), bg_name)
+                self.bg_image = optimize_surface(
+                    pygame.transform.scale(self.bg_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
                 )
                 print("게임 오버 배경 이미지 로드 완료")
-            else:
-                print("게임 오버 배경 이미지 파일 없음")
+                return True
+
+            print("게임 오버 배경 이미지 파일 없음")
         except Exception as e:
             print(f"배경 이미지 로드 오류: {e}")
+        return False
 
     def draw(self, score=0):
         """게임 오버 화면 그리기"""
         self.screen.fill((50, 50, 80))
 
-        now = pygame.time.get_ticks()
-
         gameover_reason = self.game.state_manager.game_over_reason
 
         if gameover_reason == "caught":
             # 춤추다가 선생님한테 걸린 경우
-            self.draw_caught_screen(now, score)
+            self.draw_caught_screen(score)
         else:
             # 게이지가 다 떨어진 경우 (gameover_reason == "no_energy")
             self.draw_no_energy_screen(score)
 
         # 버튼 그리기 (공통)
-        self.draw_buttons()
+        self.widgets.draw(self.screen)
 
-    def draw_caught_screen(self, now, score):
+    def draw_caught_screen(self, score):
         """선생님에게 걸린 게임오버 화면"""
         # 배경 이미지 있으면 표시
         if self.bg_image:
             self.screen.blit(self.bg_image, (0, 0))
 
         if "sherum" in self.gameover_animations:
-            frames = self.gameover_animations["sherum"]
-
-            if now - self.last_update > self.frame_rate:
-                self.last_update = now
-                self.current_frame = (self.current_frame + 1) % len(frames)
+            frames, timeline = self.gameover_animations["sherum"]
 
-            frame = frames[self.current_frame]
+            # 게임 시계 기준으로 GIF 프레임 표시 시간에 맞춰 프레임 선택
+            frame_index = self.game.animation_clock.frame_index(
+                "gameover/sherum", "caught", timeline
+            )
+            frame = frames[frame_index]
             frame_rect = frame.get_rect(
                 center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)
             )
@@ -125,7 +148,11 @@ class GameOverScene:
         # 게임 오버 메시지
         if hasattr(self.game, "font_manager"):
             gameover_text = self.game.font_manager.render_text(
-                "여왕님.. 뭐하시는 건가요?", "korean", "normal", (255, 100, 100)
+                "여왕님.. 뭐하시는 건가요?",
+                "korean",
+                "normal",
+                (255, 100, 100),
+                static=True,
             )
             score_text = self.game.font_manager.render_text(
                 f"점수: {int(score)}", "korean", "normal", (255, 255, 255)
@@ -157,6 +184,7 @@ class GameOverScene:
                 "korean",
                 "normal",
                 (255, 100, 100),
+                static=True,
             )
             score_text = self.game.font_manager.render_text(
                 f"점수: {int(score)}", "korean", "normal", (255, 255, 255)
@@ -177,67 +205,15 @@ class GameOverScene:
             score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 200)
         )
 
-    def draw_buttons(self):
-        """버튼 그리기"""
-        mouse_pos = pygame.mouse.get_pos()
-
-        # 재시작 버튼
-        if hasattr(self.game, "font_manager"):
-            restart_text = self.game.font_manager.render_text(
-                "다시 시작", "korean", "normal", (255, 255, 255)
-            )
-            menu_text = self.game.font_manager.render_text(
-                "타이틀로", "korean", "normal", (255, 255, 255)
-            )
-        else:
-            restart_text = self.game.font.render("다시 시작", True, (255, 255, 255))
-            menu_text = self.game.font.render("타이틀로", True, (255, 255, 255))
-
-        # 버튼 배경 색상
-        restart_color = (
-            (100, 100, 250)
-            if self.restart_button_rect.collidepoint(mouse_pos)
-            else (70, 70, 200)
-        )
-        menu_color = (
-            (100, 100, 250)
-            if self.menu_button_rect.collidepoint(mouse_pos)
-            else (70, 70, 200)
-        )
-
-        # 버튼 그리기
-        pygame.draw.rect(
-            self.screen, restart_color, self.restart_button_rect, border_radius=5
-        )
-        pygame.draw.rect(
-            self.screen, menu_color, self.menu_button_rect, border_radius=5
-        )
-
-        self.screen.blit(
-            restart_text,
-            (
-                self.restart_button_rect.centerx - restart_text.get_width() // 2,
-                self.restart_button_rect.centery - restart_text.get_height() // 2,
-            ),
-        )
+    def on_button(self, next_state):
+        """버튼 콜백 (클릭 효과음 재생 후 다음 상태 반환)"""
+        self.game.sound_manager.play_sfx("click")
+        return next_state
 
-        self.screen.blit(
-            menu_text,
-            (
-                self.menu_button_rect.centerx - menu_text.get_width() // 2,
-                self.menu_button_rect.centery - menu_text.get_height() // 2,
-            ),
-        )
+    def enter(self):
+        """씬에 들어올 때 호출: 지난번에 남은 위젯 호버/누름 상태 초기화"""
+        self.widgets.reset()
 
     def handle_events(self, event):
         """이벤트 처리"""
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.restart_button_rect.collidepoint(event.pos):
-                self.game.sound_manager.play_sfx("click")
-                return "restart"
-
-            elif self.menu_button_rect.collidepoint(event.pos):
-                self.game.sound_manager.play_sfx("click")
-                return "title"
-
-        return None
+        return self.widgets.handle_event(event)
@@ -1,6 +1,7 @@
 import pygame
 
 from ..core.config import *
+from ..ui import Button, Label, Panel, Slider, WidgetTree
 
 
 class SettingsScene:
@@ -31,192 +32,98 @@ class SettingsScene:
         # 크레딧 표시 여부
         self.show_credits = False
 
-    def handle_events(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = event.pos
-
-            if self.show_credits:
-                # 크레딧 화면에서 아무 곳이나 클릭하면 설정 화면으로 돌아감
-                self.show_credits = False
-                self.game.sound_manager.play_sfx("click")
-                return None
-
-            # 뒤로 가기 버튼
-            if self.back_button_rect.collidepoint(mouse_pos):
-                self.game.sound_manager.play_sfx("click")
-                return self.game.previous_state
-
-            # 크레딧 버튼
-            if self.credits_button_rect.collidepoint(mouse_pos):
-                self.show_credits = True
-                self.game.sound_manager.play_sfx("click")
-                return None
-
-            # BGM 볼륨 슬라이더
-            if self.bgm_slider_rect.collidepoint(mouse_pos):
-                volume = (
-                    mouse_pos[0] - self.bgm_slider_rect.x
-                ) / self.bgm_slider_rect.width
-                self.game.settings_manager.set_bgm_volume(volume)
-                self.game.sound_manager.update_volumes()
-
-            # SFX 볼륨 슬라이더
-            if self.sfx_slider_rect.collidepoint(mouse_pos):
-                volume = (
-                    mouse_pos[0] - self.sfx_slider_rect.x
-                ) / self.sfx_slider_rect.width
-                self.game.settings_manager.set_sfx_volume(volume)
-                self.game.sound_manager.update_volumes()
-                self.game.sound_manager.play_sfx("click")  # 볼륨 변경 시 효과음 재생
-
-        elif event.type == pygame.MOUSEMOTION and event.buttons[0]:
-            mouse_pos = event.pos
-
-            # 드래그로 슬라이더 조절
-            if self.bgm_slider_rect.collidepoint(mouse_pos):
-                volume = (
-                    mouse_pos[0] - self.bgm_slider_rect.x
-                ) / self.bgm_slider_rect.width
-                volume = max(0, min(1, volume))  # 0과 1 사이로 제한
-                self.game.settings_manager.set_bgm_volume(volume)
-                self.game.sound_manager.update_volumes()
-
-            if self.sfx_slider_rect.collidepoint(mouse_pos):
-                volume = (
-                    mouse_pos[0] - self.sfx_slider_rect.x
-                ) / self.sfx_slider_rect.width
-                volume = max(0, min(1, volume))  # 0과 1 사이로 제한
-                self.game.settings_manager.set_sfx_volume(volume)
-                self.game.sound_manager.update_volumes()
-
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                self.game.sound_manager.play_sfx("click")
-                return self.game.previous_state
+        self.build_widgets()
+        self.build_credits_widgets()
 
-        return None
-
-    def draw(self):
-        # 기본 배경
-        self.screen.fill((200, 230, 255))
+    def label(self, text, size_type="normal", color=(50, 50, 150)):
+        """고정 문자열 텍스트 Surface (게임이 끝날 때까지 캐시)"""
+        return self.font_manager.render_text(
+            text, "korean", size_type, color, static=True
+        )
 
-        if self.show_credits:
-            self.draw_credits()
-        else:
-            self.draw_settings()
+    def build_widgets(self):
+        """설정 화면 위젯 생성"""
+        settings = self.game.settings_manager
+        self.widgets = WidgetTree()
 
-    def draw_settings(self):
         # 제목
-        title_text = self.title_font.render("설정", True, (50, 50, 150))
-        self.screen.blit(
-            title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 50)
+        self.widgets.add(
+            Label((SCREEN_WIDTH // 2, 50), self.label("설정", "title"), anchor="midtop")
         )
 
         # BGM 볼륨 슬라이더
-        bgm_text = self.font.render("배경 음악:", True, (50, 50, 150))
-        self.screen.blit(
-            bgm_text, (self.bgm_slider_rect.x - 150, self.bgm_slider_rect.y)
-        )
-
-        # 슬라이더 배경
-        pygame.draw.rect(self.screen, (100, 100, 150), self.bgm_slider_rect)
-
-        # 슬라이더 채우기
-        bgm_volume = self.game.settings_manager.get_bgm_volume()
-        fill_width = int(self.bgm_slider_rect.width * bgm_volume)
-        pygame.draw.rect(
-            self.screen,
-            (100, 150, 250),
-            (
-                self.bgm_slider_rect.x,
-                self.bgm_slider_rect.y,
-                fill_width,
-                self.bgm_slider_rect.height,
-            ),
+        self.widgets.add(
+            Label(
+                (self.bgm_slider_rect.x - 150, self.bgm_slider_rect.y),
+                self.label("배경 음악:"),
+            )
         )
-
-        # 슬라이더 핸들
-        handle_x = self.bgm_slider_rect.x + fill_width - self.handle_size // 2
-        pygame.draw.circle(
-            self.screen,
-            (200, 200, 250),
-            (handle_x, self.bgm_slider_rect.y + self.bgm_slider_rect.height // 2),
-            self.handle_size // 2,
+        self.bgm_slider = self.widgets.add(
+            Slider(
+                self.bgm_slider_rect,
+                settings.get_bgm_volume(),
+                on_change=self.set_bgm_volume,
+                handle_size=self.handle_size,
+            )
         )
 
-        # SFX 볼륨 슬라이더
-        sfx_text = self.font.render("효과음:", True, (50, 50, 150))
-        self.screen.blit(
-            sfx_text, (self.sfx_slider_rect.x - 150, self.sfx_slider_rect.y)
+        # SFX 볼륨 슬라이더 (누르면 바뀐 볼륨으로 효과음 재생)
+        self.widgets.add(
+            Label(
+                (self.sfx_slider_rect.x - 150, self.sfx_slider_rect.y),
+                self.label("효과음:"),
+            )
         )
-
-        # 슬라이더 배경
-        pygame.draw.rect(self.screen, (100, 100, 150), self.sfx_slider_rect)
-
-        # 슬라이더 채우기
-        sfx_volume = self.game.settings_manager.get_sfx_volume()
-        fill_width = int(self.sfx_slider_rect.width * sfx_volume)
-        pygame.draw.rect(
-            self.screen,
-            (100, 150, 250),
-            (
-                self.sfx_slider_rect.x,
-                self.sfx_slider_rect.y,
-                fill_width,
-                self.sfx_slider_rect.height,
-            ),
+        self.sfx_slider = self.widgets.add(
+            Slider(
+                self.sfx_slider_rect,
+                settings.get_sfx_volume(),
+                on_change=self.set_sfx_volume,
+                on_press=lambda: self.game.sound_manager.play_sfx("click"),
+                handle_size=self.handle_size,
+            )
         )
 
-        # 슬라이더 핸들
-        handle_x = self.sfx_slider_rect.x + fill_width - self.handle_size // 2
-        pygame.draw.circle(
-            self.screen,
-            (200, 200, 250),
-            (handle_x, self.sfx_slider_rect.y + self.sfx_slider_rect.height // 2),
-            self.handle_size // 2,
+        # 크레딧, 뒤로 가기 버튼
+        button_colors = {
+            "color": (100, 100, 150),
+            "hover_color": (100, 100, 150),
+            "pressed_color": (80, 80, 120),
+            "border_radius": 0,
+        }
+        self.widgets.add(
+            Button(
+                self.credits_button_rect,
+                self.label("크레딧", color=(255, 255, 255)),
+                on_click=self.open_credits,
+                **button_colors,
+            )
         )
-
-        # 크레딧 버튼
-        pygame.draw.rect(self.screen, (100, 100, 150), self.credits_button_rect)
-        credits_text = self.font.render("크레딧", True, (255, 255, 255))
-        self.screen.blit(
-            credits_text,
-            (
-                self.credits_button_rect.x
-                + self.credits_button_rect.width // 2
-                - credits_text.get_width() // 2,
-                self.credits_button_rect.y
-                + self.credits_button_rect.height // 2
-                - credits_text.get_height() // 2,
-            ),
+        self.widgets.add(
+            Button(
+                self.back_button_rect,
+                self.label("뒤로 가기", color=(255, 255, 255)),
+                on_click=self.go_back,
+                **button_colors,
+            )
         )
 
-        # 뒤로 가기 버튼
-        pygame.draw.rect(self.screen, (100, 100, 150), self.back_button_rect)
-        back_text = self.font.render("뒤로 가기", True, (255, 255, 255))
-        self.screen.blit(
-            back_text,
-            (
-                self.back_button_rect.x
-                + self.back_button_rect.width // 2
-                - back_text.get_width() // 2,
-                self.back_button_rect.y
-                + self.back_button_rect.height // 2
-                - back_text.get_height() // 2,
-            ),
-        )
+    def build_credits_widgets(self):
+        """크레딧 화면 위젯 생성"""
+        self.credits_widgets = WidgetTree()
 
-    def draw_credits(self):
         # 크레딧 배경
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((30, 30, 70))
-        self.screen.blit(overlay, (0, 0))
+        self.credits_widgets.add(
+            Panel((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), (30, 30, 70, 200))
+        )
 
         # 타이틀
-        title_text = self.title_font.render("크레딧", True, (255, 255, 255))
-        self.screen.blit(
-            title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 80)
+        self.credits_widgets.add(
+            Label(
+                (SCREEN_WIDTH // 2, 80),
+                self.label("크레딧", "title", (255, 255, 255)),
+                anchor="midtop",
+            )
         )
 
         # 제작자 정보
@@ -233,9 +140,65 @@ class SettingsScene:
 
         y_pos = 160
         for text in info_texts:
-            rendered_text = self.font.render(text, True, (200, 200, 255))
-            self.screen.blit(
-                rendered_text,
-                (SCREEN_WIDTH // 2 - rendered_text.get_width() // 2, y_pos),
+            self.credits_widgets.add(
+                Label(
+                    (SCREEN_WIDTH // 2, y_pos),
+                    self.label(text, color=(200, 200, 255)),
+                    anchor="midtop",
+                )
             )
             y_pos += 40
+
+    def set_bgm_volume(self, volume):
+        self.game.settings_manager.set_bgm_volume(volume)
+        self.game.sound_manager.update_volumes("bgm")
+
+    def set_sfx_volume(self, volume):
+        self.game.settings_manager.set_sfx_volume(volume)
+        self.game.sound_manager.update_volumes("sfx")
+
+    def open_credits(self):
+        self.show_credits = True
+        self.game.sound_manager.play_sfx("click")
+        return None
+
+    def go_back(self):
+        self.game.sound_manager.play_sfx("click")
+        return self.game.previous_state
+
+    def enter(self):
+        """씬에 들어올 때 호출: 지난번에 남은 위젯 호버/누름 상태 초기화"""
+        self.widgets.reset()
+        self.credits_widgets.reset()
+
+    def handle_events(self, event):
+        if self.show_credits:
+            # 크레딧 화면에서 아무 곳이나 클릭하면 설정 화면으로 돌아감
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.show_credits = False
+                self.game.sound_manager.play_sfx("click")
+            return None
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.game.sound_manager.play_sfx("click")
+                return self.game.previous_state
+            return None
+
+        return self.widgets.handle_event(event)
+
+    def draw(self):
+        # 기본 배경
+        self.screen.fill((200, 230, 255))
+
+        if self.show_credits:
+            self.credits_widgets.draw(self.screen)
+        else:
+            self.draw_settings()
+
+    def draw_settings(self):
+        # 볼륨은 다른 곳에서 바뀔 수 있으므로 그릴 때 맞춤 (바뀌었을 때만 다시 합성)
+        settings = self.game.settings_manager
+        self.bgm_slider.set_value(settings.get_bgm_volume())
+        self.sfx_slider.set_value(settings.get_sfx_volume())
+        self.widgets.draw(self.screen)
@@ -1,6 +1,9 @@
 import pygame
 
+from ..core.asset_archive import get_assets
 from ..core.config import *
+from ..core.surface_format import optimize_surface
+from ..ui import Button, Label, WidgetTree
 
 
 class TitleScene:
@@ -29,26 +32,63 @@ class TitleScene:
         self.start_button_rect = pygame.Rect(
             SCREEN_WIDTH // 2 - button_width // 2, 450, button_width, button_height
         )
+        self.build_widgets()
 
+        # 배경 이미지는 리소스 로더가 백그라운드에서 load_background()로 로드
+        # (로드 전까지는 배경색만 그려 첫 화면을 바로 표시)
         self.bg_image = None
-        self.load_background()
+
+    def build_widgets(self):
+        """제목, 시작 버튼, 설정 툴팁 위젯 생성 (텍스트는 한 번만 렌더링)"""
+        if hasattr(self, "font_manager"):
+            title_text = self.font_manager.render_text(
+                "선새임 몰래 춤추기", "korean", "title", (255, 255, 255), static=True
+            )
+            start_text = self.font_manager.render_text(
+                "게임 시작", "korean", "normal", (255, 255, 255), static=True
+            )
+            tooltip_text = self.font_manager.render_text(
+                "설정 - ESC", "korean", "small", (200, 200, 255), static=True
+            )
+        else:
+            title_text = self.title_font.render(
+                "선새임 몰래 춤추기", True, (255, 255, 255)
+            )
+            start_text = self.font.render("게임 시작", True, (255, 255, 255))
+            tooltip_text = self.small_font.render("설정 - ESC", True, (200, 200, 255))
+
+        self.widgets = WidgetTree()
+        self.widgets.add(Label((SCREEN_WIDTH // 2, 150), title_text, anchor="midtop"))
+        # 시작 버튼 - 로딩 중일 때는 비활성화 (draw()에서 로딩 상태에 맞춤)
+        self.start_button = self.widgets.add(
+            Button(
+                self.start_button_rect,
+                start_text,
+                on_click=self.start_game,
+                enabled=False,
+            )
+        )
+        # 설정 툴팁 (좌측 하단)
+        self.widgets.add(Label((20, SCREEN_HEIGHT - 30), tooltip_text))
 
     def load_background(self):
-        """배경 이미지 로드"""
+        """배경 이미지 로드 (파일이 없거나 실패하면 False 반환)"""
         try:
-            bg_path = "src/ricktcal_game/resources/images/main_title.png"
-            import os
+            bg_name = "images/main_title.png"
+            assets = get_assets()
 
-            if os.path.exists(bg_path):
-                self.bg_image = pygame.image.load(bg_path).convert_alpha()
-                self.bg_image = pygame.transform.scale(
-                    self.bg_image, (SCREEN_WIDTH, SCREEN_HEIGHT)
+            if assets.exists(bg_name):
+                self.bg_image = pygame.image.load(assets.open(bg_name), bg_name)
+                self.bg_image = optimize_surface(
+                    pygame.transform.scale(self.bg_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
                 )
                 print("타이틀 배경 이미지 로드 완료")
-            else:
-                print("타이틀 배경 이미지 파일이 없습니다")
+                return True
+
+            print("타이틀 배경 이미지 파일이 없습니다")
         except Exception as e:
             print(f"배경 이미지 로드 오류: {e}")
+        return False
 
     def draw(self):
         """타이틀 화면 그리기"""
@@ -57,89 +97,73 @@ class TitleScene:
         if self.bg_image:
             self.screen.blit(self.bg_image, (0, 0))
 
-        if hasattr(self, "font_manager"):
-            title_text = self.font_manager.render_text(
-                "선새임 몰래 춤추기", "korean", "title", (255, 255, 255)
-            )
-        else:
-            title_text = self.title_font.render(
-                "선새임 몰래 춤추기", True, (255, 255, 255)
-            )
+        self.start_button.enabled = self.game.resources_loaded
+        self.widgets.draw(self.screen)
 
-        self.screen.blit(
-            title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 150)
-        )
+        self.draw_loading_status()
 
-        self.draw_buttons()
+    def draw_loading_status(self):
+        """리소스 로딩 진행률, 현재 로드 중인 리소스, 실패한 리소스 표시"""
+        loader = self.game.loader
+        loading_y = self.start_button_rect.bottom + 20  # 시작 버튼 아래 20픽셀 여백
 
-        if not self.game.resources_loaded:
-            loading_text = self.font.render(
+        # 필수 리소스 로드 후에도 나머지 리소스 로딩 진행률은 계속 표시
+        if not loader.finished.is_set():
+            loading_text = self.render_status(
                 f"리소스 로딩 중... {self.game.loading_progress:.0f}%",
-                True,
+                "normal",
                 (255, 255, 255),
             )
-
-            loading_y = self.start_button_rect.bottom + 20  # 시작 버튼 아래 20픽셀 여백
             self.screen.blit(
                 loading_text,
                 (SCREEN_WIDTH // 2 - loading_text.get_width() // 2, loading_y),
             )
+            loading_y += loading_text.get_height() + 5
 
-    def draw_buttons(self):
-        """버튼 그리기 (시작 버튼만)"""
-        mouse_pos = pygame.mouse.get_pos()
-
-        resources_loading = not self.game.resources_loaded
+            if self.game.loading_message:
+                asset_text = self.render_status(
+                    self.game.loading_message, "small", (200, 200, 255)
+                )
+                self.screen.blit(
+                    asset_text,
+                    (SCREEN_WIDTH // 2 - asset_text.get_width() // 2, loading_y),
+                )
+                loading_y += asset_text.get_height() + 5
 
-        if hasattr(self, "font_manager"):
-            start_text = self.font_manager.render_text(
-                "게임 시작", "korean", "normal", (255, 255, 255)
+        for name in list(loader.failures):
+            failure_text = self.render_status(
+                f"로드 실패: {name}", "small", (255, 150, 150)
             )
-        else:
-            start_text = self.font.render("게임 시작", True, (255, 255, 255))
-
-        # 시작 버튼 - 로딩 중일 때는 비활성화
-        if resources_loading:
-            button_color = (100, 100, 150)  # 비활성화 색상
-        else:
-            button_color = (
-                (100, 100, 250)
-                if self.start_button_rect.collidepoint(mouse_pos)
-                else (70, 70, 200)
+            self.screen.blit(
+                failure_text,
+                (SCREEN_WIDTH // 2 - failure_text.get_width() // 2, loading_y),
             )
+            loading_y += failure_text.get_height() + 2
 
-        pygame.draw.rect(
-            self.screen, button_color, self.start_button_rect, border_radius=5
-        )
-
-        self.screen.blit(
-            start_text,
-            (
-                self.start_button_rect.centerx - start_text.get_width() // 2,
-                self.start_button_rect.centery - start_text.get_height() // 2,
-            ),
-        )
-
-        # 설정 툴팁 (좌측 하단)
+    def render_status(self, text, size, color):
+        """
+        로딩 상태 텍스트 렌더링 (폰트 관리자가 없으면 기본 폰트 사용)
+        :param size: 폰트 크기 이름 ("normal" 또는 "small")
+        """
         if hasattr(self, "font_manager"):
-            tooltip_text = self.font_manager.render_text(
-                "설정 - ESC", "korean", "small", (200, 200, 255)
-            )
-        else:
-            tooltip_text = self.small_font.render("설정 - ESC", True, (200, 200, 255))
-
-        self.screen.blit(tooltip_text, (20, SCREEN_HEIGHT - 30))
+            return self.font_manager.render_text(text, "korean", size, color)
+        font = self.small_font if size == "small" else self.font
+        return font.render(text, True, color)
+
+    def start_game(self):
+        """시작 버튼 콜백 (리소스가 로드되었을 때만 버튼이 활성화됨)"""
+        self.game.sound_manager.play_sfx("click")
+        self.game.initialize_game_elements()
+        return "playing"
+
+    def enter(self):
+        """
+        씬에 들어올 때 호출: 지난번에 남은 위젯 호버/누름 상태 초기화
+        진행 중이던 판을 두고 돌아온 경우 그 판의 입력 기록을 저장
+        """
+        self.widgets.reset()
+        self.game.abandon_session()
 
     def handle_events(self, event):
         """이벤트 처리"""
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.start_button_rect.collidepoint(event.pos):
-                # 리소스가 로드되었을 때만 게임 시작
-                if self.game.resources_loaded:
-                    self.game.sound_manager.play_sfx("click")
-                    self.game.initialize_game_elements()
-                    return "playing"
-                else:
-                    return None
-
-        return None
+        return self.widgets.handle_event(event)
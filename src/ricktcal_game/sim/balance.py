@@ -0,0 +1,438 @@
+"""
+게임 밸런스 몬테카를로 시뮬레이터 (화면 없이 수십만 판을 한 번에 시뮬레이션)
+
+실행: python -m ricktcal_game.sim.balance [--sessions N] [--policy cautious] ...
+GameStateManager, TeacherEntity와 같은 규칙(게이지, 점수, 선생님 방향 전환, 유예 시간)을
+고정 간격 스텝(SIM_RATE) 단위로 진행하며, 모든 판의 상태는 NumPy 배열로 한 번에 계산
+"""
+
+import argparse
+import sys
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from ..core.config import (
+    GAUGE_DECREASE,
+    GAUGE_INCREASE,
+    GRACE_PERIOD,
+    INITIAL_GAUGE,
+    INITIAL_SKILL_CHARGES,
+    SCORE_PER_STEP,
+    SIM_RATE,
+    SKILL_CHARGE,
+    TEACHER_TURN_MAX_DELAY,
+    TEACHER_TURN_MIN_DELAY,
+)
+
+# 게임 오버 사유 (GameStateManager.game_over_reason과 같은 이름)
+REASON_ALIVE = 0
+REASON_CAUGHT = 1
+REASON_NO_ENERGY = 2
+REASON_NAMES = {
+    REASON_ALIVE: "생존",
+    REASON_CAUGHT: "caught",
+    REASON_NO_ENERGY: "no_energy",
+}
+
+# 한 번에 벡터 연산으로 진행할 판 수
+SIM_CHUNK_SIZE = 65_536
+
+# 배열에서 이 비율 이상의 판이 끝나면 배열을 줄임
+SIM_COMPACT_FRACTION = 0.25
+
+# 초 -> 스텝 변환 시 허용하는 부동소수점 오차
+STEP_EPSILON = 1e-6
+
+
+class BalanceParams(NamedTuple):
+    """시뮬레이션에 사용할 밸런스 값 (기본값은 core/config.py)"""
+
+    gauge_decrease: float = GAUGE_DECREASE  # 스텝당
+    gauge_increase: float = GAUGE_INCREASE  # 스텝당
+    skill_charge: float = SKILL_CHARGE
+    grace_period: float = GRACE_PERIOD  # 초
+    turn_min_delay: float = TEACHER_TURN_MIN_DELAY  # ms
+    turn_max_delay: float = TEACHER_TURN_MAX_DELAY  # ms
+    initial_gauge: float = INITIAL_GAUGE
+    initial_skill_charges: int = INITIAL_SKILL_CHARGES
+    score_per_step: float = SCORE_PER_STEP
+    sim_rate: int = SIM_RATE
+
+
+class SessionState:
+    """
+    살아 있는 판들의 상태 배열 (정책은 이 값을 읽어 행동을 결정)
+    게임 오버된 판은 alive를 False로 두고 계속 계산하다가(결과는 무시),
+    일정 비율 이상 쌓이면 keep()으로 배열에서 제거
+    시각과 간격은 모두 스텝 수(int32)로 다룸 (판이 길어져도 비교 오차가 없고,
+    정수끼리 비교하므로 형 변환 없이 빠름)
+    """
+
+    # 판이 끝날 때 함께 줄여야 하는 배열 이름
+    ARRAYS = (
+        "index",
+        "gauge",
+        "skill_charges",
+        "facing_away",
+        "last_turn",
+        "turn_delay",
+        "dancing",
+        "since_turn",
+        "alive",
+    )
+
+    def __init__(self, index, params, rng):
+        self.params = params
+        self.rng = rng
+        self.dt = 1.0 / params.sim_rate
+        self.step = 0  # 현재 스텝 (모든 판 공통)
+
+        count = len(index)
+        self.index = index  # 전체 결과 배열에서의 판 번호
+        self.gauge = np.full(count, params.initial_gauge, dtype=np.float32)
+        self.skill_charges = np.full(count, params.initial_skill_charges, np.int16)
+        self.facing_away = np.ones(count, dtype=bool)
+        self.last_turn = np.zeros(count, dtype=np.int32)  # 마지막 방향 전환 스텝
+        self.turn_delay = self.draw_turn_delay(count)  # 다음 방향 전환까지 (스텝)
+        self.dancing = np.zeros(count, dtype=bool)
+        self.since_turn = np.zeros(count, dtype=np.int32)  # 방향 전환 후 경과 스텝
+        self.alive = np.ones(count, dtype=bool)
+        self.live = count  # 아직 게임 오버되지 않은 판 수
+
+    @property
+    def time(self):
+        """시뮬레이션 시각 (초)"""
+        return self.step * self.dt
+
+    def steps(self, seconds):
+        """
+        초 단위 간격을 스텝 수로 변환 (올림, 배열도 가능)
+        정수 경과 스텝 n에 대해 n >= steps(t)는 n * dt >= t와 같음
+        """
+        steps = np.asarray(seconds) * self.params.sim_rate
+        # 0.2 * 60 = 12.000000000000002 같은 부동소수점 오차는 무시
+        return np.ceil(steps - STEP_EPSILON).astype(np.int32)
+
+    def draw_turn_delay(self, count):
+        """
+        선생님 방향 전환 간격 (TeacherEntity와 같은 균등 분포, ms -> 스텝)
+        경과 > 간격 비교만 하므로 내림해도 결과가 같음
+        """
+        params = self.params
+        delay_ms = self.rng.uniform(params.turn_min_delay, params.turn_max_delay, count)
+        return (delay_ms * (params.sim_rate / 1000)).astype(np.int32)
+
+    def advance(self):
+        """한 스텝 진행하고 방향 전환 후 경과 스텝 갱신"""
+        self.step += 1
+        np.subtract(self.step, self.last_turn, out=self.since_turn)
+
+    def __len__(self):
+        return len(self.index)
+
+    def keep(self, mask):
+        """mask가 True인 판만 남김 (게임 오버된 판을 배열에서 제거)"""
+        for name in self.ARRAYS:
+            setattr(self, name, getattr(self, name)[mask])
+
+
+class Policy:
+    """
+    플레이어 정책 기본 클래스
+    decide()는 매 스텝 (춤출지 여부, 스킬 사용 여부) 불리언 배열 두 개를 반환
+    판마다 다른 값(반응 속도 등)은 setup()에서 배열로 만들고 keep()으로 함께 줄임
+    """
+
+    name = "policy"
+
+    def setup(self, state):
+        pass
+
+    def keep(self, mask):
+        pass
+
+    def decide(self, state):
+        raise NotImplementedError
+
+
+class IdlePolicy(Policy):
+    """춤을 추지 않고 스킬만 사용 (게이지 소진까지 버티는 기준선)"""
+
+    name = "idle"
+
+    def decide(self, state):
+        dance = np.zeros(len(state), dtype=bool)
+        return dance, state.gauge < 50
+
+
+class RandomPolicy(Policy):
+    """선생님 방향과 무관하게 매 스텝 일정 확률로 춤 상태를 바꾸는 정책"""
+
+    name = "random"
+
+    def __init__(self, switch_rate=1.0):
+        """:param switch_rate: 초당 춤 상태를 바꾸는 평균 횟수"""
+        self.switch_rate = switch_rate
+
+    def decide(self, state):
+        switch_prob = self.switch_rate / state.params.sim_rate
+        switch = state.rng.random(len(state)) < switch_prob
+        return state.dancing ^ switch, state.gauge < 30
+
+
+class CautiousPolicy(Policy):
+    """
+    선생님이 돌아선 뒤 잠시 기다렸다가 춤추고, 선생님이 돌아보면 반응 시간 뒤에 멈추는 정책
+    플레이어마다 평균 반응 시간이 다르고(reaction_std), 선생님이 돌아볼 때마다
+    그 평균 주변에서 반응 시간을 새로 뽑음(reaction_jitter, 유예 시간보다 느리면 걸림)
+    """
+
+    name = "cautious"
+
+    def __init__(
+        self,
+        reaction_mean=0.2,
+        reaction_std=0.03,
+        reaction_jitter=0.04,
+        start_delay=0.2,
+        skill_gauge=30,
+    ):
+        self.reaction_mean = reaction_mean
+        self.reaction_std = reaction_std
+        self.reaction_jitter = reaction_jitter
+        self.start_delay = start_delay
+        self.skill_gauge = skill_gauge
+        self.start_steps = 0
+        self.player_reaction = None  # 판별 평균 반응 시간 (초)
+        self.reaction = None  # 이번 방향 전환에 대한 판별 반응 시간 (스텝)
+
+    def setup(self, state):
+        # 시간은 미리 스텝 수로 바꿔 두고 매 스텝 정수끼리 비교
+        self.start_steps = int(state.steps(self.start_delay))
+        self.player_reaction = state.rng.normal(
+            self.reaction_mean, self.reaction_std, len(state)
+        )
+        self.reaction = self.draw_reaction(state, self.player_reaction)
+
+    def draw_reaction(self, state, player_reaction):
+        jitter = state.rng.normal(0.0, self.reaction_jitter, len(player_reaction))
+        return state.steps(np.clip(player_reaction + jitter, 0.05, None))
+
+    def keep(self, mask):
+        self.player_reaction = self.player_reaction[mask]
+        self.reaction = self.reaction[mask]
+
+    def decide(self, state):
+        since_turn = state.since_turn
+        # 이번 스텝에 선생님이 돌아본 판은 반응 시간을 새로 뽑음
+        looked = np.flatnonzero((since_turn == 0) & ~state.facing_away)
+        if len(looked):
+            self.reaction[looked] = self.draw_reaction(
+                state, self.player_reaction[looked]
+            )
+
+        start = state.facing_away & (since_turn >= self.start_steps)
+        # 선생님이 돌아본 직후에는 반응 시간이 지날 때까지 계속 춤춤
+        late = ~state.facing_away & state.dancing & (since_turn < self.reaction)
+        return start | late, state.gauge < self.skill_gauge
+
+
+POLICIES = {
+    policy.name: policy for policy in (IdlePolicy, RandomPolicy, CautiousPolicy)
+}
+
+
+class BalanceResult:
+    """시뮬레이션 결과 (판별 생존 시간, 점수, 게임 오버 사유)"""
+
+    def __init__(self, params, survival_time, score, reason, max_seconds, elapsed):
+        self.params = params
+        self.survival_time = (
+            survival_time  # 게임 오버 시각 (초, 생존한 판은 max_seconds)
+        )
+        self.score = score
+        self.reason = reason
+        self.max_seconds = max_seconds
+        self.elapsed = elapsed  # 시뮬레이션에 걸린 실제 시간 (초)
+
+    @property
+    def sessions(self):
+        return len(self.score)
+
+    def survival_curve(self, step=1.0):
+        """(시각 목록, 해당 시각까지 살아 있는 판의 비율) 반환"""
+        times = np.arange(0.0, self.max_seconds + step / 2, step)
+        alive = 1.0 - np.searchsorted(
+            np.sort(self.survival_time), times, side="right"
+        ) / len(self.survival_time)
+        alive[times >= self.max_seconds] = np.mean(self.reason == REASON_ALIVE)
+        return times, alive
+
+    def score_percentiles(self, percentiles=(5, 25, 50, 75, 95)):
+        return dict(zip(percentiles, np.percentile(self.score, percentiles)))
+
+    def reason_counts(self):
+        return {
+            REASON_NAMES[reason]: int(np.count_nonzero(self.reason == reason))
+            for reason in REASON_NAMES
+        }
+
+
+def simulate(
+    policy,
+    sessions=100_000,
+    max_seconds=300.0,
+    params=None,
+    seed=None,
+    chunk_size=SIM_CHUNK_SIZE,
+):
+    """
+    정책으로 sessions판을 시뮬레이션 (chunk_size판씩 묶어 벡터 연산으로 동시에 진행)
+    :param policy: Policy 인스턴스
+    :param max_seconds: 이 시각까지 살아남은 판은 생존으로 기록
+    :param chunk_size: 한 번에 진행할 판 수 (배열이 CPU 캐시에 들어가는 크기가 빠름)
+    """
+    params = params or BalanceParams()
+    rng = np.random.default_rng(seed)
+    total_steps = int(round(max_seconds * params.sim_rate))
+
+    # 판별 게임 오버 스텝 (생존한 판은 total_steps)과 사유
+    end_step = np.full(sessions, total_steps, dtype=np.int32)
+    reason = np.full(sessions, REASON_ALIVE, dtype=np.int8)
+
+    start = time.perf_counter()
+    for offset in range(0, sessions, chunk_size):
+        index = np.arange(offset, min(sessions, offset + chunk_size))
+        run_chunk(
+            policy, SessionState(index, params, rng), total_steps, end_step, reason
+        )
+
+    # 게임 오버가 트리거된 스텝에도 점수는 한 번 오르므로 (update_score 호출 순서)
+    # 점수는 진행한 스텝 수에 비례
+    survival_time = end_step / params.sim_rate
+    score = end_step * params.score_per_step
+    return BalanceResult(
+        params, survival_time, score, reason, max_seconds, time.perf_counter() - start
+    )
+
+
+def run_chunk(policy, state, total_steps, end_step, reason):
+    """판 묶음 하나를 모두 끝나거나 total_steps까지 진행하고 결과 배열에 기록"""
+    params = state.params
+    # 경과 > 유예 시간 비교이므로 내림 (정수 비교)
+    grace_steps = int(params.grace_period * params.sim_rate + STEP_EPSILON)
+    gauge_span = params.gauge_increase + params.gauge_decrease
+    policy.setup(state)
+
+    while state.step < total_steps and state.live:
+        # Game.update()와 같은 순서: 시계 진행 -> 선생님 -> 학생(걸림, 게이지) -> 점수
+        state.advance()
+
+        # 방향을 바꾸는 판은 스텝마다 소수이므로 마스크 대신 번호 목록으로 갱신
+        turning = np.flatnonzero(state.since_turn > state.turn_delay)
+        if len(turning):
+            state.facing_away[turning] ^= True
+            state.last_turn[turning] = state.step
+            state.since_turn[turning] = 0
+            state.turn_delay[turning] = state.draw_turn_delay(len(turning))
+
+        dance, use_skill = policy.decide(state)
+        state.dancing = dance
+
+        # 스킬 사용 (EventHandler -> GameStateManager.use_skill)
+        use_skill &= state.skill_charges > 0
+        skill = np.flatnonzero(use_skill)
+        if len(skill):
+            state.gauge[skill] = np.minimum(
+                100, state.gauge[skill] + params.skill_charge
+            )
+            state.skill_charges[skill] -= 1
+
+        caught = state.since_turn > grace_steps
+        caught &= dance
+        caught &= ~state.facing_away
+
+        # 춤추면 +gauge_increase, 아니면 -gauge_decrease (0 ~ 100)
+        state.gauge += dance * np.float32(gauge_span) - np.float32(
+            params.gauge_decrease
+        )
+        np.minimum(state.gauge, 100, out=state.gauge)
+        over = state.gauge <= 0
+        over |= caught
+        over &= state.alive
+
+        ended = np.flatnonzero(over)
+        if len(ended):
+            end_step[state.index[ended]] = state.step
+            reason[state.index[ended]] = np.where(
+                caught[ended], REASON_CAUGHT, REASON_NO_ENERGY
+            )
+            state.alive[ended] = False
+            state.live -= len(ended)
+
+            # 끝난 판이 충분히 쌓였을 때만 배열을 줄임 (매 스텝 복사하지 않도록)
+            if state.live < len(state) * (1 - SIM_COMPACT_FRACTION):
+                alive = state.alive
+                state.keep(alive)
+                policy.keep(alive)
+
+
+def format_report(result, policy_name, curve_step=10.0):
+    """결과 요약 문자열 (생존 곡선, 점수 분포, 게임 오버 사유)"""
+    lines = [
+        f"정책: {policy_name}, {result.sessions:,}판, 최대 {result.max_seconds:.0f}초, "
+        f"시뮬레이션 {result.elapsed:.2f}초",
+        "",
+        "게임 오버 사유:",
+    ]
+    for name, count in result.reason_counts().items():
+        lines.append(f"  {name:<10}{count:>10,} ({count / result.sessions:6.1%})")
+
+    lines += ["", "점수 분포:"]
+    lines.append(
+        f"  평균 {np.mean(result.score):.1f}, 표준편차 {np.std(result.score):.1f}"
+    )
+    for percentile, value in result.score_percentiles().items():
+        lines.append(f"  p{percentile:<3}{value:>10.1f}")
+
+    lines += ["", "생존 곡선 (시각: 생존 비율):"]
+    for seconds, alive in zip(*result.survival_curve(curve_step)):
+        bar = "#" * int(round(alive * 40))
+        lines.append(f"  {seconds:>6.0f}초 {alive:6.1%} {bar}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="게임 밸런스 몬테카를로 시뮬레이션")
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--max-seconds", type=float, default=300.0)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="cautious")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--curve-step", type=float, default=10.0)
+    parser.add_argument("--chunk-size", type=int, default=SIM_CHUNK_SIZE)
+    # 밸런스 값 덮어쓰기 (지정하지 않으면 core/config.py 값)
+    for field, default in BalanceParams._field_defaults.items():
+        parser.add_argument(
+            f"--{field.replace('_', '-')}", type=type(default), default=default
+        )
+    args = parser.parse_args(argv)
+
+    params = BalanceParams(
+        **{field: getattr(args, field) for field in BalanceParams._fields}
+    )
+    result = simulate(
+        POLICIES[args.policy](),
+        sessions=args.sessions,
+        max_seconds=args.max_seconds,
+        params=params,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+    )
+    print(format_report(result, args.policy, args.curve_step))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+from .profiler_overlay import ProfilerOverlay
+from .widget_tree import WidgetTree
+from .widgets import Button, Label, Panel, Slider, Widget
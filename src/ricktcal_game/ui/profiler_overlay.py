@@ -0,0 +1,98 @@
+import pygame
+
+from ..core.config import FPS, PROFILER_OVERLAY_REFRESH
+from ..core.frame_profiler import FRAME
+from .widgets import Widget
+
+OVERLAY_FONT_SIZE = 18
+OVERLAY_BACKGROUND = (10, 10, 20)
+OVERLAY_TEXT_COLOR = (230, 230, 230)
+OVERLAY_HISTOGRAM_BINS = 20
+OVERLAY_HISTOGRAM_MAX_MS = 50.0
+OVERLAY_HISTOGRAM_HEIGHT = 40
+
+
+class ProfilerOverlay(Widget):
+    """
+    프레임 프로파일러 오버레이 (프레임 시간, 구간별 p50/p95/p99, 프레임 시간 히스토그램)
+    불투명 배경으로 합성하므로 같은 자리에 다시 그리기만 하면 되고,
+    통계는 refresh 프레임마다 한 번만 다시 계산해 합성
+    """
+
+    def __init__(self, pos, profiler, width=330, refresh=PROFILER_OVERLAY_REFRESH):
+        self.profiler = profiler
+        self.refresh = refresh
+        # 측정 숫자는 매번 바뀌므로 폰트 관리자 텍스트 캐시를 거치지 않고 직접 렌더링
+        self.font = pygame.font.Font(None, OVERLAY_FONT_SIZE)
+        self.line_height = self.font.get_linesize()
+        super().__init__((pos, (width, self.line_height)))
+
+    def state(self):
+        return self.profiler.frame_count // self.refresh
+
+    def rows(self):
+        """표시할 행 목록: (이름, 값 문자열 목록), 값은 열마다 오른쪽 정렬"""
+        p50, p95, p99 = self.profiler.stats(FRAME)
+        fps = 1000 / p50 if p50 else 0
+        rows = [
+            (f"frame ms ({fps:.0f} fps)", [f"{p50:.1f}", f"{p95:.1f}", f"{p99:.1f}"]),
+            ("phase ms", ["p50", "p95", "p99"]),
+        ]
+        for name in self.profiler.phase_names():
+            rows.append((name, [f"{value:.2f}" for value in self.profiler.stats(name)]))
+        return rows
+
+    def compose(self):
+        rows = self.rows()
+        padding = 6
+        histogram_top = padding + len(rows) * self.line_height + padding
+        height = histogram_top + OVERLAY_HISTOGRAM_HEIGHT + self.line_height + padding
+        # 구간 수에 따라 높이가 바뀌므로 영역도 함께 갱신
+        self.rect.height = height
+
+        surface = pygame.Surface((self.rect.width, height))
+        surface.fill(OVERLAY_BACKGROUND)
+        # 값 열의 오른쪽 끝 위치 (비례 폭 글꼴이므로 열마다 정렬)
+        column_right = [self.rect.width - padding - 60 * i for i in (2, 1, 0)]
+        for index, (name, values) in enumerate(rows):
+            y = padding + index * self.line_height
+            surface.blit(self.font.render(name, True, OVERLAY_TEXT_COLOR), (padding, y))
+            for right, value in zip(column_right, values):
+                text = self.font.render(value, True, OVERLAY_TEXT_COLOR)
+                surface.blit(text, text.get_rect(topright=(right, y)))
+
+        self.draw_histogram(surface, padding, histogram_top)
+        return surface
+
+    def draw_histogram(self, surface, x, top):
+        """프레임 시간 히스토그램 (목표 프레임 시간 위치에 세로선)"""
+        counts = self.profiler.histogram(
+            FRAME, OVERLAY_HISTOGRAM_BINS, OVERLAY_HISTOGRAM_MAX_MS
+        )
+        width = surface.get_width() - x * 2
+        bar_width = width / OVERLAY_HISTOGRAM_BINS
+        bin_ms = OVERLAY_HISTOGRAM_MAX_MS / OVERLAY_HISTOGRAM_BINS
+        target_ms = 1000 / FPS
+        peak = max(counts) or 1
+        bottom = top + OVERLAY_HISTOGRAM_HEIGHT
+
+        for index, count in enumerate(counts):
+            height = int(OVERLAY_HISTOGRAM_HEIGHT * count / peak)
+            # 목표 프레임 시간 안에 든 구간은 초록, 넘는 구간은 빨강
+            color = (80, 200, 80) if index * bin_ms < target_ms else (220, 80, 60)
+            bar = pygame.Rect(
+                x + int(index * bar_width),
+                bottom - height,
+                max(1, int(bar_width) - 1),
+                height,
+            )
+            pygame.draw.rect(surface, color, bar)
+
+        target_x = x + int(target_ms / OVERLAY_HISTOGRAM_MAX_MS * width)
+        pygame.draw.line(surface, (255, 255, 255), (target_x, top), (target_x, bottom))
+        label = self.font.render(
+            f"0 - {OVERLAY_HISTOGRAM_MAX_MS:.0f} ms  (| {target_ms:.1f} ms)",
+            True,
+            OVERLAY_TEXT_COLOR,
+        )
+        surface.blit(label, (x, bottom + 2))
@@ -0,0 +1,97 @@
+import pygame
+
+
+class WidgetTree:
+    """
+    씬 하나의 위젯 목록 (추가한 순서대로 그리고, 위에 그려진 위젯부터 히트 테스트)
+    마우스 이벤트를 한 곳에서 받아 호버/누름 상태를 갱신하고 위젯 콜백을 호출
+    """
+
+    def __init__(self, widgets=()):
+        self.widgets = []
+        self.hovered = None
+        self.pressed = None  # 마우스 버튼을 누른 위젯 (떼기 전까지 드래그를 받음)
+        for widget in widgets:
+            self.add(widget)
+
+    def add(self, widget):
+        """위젯 추가 후 그대로 반환 (씬에서 속성으로 보관하기 쉽도록)"""
+        self.widgets.append(widget)
+        return widget
+
+    def widget_at(self, pos):
+        """pos 위치의 가장 위에 있는 입력 가능한 위젯 (없으면 None)"""
+        for widget in reversed(self.widgets):
+            if widget.interactive and widget.hit_test(pos):
+                return widget
+        return None
+
+    def update_hover(self, pos):
+        """마우스 위치로 호버 상태 갱신 (바뀐 위젯만 다시 합성됨)"""
+        hovered = self.widget_at(pos)
+        if hovered is self.hovered:
+            return
+        if self.hovered is not None:
+            self.hovered.hovered = False
+        if hovered is not None:
+            hovered.hovered = True
+        self.hovered = hovered
+
+    def handle_event(self, event):
+        """
+        마우스 이벤트를 위젯에 전달
+        :return: 위젯 콜백의 반환값 (예: 다음 게임 상태), 처리한 위젯이 없으면 None
+        """
+        if event.type == pygame.MOUSEMOTION:
+            self.update_hover(event.pos)
+            if self.pressed is not None and event.buttons[0]:
+                return self.pressed.on_drag(event.pos)
+
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            # 떼기 이벤트를 받지 못한 이전 누름 상태는 정리
+            self.release()
+            widget = self.widget_at(event.pos)
+            if widget is not None:
+                self.pressed = widget
+                widget.pressed = True
+                return widget.on_press(event.pos)
+
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            widget, self.pressed = self.pressed, None
+            if widget is not None:
+                widget.pressed = False
+                return widget.on_release(event.pos)
+
+        return None
+
+    def release(self):
+        """누르고 있던 위젯의 누름 상태 해제 (콜백은 호출하지 않음)"""
+        if self.pressed is not None:
+            self.pressed.pressed = False
+            self.pressed = None
+
+    def reset(self):
+        """
+        호버/누름 상태 초기화 (씬에 들어올 때 호출)
+        버튼으로 씬을 떠나면 그 씬의 트리는 떼기 이벤트를 받지 못하므로 상태가 남아 있음
+        """
+        self.release()
+        if self.hovered is not None:
+            self.hovered.hovered = False
+            self.hovered = None
+
+    def draw(self, screen, mouse_pos=None):
+        """
+        모든 위젯 그리기 (각 위젯은 캐시된 Surface를 blit)
+        :param mouse_pos: 호버 상태를 맞출 마우스 위치 (None이면 현재 마우스 위치)
+        """
+        self.update_hover(pygame.mouse.get_pos() if mouse_pos is None else mouse_pos)
+        for widget in self.widgets:
+            widget.draw(screen)
+
+    def bounding_rect(self):
+        """모든 위젯이 그리는 영역을 합친 사각형"""
+        rects = [widget.draw_rect() for widget in self.widgets if widget.visible]
+        if not rects:
+            return pygame.Rect(0, 0, 0, 0)
+        return rects[0].unionall(rects[1:])
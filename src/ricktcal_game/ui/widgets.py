@@ -0,0 +1,260 @@
+import pygame
+
+
+class Widget:
+    """
+    유지형(retained) UI 위젯 기본 클래스
+    위젯은 자신의 모습을 Surface 하나로 합성해 캐시하고, 상태(호버, 누름, 값 등)가
+    바뀌었을 때만 다시 합성하므로 매 프레임 비용은 blit 한 번
+    """
+
+    def __init__(self, rect, enabled=True, visible=True):
+        self.rect = pygame.Rect(rect)
+        self.enabled = enabled
+        self.visible = visible
+        self.hovered = False
+        self.pressed = False
+
+        self._surface = None
+        self._surface_state = None
+        self.compose_count = 0  # 다시 합성한 횟수 (캐시 확인용)
+
+    @property
+    def interactive(self):
+        """마우스 입력을 받는 위젯인지 여부 (위젯 트리 히트 테스트 대상)"""
+        return False
+
+    def state(self):
+        """합성 결과에 영향을 주는 상태 (값이 바뀌면 다시 합성)"""
+        return (self.enabled, self.hovered, self.pressed)
+
+    def compose(self):
+        """위젯 모습을 Surface로 합성 (하위 클래스에서 구현)"""
+        raise NotImplementedError
+
+    def surface(self):
+        """캐시된 합성 Surface 반환 (상태가 바뀌었으면 다시 합성)"""
+        state = self.state()
+        if self._surface is None or state != self._surface_state:
+            self._surface = self.compose()
+            self._surface_state = state
+            self.compose_count += 1
+        return self._surface
+
+    def invalidate(self):
+        """다음 그리기 때 다시 합성하도록 캐시 무효화"""
+        self._surface = None
+
+    def draw_rect(self):
+        """draw()가 그리는 영역 (위젯 영역 밖으로 그리는 위젯은 재정의)"""
+        return self.rect
+
+    def draw(self, screen):
+        if self.visible:
+            screen.blit(self.surface(), self.draw_rect())
+
+    def hit_test(self, pos):
+        return self.visible and self.enabled and self.rect.collidepoint(pos)
+
+    # 입력 처리 (위젯 트리가 호출, 반환값은 트리의 handle_event() 결과가 됨)
+    def on_press(self, pos):
+        return None
+
+    def on_drag(self, pos):
+        return None
+
+    def on_release(self, pos):
+        return None
+
+
+class Label(Widget):
+    """렌더링된 텍스트 Surface를 표시하는 위젯"""
+
+    def __init__(self, pos, text, anchor="topleft", **kwargs):
+        """
+        :param text: 렌더링된 텍스트 Surface (FontManager.render_text 결과)
+        :param anchor: pos가 가리키는 텍스트의 기준점 (예: "center", "midtop")
+        """
+        self.anchor = anchor
+        self.pos = pos
+        self.text = text
+        super().__init__(text.get_rect(**{anchor: pos}), **kwargs)
+
+    def state(self):
+        return self.text
+
+    def set_text(self, text):
+        """표시할 텍스트 Surface 교체 (같은 Surface면 무시)"""
+        if text is not self.text:
+            self.text = text
+            self.rect = text.get_rect(**{self.anchor: self.pos})
+
+    def compose(self):
+        return self.text
+
+
+class Panel(Widget):
+    """배경 사각형 위젯 (둥근 모서리 지원)"""
+
+    def __init__(self, rect, color, border_radius=0, **kwargs):
+        super().__init__(rect, **kwargs)
+        self.color = color
+        self.border_radius = border_radius
+
+    def state(self):
+        return (self.rect.size, self.color)
+
+    def compose(self):
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(
+            surface, self.color, surface.get_rect(), border_radius=self.border_radius
+        )
+        return surface
+
+
+class Button(Widget):
+    """텍스트 버튼 위젯 (누른 버튼 위에서 떼면 on_click 호출)"""
+
+    def __init__(
+        self,
+        rect,
+        text,
+        on_click=None,
+        color=(70, 70, 200),
+        hover_color=(100, 100, 250),
+        pressed_color=(50, 50, 160),
+        disabled_color=(100, 100, 150),
+        border_radius=5,
+        **kwargs,
+    ):
+        """
+        :param text: 렌더링된 버튼 이름 Surface
+        :param on_click: 클릭했을 때 호출할 함수 (반환값은 handle_event() 결과)
+        """
+        super().__init__(rect, **kwargs)
+        self.text = text
+        self.on_click = on_click
+        self.color = color
+        self.hover_color = hover_color
+        self.pressed_color = pressed_color
+        self.disabled_color = disabled_color
+        self.border_radius = border_radius
+
+    @property
+    def interactive(self):
+        return True
+
+    def state(self):
+        return (self.enabled, self.hovered, self.pressed, self.text)
+
+    def compose(self):
+        pressed = self.enabled and self.pressed
+        if not self.enabled:
+            color = self.disabled_color
+        elif pressed:
+            color = self.pressed_color
+        elif self.hovered:
+            color = self.hover_color
+        else:
+            color = self.color
+
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(
+            surface, color, surface.get_rect(), border_radius=self.border_radius
+        )
+        # 누른 동안은 이름을 한 픽셀 아래로 내려 눌린 모습으로 표시
+        center = surface.get_rect().move(0, 1 if pressed else 0).center
+        surface.blit(self.text, self.text.get_rect(center=center))
+        return surface
+
+    def on_release(self, pos):
+        # 누른 뒤 버튼 밖으로 나가서 떼면 클릭으로 보지 않음
+        if self.on_click and self.hit_test(pos):
+            return self.on_click()
+        return None
+
+
+class Slider(Widget):
+    """
+    0.0 ~ 1.0 값을 가지는 슬라이더 위젯 (누르거나 드래그하면 on_change 호출)
+    handle_size가 0이면 핸들 없는 막대 (게이지 표시용)
+    """
+
+    def __init__(
+        self,
+        rect,
+        value=0.0,
+        on_change=None,
+        on_press=None,
+        track_color=(100, 100, 150),
+        fill_color=(100, 150, 250),
+        handle_color=(200, 200, 250),
+        handle_size=24,
+        **kwargs,
+    ):
+        """
+        :param on_change: 값이 바뀌면 새 값으로 호출할 함수
+        :param on_press: 슬라이더를 눌렀을 때 (값 변경 후) 호출할 함수
+        """
+        super().__init__(rect, **kwargs)
+        self.value = value
+        self.on_change = on_change
+        self.press_callback = on_press
+        self.track_color = track_color
+        self.fill_color = fill_color
+        self.handle_color = handle_color
+        self.handle_size = handle_size
+
+    @property
+    def interactive(self):
+        return self.on_change is not None
+
+    def state(self):
+        return (self.enabled, self.hovered, int(self.rect.width * self.value))
+
+    def set_value(self, value):
+        """값 설정 (0.0 ~ 1.0으로 제한, 채우기 폭이 바뀔 때만 다시 합성됨)"""
+        self.value = max(0.0, min(1.0, value))
+
+    def draw_rect(self):
+        # 핸들은 막대 양 끝과 위아래로 넘어가므로 그만큼 넓은 영역에 그림
+        margin = self.handle_size // 2
+        return self.rect.inflate(
+            margin * 2, max(0, self.handle_size - self.rect.height)
+        )
+
+    def compose(self):
+        area = self.draw_rect()
+        surface = pygame.Surface(area.size, pygame.SRCALPHA)
+        track = self.rect.move(-area.x, -area.y)
+        fill_width = int(self.rect.width * self.value)
+
+        pygame.draw.rect(surface, self.track_color, track)
+        pygame.draw.rect(
+            surface, self.fill_color, (track.x, track.y, fill_width, track.height)
+        )
+        if self.handle_size:
+            pygame.draw.circle(
+                surface,
+                self.handle_color,
+                (track.x + fill_width, track.centery),
+                self.handle_size // 2,
+            )
+        return surface
+
+    def _change(self, pos):
+        value = (pos[0] - self.rect.x) / self.rect.width
+        old = self.value
+        self.set_value(value)
+        if self.on_change and self.value != old:
+            self.on_change(self.value)
+
+    def on_press(self, pos):
+        self._change(pos)
+        if self.press_callback:
+            return self.press_callback()
+        return None
+
+    def on_drag(self, pos):
+        self._change(pos)
+        return None
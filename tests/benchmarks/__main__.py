@@ -0,0 +1,71 @@
+import argparse
+import sys
+from pathlib import Path
+
+from .suite import (
+    BENCHMARKS,
+    DEFAULT_THRESHOLD,
+    compare,
+    format_comparison,
+    format_results,
+    load_results,
+    run_suite,
+    save_results,
+)
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "latest.json"
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로더/렌더러/폰트/게임 상태 벤치마크")
+    parser.add_argument(
+        "--quick", action="store_true", help="반복 횟수를 줄여 빠르게 실행"
+    )
+    parser.add_argument(
+        "--group",
+        action="append",
+        choices=sorted({group for group, _ in BENCHMARKS}),
+        help="실행할 벤치마크 그룹 (여러 번 지정 가능, 기본: 모두)",
+    )
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="결과 JSON 파일")
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help="비교할 기준 결과 JSON 파일 (없으면 비교하지 않음)",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="이번 결과를 기준 결과로 저장"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="회귀로 표시할 중앙값 증가 비율 (기본 0.25 = 25%%)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_suite(quick=args.quick, groups=args.group)
+    print(format_results(results))
+    print(f"결과 저장: {save_results(results, args.output)}")
+
+    regressions = 0
+    baseline = Path(args.baseline)
+    if baseline.is_file() and not args.save_baseline:
+        rows = compare(results, load_results(baseline), args.threshold)
+        print()
+        print(f"기준 결과와 비교: {baseline}")
+        print(format_comparison(rows))
+        regressions = sum(1 for row in rows if row[-1] == "regression")
+        if regressions:
+            print(f"성능 회귀 {regressions}개")
+
+    if args.save_baseline:
+        print(f"기준 결과 저장: {save_results(results, baseline)}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
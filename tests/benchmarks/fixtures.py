@@ -0,0 +1,101 @@
+"""
+벤치마크용 합성 리소스 생성 (저장소에 없는 GIF 파일에 의존하지 않도록)
+
+게임이 사용하는 모든 애니메이션 이름으로 투명 배경 GIF를 만들어
+RICKTCAL_RESOURCE_DIR로 지정할 리소스 디렉터리에 저장
+"""
+
+import random
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+# 합성 GIF 기본 설정 (실제 리소스와 비슷한 크기와 프레임 수)
+FIXTURE_SIZE = (400, 400)
+FIXTURE_FRAMES = 16
+FIXTURE_DUPLICATE_EVERY = (
+    4  # 이 간격마다 두 프레임 전 프레임을 반복 (중복 제거 경로 확인)
+)
+
+
+def make_gif(
+    path,
+    size=FIXTURE_SIZE,
+    frames=FIXTURE_FRAMES,
+    duplicate_every=FIXTURE_DUPLICATE_EVERY,
+    seed=0,
+):
+    """
+    움직이는 도형으로 된 투명 배경 GIF 생성
+    프레임마다 표시 시간이 다르고, duplicate_every 간격으로 두 프레임 전과 같은 프레임이 나옴
+    (연속된 같은 프레임은 Pillow가 저장할 때 하나로 합치므로 바로 앞 프레임은 반복하지 않음)
+    """
+    rng = random.Random(seed)
+    width, height = size
+    color = tuple(rng.randrange(40, 240) for _ in range(3))
+    images = []
+    durations = []
+    for index in range(frames):
+        if (
+            duplicate_every
+            and index >= 2
+            and index % duplicate_every == duplicate_every - 1
+        ):
+            images.append(images[index - 2].copy())
+        else:
+            image = Image.new("RGBA", size, (0, 0, 0, 0))
+            draw = ImageDraw.Draw(image)
+            # 몸통 (좌우로 흔들림)과 머리 (위아래로 튀어오름)
+            offset = int(width * 0.1 * ((index % 8) - 4) / 4)
+            bounce = int(height * 0.05 * abs((index % 6) - 3))
+            draw.rectangle(
+                (
+                    width * 0.3 + offset,
+                    height * 0.4,
+                    width * 0.7 + offset,
+                    height * 0.95,
+                ),
+                fill=color + (255,),
+            )
+            draw.ellipse(
+                (
+                    width * 0.35 + offset,
+                    height * 0.1 - bounce,
+                    width * 0.65 + offset,
+                    height * 0.4 - bounce,
+                ),
+                fill=(250, 220, 190, 255),
+            )
+            images.append(image)
+        durations.append(rng.choice((60, 80, 100, 120)))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    images[0].save(
+        path,
+        save_all=True,
+        append_images=images[1:],
+        duration=durations,
+        loop=0,
+        disposal=2,
+    )
+    return path
+
+
+def animation_names():
+    """게임이 로드하는 모든 애니메이션 리소스 이름 (animations/*.gif)"""
+    from ricktcal_game.classes.sprites import frame_variants
+
+    return sorted({name for name, _, _ in frame_variants()})
+
+
+def build_fixture_resources(root):
+    """
+    root 아래에 합성 리소스 디렉터리 생성
+    :return: 생성한 GIF 리소스 이름 목록
+    """
+    root = Path(root)
+    names = animation_names()
+    for seed, name in enumerate(names):
+        make_gif(root / name, seed=seed)
+    return names
@@ -0,0 +1,391 @@
+"""
+로더, 렌더러, 폰트, 게임 상태 경로 벤치마크 (화면/오디오 없이 dummy 드라이버로 실행)
+
+실행: python -m tests.benchmarks [--quick] [--output 결과.json] [--baseline 기준.json]
+합성 GIF 리소스를 임시 디렉터리에 만들어 RICKTCAL_RESOURCE_DIR로 지정하고,
+프레임 캐시와 설정 디렉터리도 임시 디렉터리를 사용하므로 사용자 캐시를 건드리지 않음
+
+기준 결과(tests/benchmarks/baseline.json)는 저장소에 커밋되어 있고, 실행하면 기본으로
+이 파일과 비교함 (측정한 기계의 정보가 함께 저장되므로 다른 기계에서는 참고용)
+성능이 의도적으로 바뀌었거나 측정 기계가 바뀌면 --save-baseline으로 다시 저장해 커밋
+"""
+
+import json
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from .fixtures import build_fixture_resources
+
+# 벤치마크별 반복 횟수 (일반 실행, --quick 실행)
+ITERATIONS = {
+    "preload": (5, 1),
+    "load_animation": (5, 1),
+    "render": (300, 30),
+    "font": (200, 20),
+    "state": (20, 3),
+    "entities": (20, 3),
+}
+STATE_STEPS = 10_000  # 게임 상태 업데이트 벤치마크 한 번에 진행할 스텝 수
+CROWD_SIZES = (8, 256)  # 엔티티 저장소 벤치마크의 (선생님 수, 학생 수)
+CROWD_STEPS = 1_000
+
+# 한글 텍스트 렌더링에 사용할 문자열 (HUD, 메뉴, 설정 화면 문구)
+KOREAN_STRINGS = [
+    "게임 시작",
+    "다시 시작",
+    "메인 메뉴",
+    "배경음 볼륨",
+    "효과음 볼륨",
+    "스페이스바 - 춤추기",
+    "Z - 스킬",
+    "선새임에게 들켰습니다!",
+    "에너지가 모두 떨어졌습니다!",
+    "점수: 12345",
+]
+
+# 기준 결과보다 이 비율 이상, 그리고 MIN_DELTA_MS 이상 느려지면 회귀로 표시
+DEFAULT_THRESHOLD = 0.25
+MIN_DELTA_MS = 0.05
+
+BENCHMARKS = []  # (그룹 이름, 함수) 목록, 등록 순서대로 실행
+
+
+def benchmark(group):
+    """
+    벤치마크 함수 등록 데코레이터
+    함수는 (context, iterations)를 받아 {결과 이름: 호출별 소요 시간(초) 목록}을 반환
+    """
+
+    def register(function):
+        BENCHMARKS.append((group, function))
+        return function
+
+    return register
+
+
+def time_calls(function, iterations, setup=None):
+    """function을 iterations번 호출하며 호출별 소요 시간(초) 목록 반환 (setup은 측정 제외)"""
+    samples = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples):
+    """소요 시간 목록의 통계 (ms)"""
+    ms = sorted(sample * 1000 for sample in samples)
+    return {
+        "samples": len(ms),
+        "median_ms": statistics.median(ms),
+        "mean_ms": statistics.mean(ms),
+        "p95_ms": ms[min(len(ms) - 1, int(len(ms) * 0.95))],
+        "min_ms": ms[0],
+    }
+
+
+class BenchContext:
+    """벤치마크 실행 환경 (합성 리소스, 임시 캐시 디렉터리, 공유 게임 인스턴스)"""
+
+    def __init__(self, root, quick=False):
+        self.root = Path(root)
+        self.quick = quick
+        self.resource_dir = self.root / "resources"
+        self.animations = build_fixture_resources(self.resource_dir)
+        self._cache_index = 0
+        self._game = None
+
+        os.environ["RICKTCAL_RESOURCE_DIR"] = str(self.resource_dir)
+        os.environ["RICKTCAL_CACHE_DIR"] = str(self.root / "cache")
+        os.environ["RICKTCAL_CONFIG_DIR"] = str(self.root / "config")
+
+    def iterations(self, group):
+        normal, quick = ITERATIONS[group]
+        return quick if self.quick else normal
+
+    def fresh_cache_dir(self):
+        """비어 있는 새 프레임 캐시 디렉터리 (캐시가 없는 첫 실행 측정용)"""
+        self._cache_index += 1
+        return self.root / f"frames_{self._cache_index}"
+
+    def game(self):
+        """리소스 로딩이 끝난 게임 인스턴스 (처음 요청할 때 생성)"""
+        if self._game is None:
+            from ricktcal_game.game import Game
+
+            self._game = Game()
+            self._game.loader.finished.wait()
+        return self._game
+
+
+def _sprite_manager(cache_dir):
+    from ricktcal_game.classes.sprites import SpriteManager
+    from ricktcal_game.core.frame_cache import FrameCache
+    from ricktcal_game.core.position_manager import PositionManager
+
+    sprites = SpriteManager(PositionManager())
+    sprites.frame_cache = FrameCache(cache_dir)
+    return sprites
+
+
+def _preload(sprites):
+    from ricktcal_game.classes.sprites import ANIMATION_FILES
+
+    sprites.begin_preload(ANIMATION_FILES)
+    try:
+        for key in ANIMATION_FILES:
+            sprites.complete_preload(key)
+    finally:
+        sprites.end_preload()
+
+
+@benchmark("preload")
+def bench_preload(context, iterations):
+    """SpriteManager 사전 로드 (캐시 없음: 병렬 디코딩, 캐시 있음: 캐시 파일 읽기)"""
+    context.game()  # 화면 형식 변환에 필요한 디스플레이 초기화
+    cold = []
+    warm = []
+    for _ in range(iterations):
+        cache_dir = context.fresh_cache_dir()
+        cold += time_calls(lambda: _preload(_sprite_manager(cache_dir)), 1)
+        warm += time_calls(lambda: _preload(_sprite_manager(cache_dir)), 1)
+    return {"sprites.preload.cold": cold, "sprites.preload.warm": warm}
+
+
+@benchmark("load_animation")
+def bench_load_animation(context, iterations):
+    """GIF별 load_animation_frames (캐시 없음: 디코딩 + 캐시 저장, 캐시 있음: 캐시 읽기)"""
+    from ricktcal_game.classes.sprites import ANIMATION_FILES
+
+    context.game()
+    results = {}
+    for key, (filename, flip) in ANIMATION_FILES.items():
+        is_teacher = key[0] == "teachers"
+        cold = []
+        warm = []
+        for _ in range(iterations):
+            sprites = _sprite_manager(context.fresh_cache_dir())
+            cold += time_calls(
+                lambda: sprites.load_animation_frames(filename, flip, is_teacher), 1
+            )
+            warm += time_calls(
+                lambda: sprites.load_animation_frames(filename, flip, is_teacher), 1
+            )
+        results[f"load_animation_frames.cold/{filename}"] = cold
+        results[f"load_animation_frames.warm/{filename}"] = warm
+    return results
+
+
+@benchmark("render")
+def bench_render(context, iterations):
+    """모든 엔티티가 있는 게임 화면 렌더링 (전체 다시 그리기, 바뀐 영역만 다시 그리기)"""
+    game = context.game()
+    game.state_manager.reset_game()
+    game.initialize_game_elements()
+    renderer = game.renderer
+
+    step = [0]
+
+    def advance():
+        # 절반은 춤추며 진행 (에르핀/죠안 애니메이션 상태 전환 포함)
+        step[0] += 1
+        game.erpin.dancing = step[0] % 120 < 60
+        game.update()
+        game.animation_clock.tick()
+
+    full = time_calls(renderer.render_game, iterations, setup=advance)
+
+    renderer.invalidate()
+    renderer.render_game_dirty()
+    dirty = time_calls(renderer.render_game_dirty, iterations, setup=advance)
+    return {"renderer.render_game": full, "renderer.render_game_dirty": dirty}
+
+
+@benchmark("font")
+def bench_font(context, iterations):
+    """한글 문자열 FontManager.render_text (텍스트 캐시 없음, 캐시 적중)"""
+    from ricktcal_game.core.font_manager import FontManager
+
+    context.game()
+    fonts = FontManager()
+
+    def render_all():
+        for text in KOREAN_STRINGS:
+            fonts.render_text(text, "korean", "normal", (255, 255, 255))
+
+    uncached = time_calls(render_all, iterations, setup=fonts.clear_text_cache)
+    render_all()
+    cached = time_calls(render_all, iterations)
+    return {"font.render_text.uncached": uncached, "font.render_text.cached": cached}
+
+
+@benchmark("state")
+def bench_state(context, iterations):
+    """
+    게임 상태 업데이트 처리량 (STATE_STEPS 스텝당 시간)
+    GameStateManager 게이지/점수 갱신만, 그리고 엔티티를 포함한 Game.update 한 스텝
+    """
+    from ricktcal_game.core.config import SIM_RATE
+    from ricktcal_game.core.game_state_manager import GameStateManager
+
+    def run_state_manager():
+        state = GameStateManager()
+        for step in range(STATE_STEPS):
+            # 게임 오버가 나지 않도록 춤추기와 쉬기를 번갈아 반복
+            dancing = step % 120 < 40
+            state.update_gauge(dancing, step / SIM_RATE)
+            state.update_score()
+
+    game = context.game()
+
+    def run_game():
+        game.state_manager.reset_game()
+        game.initialize_game_elements()
+        # 선생님이 계속 뒤돌아 있도록 해서 들켜서 끝나는 일 없이 STATE_STEPS 스텝 모두 진행
+        game.sherum.turn_delay = float("inf")
+        for step in range(STATE_STEPS):
+            game.erpin.dancing = step % 120 < 40
+            game.update()
+
+    return {
+        "game_state.update": time_calls(run_state_manager, iterations),
+        "game.update": time_calls(run_game, iterations),
+    }
+
+
+@benchmark("entities")
+def bench_entities(context, iterations):
+    """
+    교실 모드 엔티티 저장소 배치 업데이트 (CROWD_STEPS 스텝당 시간)
+    선생님 방향 전환/바운스와 따라 추는 학생 상태 전환을 배열 연산으로 한 번에 진행
+    """
+    import random
+
+    from ricktcal_game.classes.entity_store import EntityStore
+    from ricktcal_game.classes.teacher_entity import TeacherEntity
+    from ricktcal_game.core.config import SIM_RATE
+    from ricktcal_game.entities.joanne import Joanne
+
+    teachers, students = CROWD_SIZES
+
+    def run_crowd():
+        rng = random.Random(0)
+        store = EntityStore()
+        for _ in range(teachers):
+            TeacherEntity(current_time=0, rng=rng, store=store)
+        for _ in range(students):
+            Joanne(rng=rng, store=store)
+        for step in range(CROWD_STEPS):
+            store.update_teachers(step * 1000 / SIM_RATE, rng)
+            # 인게임 시간을 빠르게 돌려 모든 상태 전환 경로를 지나가도록 함
+            store.update_followers(step // 8, step % 120 < 40, rng)
+
+    return {
+        f"entity_store.update/{teachers}x{students}": time_calls(run_crowd, iterations)
+    }
+
+
+def run_suite(quick=False, groups=None):
+    """
+    벤치마크 실행
+    :param groups: 실행할 그룹 이름 목록 (None이면 모두)
+    :return: 결과 딕셔너리 (meta, benchmarks)
+    """
+    root = Path(tempfile.mkdtemp(prefix="ricktcal_bench_"))
+    try:
+        context = BenchContext(root, quick=quick)
+        results = {}
+        for group, function in BENCHMARKS:
+            if groups and group not in groups:
+                continue
+            start = time.perf_counter()
+            samples = function(context, context.iterations(group))
+            for name, values in samples.items():
+                results[name] = summarize(values)
+            print(f"{group}: {time.perf_counter() - start:.1f}초")
+    finally:
+        pygame.quit()
+        shutil.rmtree(root, ignore_errors=True)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "quick": quick,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        },
+        "benchmarks": results,
+    }
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, min_delta_ms=MIN_DELTA_MS):
+    """
+    결과를 기준 결과와 비교 (중앙값 기준)
+    :return: (이름, 기준 ms, 현재 ms, 비율, 상태) 목록
+             상태: "regression", "improvement", "ok", "new" (기준에 없음)
+    """
+    rows = []
+    base = baseline.get("benchmarks", {})
+    for name, current in results["benchmarks"].items():
+        now = current["median_ms"]
+        if name not in base:
+            rows.append((name, None, now, None, "new"))
+            continue
+        before = base[name]["median_ms"]
+        ratio = now / before if before else float("inf")
+        if now - before > min_delta_ms and ratio > 1 + threshold:
+            status = "regression"
+        elif before - now > min_delta_ms and ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((name, before, now, ratio, status))
+    return rows
+
+
+def format_results(results):
+    lines = [f"{'벤치마크':<48}{'중앙값(ms)':>12}{'p95(ms)':>10}{'횟수':>6}"]
+    for name, stats in results["benchmarks"].items():
+        lines.append(
+            f"{name:<48}{stats['median_ms']:>12.3f}{stats['p95_ms']:>10.3f}"
+            f"{stats['samples']:>6}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(rows):
+    lines = [f"{'벤치마크':<48}{'기준(ms)':>10}{'현재(ms)':>10}{'비율':>7}  상태"]
+    for name, before, now, ratio, status in rows:
+        before_text = f"{before:.3f}" if before is not None else "-"
+        ratio_text = f"{ratio:.2f}" if ratio is not None else "-"
+        lines.append(
+            f"{name:<48}{before_text:>10}{now:>10.3f}{ratio_text:>7}  {status}"
+        )
+    return "\n".join(lines)
+
+
+def save_results(results, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from .suite import compare, summarize
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _results(**medians):
+    return {
+        "benchmarks": {
+            name: summarize([median / 1000]) for name, median in medians.items()
+        }
+    }
+
+
+def test_compare_flags_regressions():
+    baseline = _results(render=1.0, load=10.0, font=0.01, removed=1.0)
+    current = _results(render=2.0, load=5.0, font=0.03, added=1.0)
+    statuses = {row[0]: row[-1] for row in compare(current, baseline)}
+    assert statuses == {
+        "render": "regression",
+        "load": "improvement",
+        # 비율은 크지만 절대 차이가 MIN_DELTA_MS보다 작으면 측정 오차로 봄
+        "font": "ok",
+        "added": "new",
+    }
+
+
+def test_quick_suite_smoke(tmp_path):
+    """--quick 실행이 모든 벤치마크 결과를 담은 JSON을 남기는지 확인"""
+    output = tmp_path / "results.json"
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT / "src"))
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "tests.benchmarks",
+            "--quick",
+            "--output",
+            str(output),
+            "--baseline",
+            str(tmp_path / "missing.json"),
+        ],
+        cwd=REPO_ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        timeout=300,
+    )
+    results = json.loads(output.read_text(encoding="utf-8"))
+    names = results["benchmarks"].keys()
+    for expected in (
+        "sprites.preload.cold",
+        "sprites.preload.warm",
+        "renderer.render_game",
+        "renderer.render_game_dirty",
+        "font.render_text.uncached",
+        "game.update",
+    ):
+        assert expected in names
+    assert any(name.startswith("load_animation_frames.cold/") for name in names)
+    assert all(stats["median_ms"] >= 0 for stats in results["benchmarks"].values())